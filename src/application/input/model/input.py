@@ -87,6 +87,32 @@ class Input:
             raise InputParsingError(e.desc, InputField.FRICTION)
         return cls(s_tilt, s_mass, s_vel, s_friction)
 
+    @classmethod
+    def values(cls, tilt: float, mass: float, velocity: float, friction: float):
+        """Creates Input instance from numerical values.
+
+        :param tilt: float: Tilt.
+        :param mass: float: Mass.
+        :param velocity: float: Start velocity's value.
+        :param friction: float: Friction.
+
+        """
+        s_tilt = Scalar(tilt, CONFIG.unit.tilt)
+        s_mass = Scalar(mass, CONFIG.unit.mass)
+        s_vel = Scalar(velocity, CONFIG.unit.velocity)
+        s_friction = Scalar(friction)
+        for scalar, field, floor_bound, ceil_bound in (
+                (s_tilt, InputField.TILT, CONFIG.input.min_tilt, CONFIG.input.max_tilt),
+                (s_mass, InputField.MASS, CONFIG.input.min_mass, CONFIG.input.max_mass),
+                (s_vel, InputField.VELOCITY, CONFIG.input.min_velocity, CONFIG.input.max_velocity),
+                (s_friction, InputField.FRICTION, CONFIG.input.min_friction, CONFIG.input.max_friction)):
+            try:
+                check_bounds(scalar, floor_bound, ceil_bound)
+            except InputParsingError as e:
+                logging.error(f"Error while checking input values: e={e} {field.value}={scalar}")
+                raise InputParsingError(e.desc, field)
+        return cls(s_tilt, s_mass, Vector(s_vel * cos(s_tilt.value), s_vel * sin(s_tilt.value)), s_friction)
+
     @classmethod
     def simulation(cls, user_input):
         """Converts parsed Input object for the simulation.
@@ -143,11 +169,11 @@ def check_bounds(scalar: Scalar, floor_bound: float | None, ceil_bound: float |
     if floor_bound is not None:
         if scalar <= floor_bound:
             logging.error(f"Input value too small: min={floor_bound} given={scalar}")
-            raise InputParsingError.no_field(MSG_TOO_SMALL.format(floor_bound, scalar.value))
+            raise InputParsingError.no_field(MSG_TOO_SMALL.format(floor_bound, scalar.rounded))
     if ceil_bound is not None:
         if scalar >= ceil_bound:
             logging.error(f"Input value too big: max={ceil_bound} given={scalar}")
-            raise InputParsingError.no_field(MSG_TOO_BIG.format(ceil_bound, scalar.value))
+            raise InputParsingError.no_field(MSG_TOO_BIG.format(ceil_bound, scalar.rounded))
 
 
 def parse_scalar(value: str, unit: str | None, bigger_than: float | None, smaller_than: float | None) -> Scalar:
@@ -23,6 +23,9 @@ from infrastructure.config.config import CONFIG
 class Scalar:
     """A class representing a scalar value.
 
+    The value is stored with the full float precision. It is rounded to the amount of decimal places set
+    in config only while comparing and printing (see rounded).
+
     Attributes
     ----------
     value
@@ -30,14 +33,15 @@ class Scalar:
     unit
         (str | None) Unit.
     """
+    __slots__ = ("value", "unit")
 
     def __init__(self, value: float, unit: str | None = None):
         """
         Constructor.
-        :param value: float: Numerical value of the scalar. Its being rounded to amount of decimal places set in config.
+        :param value: float: Numerical value of the scalar.
         :param unit: str | None: Unit (default None).
         """
-        self.value: float = round(value, CONFIG.math_precision)
+        self.value: float = value
         self.unit: str | None = unit
 
     @classmethod
@@ -48,15 +52,20 @@ class Scalar:
         """
         return Scalar(nan)
 
+    @property
+    def rounded(self) -> float:
+        """Returns the value rounded to the amount of decimal places set in config."""
+        return round(self.value, CONFIG.math_precision)
+
     def __add__(self, other):
         """Defines addition.
 
         :param other: Operand (Scalar instance or numerical).
         """
-        if is_number(other):
-            return Scalar(self.value + other, self.unit)
-        elif is_scalar(other):
+        if type(other) is Scalar:
             return Scalar(self.value + other.value, self.unit)
+        elif is_number(other):
+            return Scalar(self.value + other, self.unit)
         return NotImplemented
 
     def __sub__(self, other):
@@ -64,10 +73,10 @@ class Scalar:
 
         :param other: Operand (Scalar instance or numerical).
         """
-        if is_number(other):
-            return Scalar(self.value - other, self.unit)
-        elif is_scalar(other):
+        if type(other) is Scalar:
             return Scalar(self.value - other.value, self.unit)
+        elif is_number(other):
+            return Scalar(self.value - other, self.unit)
         return NotImplemented
 
     def __mul__(self, other):
@@ -75,10 +84,10 @@ class Scalar:
 
         :param other: Operand (Scalar instance or numerical).
         """
-        if is_number(other):
-            return Scalar(self.value * other, self.unit)
-        elif is_scalar(other):
+        if type(other) is Scalar:
             return Scalar(self.value * other.value, self.unit)
+        elif is_number(other):
+            return Scalar(self.value * other, self.unit)
         return NotImplemented
 
     def __abs__(self):
@@ -90,36 +99,41 @@ class Scalar:
 
         :param other: Operand (Scalar instance or numerical).
         """
-        if is_number(other):
-            return Scalar(self.value / other, self.unit)
-        elif is_scalar(other):
+        if type(other) is Scalar:
             return Scalar(self.value / other.value, self.unit)
+        elif is_number(other):
+            return Scalar(self.value / other, self.unit)
         return NotImplemented
 
     def __eq__(self, other):
-        """Defines equality.
+        """Defines equality. Rounded values are compared.
 
         :param other: Operand (Scalar instance or numerical).
         """
-        if is_number(other):
-            return self.value == round(other, CONFIG.math_precision)
-        elif is_scalar(other):
-            return self.value == other.value and self.unit == other.unit
+        if type(other) is Scalar:
+            precision = CONFIG.math_precision
+            return round(self.value, precision) == round(other.value, precision) and self.unit == other.unit
+        elif is_number(other):
+            precision = CONFIG.math_precision
+            return round(self.value, precision) == round(other, precision)
         return NotImplemented
 
     def __lt__(self, other):
-        """Defines lower than.
+        """Defines lower than. Rounded values are compared.
 
         :param other: Operand (Scalar instance or numerical).
         """
-        if is_number(other):
-            return self.value < round(other, CONFIG.math_precision)
-        elif is_scalar(other):
-            return self.value < other.value
+        if type(other) is Scalar:
+            precision = CONFIG.math_precision
+            return round(self.value, precision) < round(other.value, precision)
+        elif is_number(other):
+            precision = CONFIG.math_precision
+            return round(self.value, precision) < round(other, precision)
         return NotImplemented
 
     def __str__(self):
-        return f"{self.value}{self.unit}" if self.unit is not None else f"{self.value}"
+        value = round(self.value, CONFIG.math_precision)
+        return f"{value}{self.unit}" if self.unit is not None else f"{value}"
 
 
 def is_number(o) -> bool:
@@ -128,9 +142,8 @@ def is_number(o) -> bool:
     :param o: A checked variable.
     :returns: True if o is numerical, False otherwise.
     """
-    if type(o) == int or type(o) == float:
-        return True
-    return False
+    t = type(o)
+    return t is float or t is int
 
 
 def is_scalar(o):
@@ -139,6 +152,4 @@ def is_scalar(o):
     :param o: A checked variable.
     :returns: True if o is a Scalar instance, False otherwise.
     """
-    if hasattr(o, "value") and hasattr(o, "unit"):
-        return True
-    return False
+    return type(o) is Scalar
@@ -22,6 +22,9 @@ from application.math.scalar import Scalar
 class Vector:
     """A class representing a mathematical vector value.
 
+    Coordinates are stored as floats with a common unit. The value (module) is computed on the first access
+    and cached.
+
     Attributes
     ----------
     x
@@ -30,7 +33,10 @@ class Vector:
         (Scalar) Second coordinate of a vector.
     value
         (Scalar) Value (module) of a vector.
+    unit
+        (str | None) Unit.
     """
+    __slots__ = ("_x", "_y", "unit", "_value")
 
     def __init__(self, x: Scalar, y: Scalar):
         """Constructor.
@@ -38,9 +44,10 @@ class Vector:
         :param x: Scalar: First coordinate of a vector.
         :param y: Scalar: Second coordinate of a vector.
         """
-        self.x = x
-        self.y = y
-        self.value = Scalar(sqrt(x.value ** 2 + y.value ** 2), x.unit)
+        self._x: float = x.value
+        self._y: float = y.value
+        self.unit: str | None = x.unit
+        self._value: Scalar | None = None
 
     @classmethod
     def from_float(cls, x: float, y: float, unit: str | None):
@@ -50,17 +57,60 @@ class Vector:
         :param y: float: Vector y coordinate.
         :param unit: str | None: Vector unit.
         """
-        return cls(Scalar(x, unit), Scalar(y, unit))
+        vector = cls.__new__(cls)
+        vector._x = x
+        vector._y = y
+        vector.unit = unit
+        vector._value = None
+        return vector
+
+    @classmethod
+    def from_arrays(cls, xs, ys, unit: str | None) -> list:
+        """Creates Vector instances from coordinate arrays.
+
+        :param xs: Iterable of x coordinates (e.g. list or np.ndarray).
+        :param ys: Iterable of y coordinates.
+        :param unit: str | None: Vectors' unit.
+        :returns: List of Vectors.
+        """
+        if hasattr(xs, "tolist"):
+            xs = xs.tolist()
+        if hasattr(ys, "tolist"):
+            ys = ys.tolist()
+        from_float = cls.from_float
+        return [from_float(x, y, unit) for x, y in zip(xs, ys)]
+
+    @property
+    def x(self) -> Scalar:
+        """Returns the first coordinate."""
+        return Scalar(self._x, self.unit)
+
+    @property
+    def y(self) -> Scalar:
+        """Returns the second coordinate."""
+        return Scalar(self._y, self.unit)
+
+    @property
+    def xy(self) -> tuple[float, float]:
+        """Returns coordinates as floats."""
+        return self._x, self._y
+
+    @property
+    def value(self) -> Scalar:
+        """Returns the value (module), computed on the first access."""
+        if self._value is None:
+            self._value = Scalar(sqrt(self._x * self._x + self._y * self._y), self.unit)
+        return self._value
 
     def translated(self):
         """Returns translated vector using translate math_util method."""
-        x, y = translate(self.x, self.y)
-        return Vector(x, y)
+        x, y = translate(self._x, self._y)
+        return Vector.from_float(x, y, self.unit)
 
     def translated_abs(self):
         """Returns translated vector using translate_abs math_util method."""
-        x, y = translate_abs(self.x, self.y)
-        return Vector(x, y)
+        x, y = translate_abs(self._x, self._y)
+        return Vector.from_float(x, y, self.unit)
 
     def __str__(self) -> str:
         return f"Vector({self.x}, {self.y} -> {self.value})"
@@ -79,10 +129,12 @@ class Vector:
 
         :param other: Operand (Scalar instance or numerical)
         """
-        if type(other) == Scalar or type(other) == int or type(other) == float:
-            return Vector(self.x * other, self.y * other)
+        if type(other) is Scalar:
+            return Vector.from_float(self._x * other.value, self._y * other.value, self.unit)
+        elif type(other) is int or type(other) is float:
+            return Vector.from_float(self._x * other, self._y * other, self.unit)
         return NotImplemented
 
     def __abs__(self):
         """Defines absolute value."""
-        return Vector(abs(self.x), abs(self.y))
+        return Vector.from_float(abs(self._x), abs(self._y), self.unit)
@@ -17,30 +17,17 @@ import csv
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import Iterable, Iterator
 
-from application.math.scalar import Scalar
-from application.math.vector import Vector
 from application.output.output_port import OutputPort
-from application.result.error import Error, ScalarError, VectorError
-from application.result.result import Result
-
-CYCLE_NUMBER = "cycle_number"
-IS_FULL = "is_full"
-DURATION1 = "duration1"
-DURATION2 = "duration2"
-DURATION = "duration"
-START_VELOCITY = "start_velocity"
-END_VELOCITY = "end_velocity"
-REACH = "reach"
-
-SUFFIX_MEASURED = "_measured"
-SUFFIX_MODEL = "_model"
-SUFFIX_ERROR = "_error"
-SUFFIX_REL_ERROR = "_rerror"
-SUFFIX_VALUE = "_value"
-SUFFIX_X = "_x"
-SUFFIX_Y = "_y"
+from application.output.row_schema import compile_schema, get_scenario_header, get_scenario_row
+from application.result.error import ErrorTable
+from application.result.result_table import ResultTable
+from application.sweep.model.scenario import ScenarioResult
+
+BUFFER_SIZE = 1 << 20
+
+SCHEMA = compile_schema()
 
 
 class CsvOutputAdapter(OutputPort):
@@ -58,121 +45,73 @@ class CsvOutputAdapter(OutputPort):
         """
         self.path: Path = output_path
 
-    def send_output(self, measured: list[Result], model: list[Result], error: list[Error]) -> None:
+    def send_output(self, measured: ResultTable, model: ResultTable, error: ErrorTable) -> None:
         """Parses output to a CSV table and saves it to a target file.
 
-        :param measured: list[Result]: Results from a simulation.
-        :param model: list[Result]: Results from a model.
-        :param error: list[Error]: Errors.
+        :param measured: ResultTable: Results from a simulation.
+        :param model: ResultTable: Results from a model.
+        :param error: ErrorTable: Errors.
         """
         logging.info(f"Saving results to CSV file: measured={measured} model={model} error={error}")
-        os.makedirs(os.path.dirname(self.path.absolute()), exist_ok=True)
-        with open(self.path.absolute(), "w", newline="") as output:
-            writer = csv.DictWriter(output, fieldnames=get_dict(measured[0], model[0], error[0]).keys())
-            writer.writeheader()
-            logging.debug(f"Wrote CSV headers: {writer.fieldnames}")
-            for i in range(0, len(model)):
-                row = get_dict(measured[i], model[i], error[i])
-                writer.writerow(row)
-                logging.debug(f"Wrote row: n={i} row={row}")
-        logging.info(f"Output saved: rows={len(model)} path={self.path.absolute()}")
-
-
-def dictionaries_update(output: tuple, inp: tuple) -> None:
-    """Updates each dictionary from output with corresponding dictionary from inp.
-
-    :param output: tuple: Is updated.
-    :param inp: tuple: Update data.
-
-    """
-    for i in range(0, len(output)):
-        output[i].update(inp[i])
-
-
-def get_any_dict(key: str, data) -> dict:
-    """Creates CSV dict {key: data}.
+        self.send_output_stream([(measured, model, error)])
 
-    :param key: str: CSV header.
-    :param data: CSV row.
-    :returns: {key: data} dict.
+    def send_output_stream(self, results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]) -> None:
+        """Parses output to a CSV table and saves it to a target file part by part.
 
-    """
-    return {key: data}
-
-
-def get_scalar_dicts(key: str, measured: Scalar, model: Scalar, error: ScalarError) -> tuple[
-    dict[str, float], dict[str, float], dict[str, Any]]:
-    """Creates a CSV dict for Scalar values group.
-
-    :param key: str: CSV header for group.
-    :param measured: Scalar: Measured value.
-    :param model: Scalar: Model value.
-    :param error: ScalarError: Errors.
-    :returns: Dictionaries {key_measured: measured} {key_model: model} {key_error: error.abs, key_rerror: error.rel}
+        The file is flushed after every part, so it holds all finished parts if the run is interrupted.
 
+        :param results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]: Parts of results.
+        """
+        os.makedirs(os.path.dirname(self.path.absolute()), exist_ok=True)
+        rows = 0
+        with open(self.path.absolute(), "w", newline="", buffering=BUFFER_SIZE) as output:
+            writer = csv.writer(output)
+            writer.writerow(SCHEMA.header)
+            logging.debug(f"Wrote CSV headers: {SCHEMA.header}")
+            for measured, model, error in results:
+                writer.writerows(SCHEMA.rows(measured, model, error))
+                output.flush()
+                rows += len(error)
+        logging.info(f"Output saved: rows={rows} path={self.path.absolute()}")
+
+    def send_sweep_output(self, results: Iterable[ScenarioResult]) -> None:
+        """Parses a sweep's output to one CSV table and saves it to a target file.
+
+        Each row is prefixed with the scenario's id and input.
+
+        :param results: Iterable[ScenarioResult]: Results of the sweep's scenarios.
+        """
+        logging.info(f"Saving sweep results to CSV file: path={self.path.absolute()}")
+        os.makedirs(os.path.dirname(self.path.absolute()), exist_ok=True)
+        rows = 0
+        scenarios = 0
+        with open(self.path.absolute(), "w", newline="", buffering=BUFFER_SIZE) as output:
+            writer = csv.writer(output)
+            header = get_scenario_header() + SCHEMA.header
+            writer.writerow(header)
+            logging.debug(f"Wrote CSV headers: {header}")
+            for result in results:
+                writer.writerows(SCHEMA.rows(result.measured, result.model, result.error, get_scenario_row(result)))
+                rows += len(result.error)
+                scenarios += 1
+                logging.debug(f"Wrote scenario rows: id={result.scenario.id} n={len(result.error)}")
+        logging.info(f"Sweep output saved: scenarios={scenarios} rows={rows} path={self.path.absolute()}")
+
+
+def get_header() -> list[str]:
+    """Creates CSV headers of results.
+
+    :returns: [cycle_number, [measured values], [model values], [error values], is_full] headers.
     """
-    return (
-        {key + SUFFIX_MEASURED: measured.value},
-        {key + SUFFIX_MODEL: model.value},
-        {key + SUFFIX_ERROR: error.abs.value, key + SUFFIX_REL_ERROR: error.rel.value}
-    )
+    return list(SCHEMA.header)
 
 
-def get_vector_dicts(key: str, measured: Vector, model: Vector, error: VectorError) -> tuple[
-    dict[str, str], dict[str, str], dict[str, str]]:
-    """Creates a CSV dict for Vector values group.
+def get_rows(measured: ResultTable, model: ResultTable, error: ErrorTable) -> Iterator[tuple]:
+    """Creates CSV rows of results, one for each cycle of the error table. Values are rounded here.
 
-    :param key: str: CSV header for group.
-    :param measured: Vector: Measured value.
-    :param model: Vector: Model value.
-    :param error: VectorError: Errors.
-    :returns: Dictionaries {[measured values]} {[model values]} {[error values]}
-
-    """
-    measure_dict = {}
-    model_dict = {}
-    error_dict = {}
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_scalar_dicts(key + SUFFIX_X, measured.x, model.x, error.x))
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_scalar_dicts(key + SUFFIX_Y, measured.y, model.y, error.y))
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_scalar_dicts(key + SUFFIX_VALUE, measured.value, model.value, error.value))
-    return measure_dict, model_dict, error_dict
-
-
-def get_dict(measured: Result, model: Result, error: Error) -> dict:
-    """Creates a full CSV row dict.
-
-    :param measured: Result: Measured.
-    :param model: Result: Model.
-    :param error: Error: Errors.
-    :returns: Dictionary representing one CSV row.
+    :param measured: ResultTable: Measured.
+    :param model: ResultTable: Model.
+    :param error: ErrorTable: Errors.
+    :returns: Iterator of rows ordered as get_header.
     """
-    result = {}
-    measure_dict = {}
-    model_dict = {}
-    error_dict = {}
-
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_scalar_dicts(DURATION1, measured.duration1, model.duration1, error.duration1))
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_scalar_dicts(DURATION2, measured.duration2, model.duration2, error.duration2))
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_scalar_dicts(DURATION, measured.duration, model.duration, error.duration))
-
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_vector_dicts(START_VELOCITY, measured.start_velocity, model.start_velocity,
-                                         error.start_velocity))
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_vector_dicts(END_VELOCITY, measured.end_velocity, model.end_velocity, error.end_velocity))
-    dictionaries_update((measure_dict, model_dict, error_dict),
-                        get_vector_dicts(REACH, measured.reach, model.reach, error.reach))
-
-    result.update(get_any_dict(CYCLE_NUMBER, model.number))
-    result.update(measure_dict)
-    result.update(model_dict)
-    result.update(error_dict)
-    result.update(get_any_dict(IS_FULL, model.is_full))
-    logging.debug(f"Created output row: dict={result} measured={measured} model={model} error={error}")
-    return result
+    return SCHEMA.rows(measured, model, error)
@@ -0,0 +1,156 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+from queue import Queue
+from threading import Thread
+from typing import Callable, Iterable, Iterator
+
+from application.output.output_port import OutputPort
+from application.result.error import ErrorTable
+from application.result.result_table import ResultTable
+from application.sweep.model.scenario import ScenarioResult
+
+END = object()
+
+
+class FanOutOutputAdapter(OutputPort):
+    """OutputPort adapter sending an output to many output ports concurrently.
+
+    Every port has a writer thread draining a bounded queue of results (parts of a stream or scenarios of a sweep),
+    so writing overlaps with computing next results. A full queue blocks the producer, so a slow port holds
+    at most queue_size results in memory.
+
+    Attributes
+    ----------
+    ports
+        (list[OutputPort]) Target output ports.
+    queue_size
+        (int) Capacity of every port's queue (0 = unbounded).
+    """
+
+    def __init__(self, ports: list[OutputPort], queue_size: int):
+        """Constructor.
+
+        :param ports: list[OutputPort]: Target output ports.
+        :param queue_size: int: Capacity of every port's queue (0 = unbounded).
+        """
+        self.ports: list[OutputPort] = ports
+        self.queue_size: int = queue_size
+
+    def send_output(self, measured: ResultTable, model: ResultTable, error: ErrorTable) -> None:
+        """Sends output to all ports.
+
+        :param measured: ResultTable: Results from a simulation.
+        :param model: ResultTable: Results from a model.
+        :param error: ErrorTable: Errors.
+        """
+        self.send_output_stream([(measured, model, error)])
+
+    def send_output_stream(self, results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]) -> None:
+        """Sends output to all ports part by part.
+
+        :param results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]: Parts of results.
+        """
+        self.fan_out(lambda port, queued: port.send_output_stream(queued), results)
+
+    def send_sweep_output(self, results: Iterable[ScenarioResult]) -> None:
+        """Sends a sweep's output to all ports.
+
+        :param results: Iterable[ScenarioResult]: Results of the sweep's scenarios.
+        """
+        self.fan_out(lambda port, queued: port.send_sweep_output(queued), results)
+
+    def fan_out(self, send: Callable[[OutputPort, Iterable], None], results: Iterable) -> None:
+        """Puts results to queues of all ports' writer threads and waits until the threads end.
+
+        The queues are closed even if the results are interrupted, so ports save all results sent so far.
+        An exception of a port is raised after all threads end.
+
+        :param send: Callable[[OutputPort, Iterable], None]: A call of an OutputPort method with the queued results.
+        :param results: Iterable: Results.
+        """
+        writers = [Writer(port, send, self.queue_size) for port in self.ports]
+        logging.info(f"Starting output writers: n={len(writers)} queue_size={self.queue_size}")
+        for writer in writers:
+            writer.start()
+        sent = 0
+        try:
+            for result in results:
+                for writer in writers:
+                    writer.queue.put(result)
+                sent += 1
+        finally:
+            for writer in writers:
+                writer.queue.put(END)
+            for writer in writers:
+                writer.join()
+        logging.info(f"Output writers ended: sent={sent}")
+        for writer in writers:
+            if writer.error is not None:
+                raise writer.error
+
+
+class Writer(Thread):
+    """A writer thread sending results of a bounded queue to one output port.
+
+    If the port fails or stops reading early, the rest of the queue is discarded, so the producer is never blocked.
+
+    Attributes
+    ----------
+    port
+        (OutputPort) The target output port.
+    send
+        (Callable[[OutputPort, Iterable], None]) A call of an OutputPort method with the queued results.
+    queue
+        (Queue) Queued results, ended with END.
+    error
+        (BaseException | None) The port's exception.
+    ended
+        (bool) Was END taken from the queue?
+    """
+
+    def __init__(self, port: OutputPort, send: Callable[[OutputPort, Iterable], None], queue_size: int):
+        """Constructor.
+
+        :param port: OutputPort: The target output port.
+        :param send: Callable[[OutputPort, Iterable], None]: A call of an OutputPort method with the queued results.
+        :param queue_size: int: Capacity of the queue (0 = unbounded).
+        """
+        super().__init__(name=f"output-{type(port).__name__}", daemon=True)
+        self.port: OutputPort = port
+        self.send: Callable[[OutputPort, Iterable], None] = send
+        self.queue: Queue = Queue(queue_size)
+        self.error: BaseException | None = None
+        self.ended: bool = False
+
+    def run(self) -> None:
+        try:
+            self.send(self.port, self.results())
+        except BaseException as error:
+            logging.error(f"Output port failed: port={type(self.port).__name__} error={error!r}")
+            self.error = error
+        finally:
+            while not self.ended:
+                self.ended = self.queue.get() is END
+
+    def results(self) -> Iterator:
+        """Yields queued results until END.
+
+        :returns: Iterator of results.
+        """
+        while (result := self.queue.get()) is not END:
+            yield result
+        self.ended = True
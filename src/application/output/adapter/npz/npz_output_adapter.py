@@ -0,0 +1,220 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+import os
+import shutil
+import struct
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+from numpy.lib import format as npy
+
+from application.output.output_port import OutputPort
+from application.output.row_schema import compile_schema, get_scenario_header, get_scenario_row
+from application.result.error import ErrorTable
+from application.result.result_table import ResultTable
+from application.sweep.model.scenario import ScenarioResult
+
+BUFFER_SIZE = 1 << 20
+LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+SUFFIX_NPY = ".npy"
+
+SCHEMA = compile_schema(rounding=False)
+
+
+class NpzOutputAdapter(OutputPort):
+    """OutputPort adapter for saving an output to a NumPy .npz archive, one typed array per column.
+
+    Values keep the full float precision. Columns are spooled to temporary files part by part, so the output
+    does not have to fit in memory; the archive is written once the results end.
+
+    Attributes
+    ----------
+    path
+        (Path) Path to the target file.
+    compress
+        (bool) Compress the archive? Only an uncompressed archive can be memory-mapped by load_npz.
+    """
+
+    def __init__(self, output_path: Path, compress: bool):
+        """Constructor.
+
+        :param output_path: Path: Path to the target file.
+        :param compress: bool: Compress the archive?
+        """
+        self.path: Path = output_path
+        self.compress: bool = compress
+
+    def send_output(self, measured: ResultTable, model: ResultTable, error: ErrorTable) -> None:
+        """Saves output columns to a target file.
+
+        :param measured: ResultTable: Results from a simulation.
+        :param model: ResultTable: Results from a model.
+        :param error: ErrorTable: Errors.
+        """
+        logging.info(f"Saving results to NPZ file: measured={measured} model={model} error={error}")
+        self.send_output_stream([(measured, model, error)])
+
+    def send_output_stream(self, results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]) -> None:
+        """Saves output columns to a target file part by part.
+
+        The archive is written even if the run is interrupted, with all finished parts (see ColumnSpool.salvage).
+
+        :param results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]: Parts of results.
+        """
+        with ColumnSpool(SCHEMA.header) as spool:
+            try:
+                for measured, model, error in results:
+                    spool.append(SCHEMA.columns(measured, model, error))
+            except BaseException:
+                spool.salvage(self.path, self.compress)
+                raise
+            spool.save(self.path, self.compress)
+
+    def send_sweep_output(self, results: Iterable[ScenarioResult]) -> None:
+        """Saves a sweep's output columns to one target file.
+
+        Each row is prefixed with the scenario's id and input.
+
+        :param results: Iterable[ScenarioResult]: Results of the sweep's scenarios.
+        """
+        logging.info(f"Saving sweep results to NPZ file: path={self.path.absolute()}")
+        scenarios = 0
+        with ColumnSpool(get_scenario_header() + SCHEMA.header) as spool:
+            try:
+                for result in results:
+                    n = len(result.error)
+                    prefix = [np.full(n, value) for value in get_scenario_row(result, rounding=False)]
+                    spool.append(prefix + SCHEMA.columns(result.measured, result.model, result.error))
+                    scenarios += 1
+                    logging.debug(f"Spooled scenario columns: id={result.scenario.id} n={n}")
+            except BaseException:
+                spool.salvage(self.path, self.compress)
+                raise
+            spool.save(self.path, self.compress)
+        logging.info(f"Sweep output saved: scenarios={scenarios}")
+
+
+class ColumnSpool:
+    """A context manager appending columns to temporary files (raw values, one file per column).
+
+    Attributes
+    ----------
+    names
+        (list[str]) Names of columns.
+    files
+        (list) Temporary files of columns.
+    dtypes
+        (list[np.dtype | None]) Types of columns (None until the first part).
+    rows
+        (int) An amount of appended rows.
+    """
+
+    def __init__(self, names: list[str]):
+        """Constructor.
+
+        :param names: list[str]: Names of columns.
+        """
+        self.names: list[str] = names
+        self.files: list = []
+        self.dtypes: list[np.dtype | None] = [None] * len(names)
+        self.rows: int = 0
+
+    def __enter__(self):
+        self.files = [tempfile.TemporaryFile() for _ in self.names]
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for file in self.files:
+            file.close()
+
+    def append(self, columns: list[np.ndarray]) -> None:
+        """Appends one part of columns. The first part sets the columns' types.
+
+        :param columns: list[np.ndarray]: Columns ordered as names, all of the same length.
+        """
+        for i, column in enumerate(columns):
+            if self.dtypes[i] is None:
+                self.dtypes[i] = column.dtype
+            self.files[i].write(np.ascontiguousarray(column, dtype=self.dtypes[i]).tobytes())
+        self.rows += len(columns[0])
+
+    def save(self, path: Path, compress: bool) -> None:
+        """Writes spooled columns as .npy members of a .npz archive.
+
+        :param path: Path: Path to the target file.
+        :param compress: bool: Compress the archive?
+        """
+        os.makedirs(os.path.dirname(path.absolute()), exist_ok=True)
+        compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        with zipfile.ZipFile(path.absolute(), "w", compression=compression, allowZip64=True) as archive:
+            for name, file, dtype in zip(self.names, self.files, self.dtypes):
+                header = {"descr": npy.dtype_to_descr(dtype if dtype is not None else np.dtype(np.float64)),
+                          "fortran_order": False,
+                          "shape": (self.rows,)}
+                with archive.open(name + SUFFIX_NPY, "w", force_zip64=True) as member:
+                    npy.write_array_header_1_0(member, header)
+                    file.seek(0)
+                    shutil.copyfileobj(file, member, BUFFER_SIZE)
+        logging.info(f"Output saved: rows={self.rows} columns={len(self.names)} path={path.absolute()}")
+
+    def salvage(self, path: Path, compress: bool) -> None:
+        """Writes spooled columns after the results failed.
+
+        An error of writing is logged, not raised, so it does not replace the results' exception.
+
+        :param path: Path: Path to the target file.
+        :param compress: bool: Compress the archive?
+        """
+        logging.warning(f"Results interrupted; saving finished rows: rows={self.rows} path={path.absolute()}")
+        try:
+            self.save(path, compress)
+        except Exception as error:
+            logging.error(f"Could not save finished rows: path={path.absolute()} error={error!r}")
+
+
+def load_npz(path: Path) -> dict[str, np.ndarray]:
+    """Loads columns of a .npz archive.
+
+    Members of an uncompressed archive are memory-mapped (read only, without copying); compressed members are read.
+
+    :param path: Path: Path to the archive.
+    :returns: Columns keyed by their names.
+    """
+    columns = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as file:
+        for info in archive.infolist():
+            name = info.filename.removesuffix(SUFFIX_NPY)
+            if info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    columns[name] = npy.read_array(member)
+                continue
+            file.seek(info.header_offset)
+            local = LOCAL_HEADER.unpack(file.read(LOCAL_HEADER.size))
+            file.seek(info.header_offset + LOCAL_HEADER.size + local[-2] + local[-1])
+            version = npy.read_magic(file)
+            read_header = npy.read_array_header_1_0 if version == (1, 0) else npy.read_array_header_2_0
+            shape, fortran_order, dtype = read_header(file)
+            if 0 in shape:
+                columns[name] = np.empty(shape, dtype=dtype)
+            else:
+                columns[name] = np.memmap(path, dtype=dtype, mode="r", offset=file.tell(), shape=shape,
+                                          order="F" if fortran_order else "C")
+    logging.info(f"Loaded NPZ file: columns={len(columns)} path={path}")
+    return columns
@@ -0,0 +1,188 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable
+
+from application.output.output_port import OutputPort
+from application.output.row_schema import (compile_schema, get_scenario_row, TILT, MASS, VELOCITY, FRICTION,
+                                           CYCLE_NUMBER, IS_FULL, SCENARIO_ID)
+from application.result.error import ErrorTable
+from application.result.result_table import ResultTable
+from application.sweep.model.scenario import ScenarioResult
+from infrastructure.config.config import CONFIG
+
+TRANSACTION_ROWS = 100_000
+ANALYSIS_LIMIT = 1000
+
+RUN = "run"
+SCENARIO = "scenario"
+CYCLE = "cycle"
+CONFIG_HASH = "config_hash"
+
+SCHEMA = compile_schema(rounding=False)
+INPUTS = (TILT, MASS, VELOCITY, FRICTION)
+VALUES = [name for name in SCHEMA.header if name not in (CYCLE_NUMBER, IS_FULL)]
+
+DDL = [f"CREATE TABLE IF NOT EXISTS {RUN} (id INTEGER PRIMARY KEY, time TEXT NOT NULL, "
+       f"{CONFIG_HASH} TEXT NOT NULL)",
+       f"CREATE TABLE IF NOT EXISTS {SCENARIO} (id INTEGER PRIMARY KEY, {RUN} INTEGER NOT NULL REFERENCES {RUN}(id), "
+       f"{SCENARIO_ID} INTEGER, " + ", ".join(f"{name} REAL" for name in INPUTS) + ")",
+       f"CREATE TABLE IF NOT EXISTS {CYCLE} ({SCENARIO} INTEGER NOT NULL REFERENCES {SCENARIO}(id), "
+       f"{CYCLE_NUMBER} INTEGER NOT NULL, " + ", ".join(f"{name} REAL" for name in VALUES)
+       + f", {IS_FULL} INTEGER NOT NULL, PRIMARY KEY ({SCENARIO}, {CYCLE_NUMBER})) WITHOUT ROWID"]
+DDL += [f"CREATE INDEX IF NOT EXISTS {RUN}_{CONFIG_HASH} ON {RUN} ({CONFIG_HASH})"]
+DDL += [f"CREATE INDEX IF NOT EXISTS {SCENARIO}_{name} ON {SCENARIO} ({name})" for name in (RUN,) + INPUTS]
+DDL += [f"CREATE INDEX IF NOT EXISTS {CYCLE}_{CYCLE_NUMBER} ON {CYCLE} ({CYCLE_NUMBER})"]
+
+INSERT_RUN = f"INSERT INTO {RUN} (time, {CONFIG_HASH}) VALUES (?, ?)"
+INSERT_SCENARIO = f"INSERT INTO {SCENARIO} ({RUN}, {SCENARIO_ID}, {', '.join(INPUTS)}) VALUES (?, ?, ?, ?, ?, ?)"
+INSERT_CYCLE = (f"INSERT INTO {CYCLE} ({SCENARIO}, {', '.join(SCHEMA.header)}) "
+                f"VALUES (?{', ?' * len(SCHEMA.header)})")
+
+
+class SqliteOutputAdapter(OutputPort):
+    """OutputPort adapter for saving an output to an SQLite database.
+
+    The database is appended to: every output is a new run. Tables are normalized: run (time, config hash),
+    scenario (run, the sweep's scenario id, input) and cycle (scenario, the output columns of CSV).
+    Runs are indexed by their config hash, scenarios by their run and input, cycles by their number. Values keep
+    the full float precision (nan is stored as NULL).
+
+    Attributes
+    ----------
+    path
+        (Path) Path to the database file.
+    """
+
+    def __init__(self, output_path: Path):
+        """Constructor.
+
+        :param output_path: Path: Path to the database file.
+        """
+        self.path: Path = output_path
+
+    def send_output(self, measured: ResultTable, model: ResultTable, error: ErrorTable) -> None:
+        """Saves output to the database as one scenario of a new run.
+
+        :param measured: ResultTable: Results from a simulation.
+        :param model: ResultTable: Results from a model.
+        :param error: ErrorTable: Errors.
+        """
+        logging.info(f"Saving results to SQLite database: measured={measured} model={model} error={error}")
+        self.send_output_stream([(measured, model, error)])
+
+    def send_output_stream(self, results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]) -> None:
+        """Saves output to the database as one scenario of a new run, part by part.
+
+        Every part is committed, so the database holds all finished parts if the run is interrupted.
+        The scenario has no id and input, as a single run's output does not carry them.
+
+        :param results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]: Parts of results.
+        """
+        rows = 0
+        with closing(connect(self.path)) as connection:
+            scenario = insert_scenario(connection, insert_run(connection), [None] * (1 + len(INPUTS)))
+            connection.commit()
+            for measured, model, error in results:
+                connection.executemany(INSERT_CYCLE, SCHEMA.rows(measured, model, error, [scenario]))
+                connection.commit()
+                rows += len(error)
+        logging.info(f"Output saved: rows={rows} path={self.path.absolute()}")
+
+    def send_sweep_output(self, results: Iterable[ScenarioResult]) -> None:
+        """Saves a sweep's output to the database as one run.
+
+        Rows are inserted in transactions of at least TRANSACTION_ROWS rows. Finished scenarios are committed
+        if the sweep is interrupted. Statistics of indexes are refreshed after the sweep.
+
+        :param results: Iterable[ScenarioResult]: Results of the sweep's scenarios.
+        """
+        logging.info(f"Saving sweep results to SQLite database: path={self.path.absolute()}")
+        rows = 0
+        scenarios = 0
+        with closing(connect(self.path)) as connection:
+            try:
+                run = insert_run(connection)
+                pending = 0
+                for result in results:
+                    scenario = insert_scenario(connection, run, get_scenario_row(result, rounding=False))
+                    connection.executemany(INSERT_CYCLE,
+                                           SCHEMA.rows(result.measured, result.model, result.error, [scenario]))
+                    pending += len(result.error)
+                    rows += len(result.error)
+                    scenarios += 1
+                    if pending >= TRANSACTION_ROWS:
+                        connection.commit()
+                        logging.debug(f"Committed rows: n={pending}")
+                        pending = 0
+            finally:
+                connection.commit()
+            analyze(connection)
+        logging.info(f"Sweep output saved: scenarios={scenarios} rows={rows} path={self.path.absolute()}")
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Opens the database in the WAL mode and creates its tables and indexes if they do not exist.
+
+    :param path: Path: Path to the database file.
+    :returns: A connection.
+    """
+    os.makedirs(os.path.dirname(path.absolute()), exist_ok=True)
+    connection = sqlite3.connect(path.absolute())
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    for statement in DDL:
+        connection.execute(statement)
+    connection.commit()
+    return connection
+
+
+def analyze(connection: sqlite3.Connection) -> None:
+    """Refreshes statistics of indexes, sampling up to ANALYSIS_LIMIT rows of each.
+
+    Without statistics, queries filtering by input ranges and cycle numbers may start from the cycle number index
+    instead of the input's one.
+
+    :param connection: sqlite3.Connection
+    """
+    connection.execute(f"PRAGMA analysis_limit={ANALYSIS_LIMIT}")
+    connection.execute("ANALYZE")
+    connection.commit()
+
+
+def insert_run(connection: sqlite3.Connection) -> int:
+    """Inserts a new run.
+
+    :param connection: sqlite3.Connection
+    :returns: Id of the run.
+    """
+    return connection.execute(INSERT_RUN, (datetime.now(timezone.utc).isoformat(), CONFIG.fingerprint())).lastrowid
+
+
+def insert_scenario(connection: sqlite3.Connection, run: int, values: list) -> int:
+    """Inserts a new scenario.
+
+    :param connection: sqlite3.Connection
+    :param run: int: Id of the run.
+    :param values: list: The sweep's scenario id, tilt, mass, velocity and friction.
+    :returns: Id of the scenario (unique in the database).
+    """
+    return connection.execute(INSERT_SCENARIO, [run] + values).lastrowid
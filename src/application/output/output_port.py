@@ -14,20 +14,40 @@ or implied. See the License for the specific language governing
 permissions and limitations under the License.
 """
 from abc import abstractmethod, ABC
+from typing import Iterable
 
-from application.result.error import Error
-from application.result.result import Result
+from application.result.error import ErrorTable
+from application.result.result_table import ResultTable
+from application.sweep.model.scenario import ScenarioResult
 
 
 class OutputPort(ABC):
     """Abstract class responsible for an output handling."""
 
     @abstractmethod
-    def send_output(self, measured: list[Result], model: list[Result], error: list[Error]) -> None:
+    def send_output(self, measured: ResultTable, model: ResultTable, error: ErrorTable) -> None:
         """Parses output from data and sends it to the user.
 
-        :param measured: list[Result]: Results from a simulation.
-        :param model: list[Result]: Results from a model.
-        :param error: list[Error]: Errors.
+        :param measured: ResultTable: Results from a simulation.
+        :param model: ResultTable: Results from a model.
+        :param error: ErrorTable: Errors.
+        """
+        pass
+
+    @abstractmethod
+    def send_output_stream(self, results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]) -> None:
+        """Parses output from data and sends it to the user part by part, as results come.
+
+        :param results: Iterable[tuple[ResultTable, ResultTable, ErrorTable]]: Parts of results (measured results,
+        model results and errors), e.g. one cycle each (see stream_tables). It is consumed lazily.
+        """
+        pass
+
+    @abstractmethod
+    def send_sweep_output(self, results: Iterable[ScenarioResult]) -> None:
+        """Parses a sweep's output from data and sends it to the user as one consolidated output.
+
+        :param results: Iterable[ScenarioResult]: Results of the sweep's scenarios. It is consumed lazily,
+        so scenarios can be sent as soon as they finish.
         """
         pass
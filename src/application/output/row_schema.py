@@ -0,0 +1,131 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from itertools import repeat
+from typing import Callable, Iterator
+
+import numpy as np
+
+from application.result.error import ErrorTable
+from application.result.result_table import ResultTable, COLUMNS, rounded
+from application.sweep.model.scenario import ScenarioResult
+
+SCENARIO_ID = "scenario_id"
+TILT = "tilt"
+MASS = "mass"
+VELOCITY = "velocity"
+FRICTION = "friction"
+
+CYCLE_NUMBER = "cycle_number"
+IS_FULL = "is_full"
+
+SUFFIX_MEASURED = "_measured"
+SUFFIX_MODEL = "_model"
+SUFFIX_ERROR = "_error"
+SUFFIX_REL_ERROR = "_rerror"
+
+Extractor = Callable[[ResultTable, ResultTable, ErrorTable, int], np.ndarray]
+
+
+class RowSchema:
+    """The output layout of results compiled into a flat list of column extractors.
+
+    Rows are built as tuples straight from the tables' columns, without intermediate dictionaries.
+
+    Attributes
+    ----------
+    header
+        (list[str]) Headers of columns.
+    extractors
+        (list[Extractor]) Functions returning a column's values for (measured, model, error, amount of rows).
+    """
+
+    def __init__(self, fields: list[tuple[str, Extractor]]):
+        """Constructor.
+
+        :param fields: list[tuple[str, Extractor]]: Headers and extractors of columns, in the output's order.
+        """
+        self.header: list[str] = [name for name, _ in fields]
+        self.extractors: list[Extractor] = [extractor for _, extractor in fields]
+
+    def columns(self, measured: ResultTable, model: ResultTable, error: ErrorTable) -> list[np.ndarray]:
+        """Extracts columns of results, as long as the error table.
+
+        :param measured: ResultTable: Measured.
+        :param model: ResultTable: Model.
+        :param error: ErrorTable: Errors.
+        :returns: Columns ordered as the header.
+        """
+        n = len(error)
+        return [extractor(measured, model, error, n) for extractor in self.extractors]
+
+    def rows(self, measured: ResultTable, model: ResultTable, error: ErrorTable, prefix: list = ()) \
+            -> Iterator[tuple]:
+        """Creates rows of results, one for each cycle of the error table.
+
+        :param measured: ResultTable: Measured.
+        :param model: ResultTable: Model.
+        :param error: ErrorTable: Errors.
+        :param prefix: list: Values put in front of every row.
+        :returns: Iterator of rows ordered as the header (preceded by the prefix).
+        """
+        n = len(error)
+        columns = [column.tolist() for column in self.columns(measured, model, error)]
+        return zip(*(repeat(value, n) for value in prefix), *columns)
+
+
+def compile_schema(rounding: bool = True) -> RowSchema:
+    """Compiles the output layout of results.
+
+    :param rounding: bool: Round values to the amount of decimal places set in config?
+    :returns: RowSchema of [cycle_number, [measured values], [model values], [error values], is_full] columns.
+    """
+    precision = rounded if rounding else np.asarray
+
+    def measured_column(key: str) -> Extractor:
+        return lambda measured, model, error, n: precision(measured.columns[key][:n])
+
+    def model_column(key: str) -> Extractor:
+        return lambda measured, model, error, n: precision(model.columns[key][:n])
+
+    def error_column(key: str, relative: bool) -> Extractor:
+        return lambda measured, model, error, n: precision((error.rel if relative else error.abs)[key])
+
+    return RowSchema([(CYCLE_NUMBER, lambda measured, model, error, n: model.number[:n])]
+                     + [(key + SUFFIX_MEASURED, measured_column(key)) for key in COLUMNS]
+                     + [(key + SUFFIX_MODEL, model_column(key)) for key in COLUMNS]
+                     + [(key + suffix, error_column(key, relative)) for key in COLUMNS
+                        for suffix, relative in ((SUFFIX_ERROR, False), (SUFFIX_REL_ERROR, True))]
+                     + [(IS_FULL, lambda measured, model, error, n: model.is_full[:n])])
+
+
+def get_scenario_header() -> list[str]:
+    """Creates headers identifying a sweep's scenario.
+
+    :returns: [scenario_id, tilt, mass, velocity, friction] headers.
+    """
+    return [SCENARIO_ID, TILT, MASS, VELOCITY, FRICTION]
+
+
+def get_scenario_row(result: ScenarioResult, rounding: bool = True) -> list:
+    """Creates a row prefix identifying a sweep's scenario.
+
+    :param result: ScenarioResult: The scenario's results.
+    :param rounding: bool: Round values to the amount of decimal places set in config?
+    :returns: Values ordered as get_scenario_header.
+    """
+    inp = result.scenario.input
+    values = (inp.tilt, inp.mass, inp.velocity.value, inp.friction)
+    return [result.scenario.id] + [value.rounded if rounding else value.value for value in values]
@@ -0,0 +1,158 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+
+import numpy as np
+
+from application.input.model.input import Input
+from application.result.result_table import ResultTable
+from infrastructure.config.config import CONFIG
+
+
+class BatchModel:
+    """A class containing the theoretical model of many scenarios, computed at once with NumPy.
+
+    Scenarios have different amounts of cycles, so per-cycle arrays are flat: cycles of the i-th scenario
+    are stored in the offsets[i]:offsets[i + 1] slice.
+
+    Attributes
+    ----------
+    tilt
+        (np.ndarray) Tilt angles of scenarios.
+    friction
+        (np.ndarray) Friction coefficients of scenarios.
+    velocity
+        (np.ndarray) Start velocities' values of scenarios.
+    is_full
+        (np.ndarray) Are scenarios' cycles full? (formula 7)
+    cycles
+        (np.ndarray) Amounts of cycles of scenarios.
+    offsets
+        (np.ndarray) Offsets of scenarios' cycles in per-cycle arrays.
+    scenario
+        (np.ndarray) Per-cycle scenario's index.
+    number
+        (np.ndarray) Per-cycle number of the cycle (starting from 1).
+    duration1
+        (np.ndarray) Per-cycle duration from the first to the second measurement.
+    duration2
+        (np.ndarray) Per-cycle duration from the second to the third measurement (nan if not full).
+    duration
+        (np.ndarray) Per-cycle duration.
+    start_velocity
+        (np.ndarray) Per-cycle start velocity's value.
+    end_velocity
+        (np.ndarray) Per-cycle end velocity's value.
+    reach
+        (np.ndarray) Per-cycle reach's value.
+    """
+
+    def __init__(self, tilt, friction, velocity, g: float | None = None, precision: float | None = None,
+                 max_cycles: int | None = None):
+        """Constructor. Computes the model using formulas (1) - (7).
+
+        :param tilt: Array-like of tilt angles.
+        :param friction: Array-like of friction coefficients.
+        :param velocity: Array-like of start velocities' values.
+        :param g: float | None: Gravitational acceleration (default from config).
+        :param precision: float | None: Cycles are counted until the end velocity is not bigger
+        (default measure_precision from config).
+        :param max_cycles: int | None: Maximal amount of cycles of a scenario (default unlimited).
+        """
+        g = CONFIG.g if g is None else g
+        precision = CONFIG.measure_precision if precision is None else precision
+        self.tilt, self.friction, self.velocity = (a.ravel() for a in np.broadcast_arrays(
+            np.asarray(tilt, dtype=np.float64),
+            np.asarray(friction, dtype=np.float64),
+            np.asarray(velocity, dtype=np.float64)))
+        logging.info(f"Calculating batch model: scenarios n={self.tilt.size} g={g} precision={precision}")
+
+        sin_tilt = np.sin(self.tilt)
+        cos_tilt = np.cos(self.tilt)
+        up = g * (sin_tilt + self.friction * cos_tilt)
+        down = g * (sin_tilt - self.friction * cos_tilt)
+        self.is_full = (self.friction * cos_tilt) / sin_tilt < 1
+        ratio = np.sqrt(np.where(self.is_full, down / up, 0))
+
+        # Counting cycles: the smallest k that makes v_10 * r^k > precision false (see cycles_amount).
+        self.cycles = np.ones(self.tilt.shape, dtype=np.int64)
+        full = np.flatnonzero(self.is_full & (self.velocity * ratio > precision))
+        if (ratio[full] >= 1).any():
+            raise ValueError(f"Infinite amount of cycles: scenarios={full[ratio[full] >= 1]}")
+        v0 = self.velocity[full]
+        r = ratio[full]
+        k = np.maximum(1, np.ceil(np.log(precision / v0) / np.log(r))).astype(np.int64)
+        while (over := v0 * r ** k > precision).any():
+            k[over] += 1
+        while (under := (k > 1) & (v0 * r ** (k - 1) <= precision)).any():
+            k[under] -= 1
+        self.cycles[full] = k
+        if max_cycles is not None:
+            np.minimum(self.cycles, max_cycles, out=self.cycles)
+
+        self.offsets = np.zeros(self.tilt.size + 1, dtype=np.int64)
+        np.cumsum(self.cycles, out=self.offsets[1:])
+        self.scenario = np.repeat(np.arange(self.tilt.size), self.cycles)
+        k = np.arange(self.offsets[-1]) - np.repeat(self.offsets[:-1], self.cycles)
+        self.number = k + 1
+
+        # Formulas (1) - (6) for each cycle.
+        full = self.is_full[self.scenario]
+        self.start_velocity = self.velocity[self.scenario] * ratio[self.scenario] ** k
+        self.end_velocity = self.start_velocity * ratio[self.scenario]
+        self.duration1 = self.start_velocity / up[self.scenario]
+        self.duration2 = np.where(full, self.end_velocity / down[self.scenario], np.nan)
+        self.duration = np.where(full, self.duration1 + self.duration2, self.duration1)
+        self.reach = self.start_velocity ** 2 / (2 * up[self.scenario])
+        logging.info(f"Calculated batch model: scenarios n={self.tilt.size} cycles n={self.offsets[-1]}")
+
+    @classmethod
+    def from_inputs(cls, inputs: list[Input], max_cycles: int | None = None):
+        """Creates BatchModel instance from Input instances.
+
+        :param inputs: list[Input]: Inputs.
+        :param max_cycles: int | None: Maximal amount of cycles of a scenario (default unlimited).
+        """
+        return cls([inp.tilt.value for inp in inputs],
+                   [inp.friction.value for inp in inputs],
+                   [inp.velocity.value.value for inp in inputs],
+                   max_cycles=max_cycles)
+
+    def table(self, i: int) -> ResultTable:
+        """Returns the model of one scenario as ResultTable.
+
+        :param i: int: Index of the scenario.
+        """
+        cycles = slice(self.offsets[i], self.offsets[i + 1])
+        cos_tilt, sin_tilt = np.cos(self.tilt[i]), np.sin(self.tilt[i])
+        v0 = self.start_velocity[cycles]
+        v1 = self.end_velocity[cycles]
+        reach = self.reach[cycles]
+        return ResultTable.from_values(self.number[cycles],
+                                       np.full(v0.size, self.is_full[i]),
+                                       self.duration1[cycles],
+                                       self.duration2[cycles],
+                                       (cos_tilt * v0, sin_tilt * v0),
+                                       (-cos_tilt * v1, -sin_tilt * v1),
+                                       (cos_tilt * reach, sin_tilt * reach))
+
+    def __len__(self):
+        return self.tilt.size
+
+    def __str__(self):
+        return (f"BatchModel(scenarios={self.tilt.size} "
+                f"cycles={self.offsets[-1]} "
+                f"full={int(self.is_full.sum())})")
@@ -14,8 +14,8 @@ or implied. See the License for the specific language governing
 permissions and limitations under the License.
 """
 import logging
-
-from pymunk import Vec2d
+from heapq import merge
+from typing import Iterator
 
 from application.simulation.model.measurement import Measurement
 
@@ -70,27 +70,78 @@ class Cycle:
 def collect_cycles(stop_events: list[Measurement], collision_events: list[Measurement], is_full: bool) -> list[Cycle]:
     """Parses raw Measurements to simulation's Cycles.
 
+    The slowest stop event between two collision events is the middle of a cycle. Stop events are usually
+    already reduced to one per cycle by StopDetector.
+
     :param stop_events: list[Measurement]: Stop events measurements.
     :param collision_events: list[Measurement]: Collision events measurements.
     :param is_full: bool: Is cycle full?
     :returns: Cycle list.
     """
     logging.debug(f"Collecting cycles.")
-    cycles = []
-    measurement_ndx = 0
-    cycle_n = 1
-    for i in range(0, len(collision_events) - 1):
-        event = Measurement(-1, Vec2d(1E50, 1E50),
-                            Vec2d(1E50, 1E50))
-        start = collision_events[i]
-        end = collision_events[i + 1]
-        while measurement_ndx < len(stop_events) and stop_events[measurement_ndx].time < end.time:
-            if stop_events[measurement_ndx].velocity.value < event.velocity.value:
-                event = stop_events[measurement_ndx]
-            measurement_ndx += 1
-        if event.time != -1:
-            cycles.append(Cycle(cycle_n, start, event, end, is_full))
-            logging.debug(f"Collected cycle: cycle={cycles[-1]}")
-            cycle_n += 1
+    cycles = list(CycleCollector(is_full).feed(stop_events, collision_events))
     logging.info(f"Collected cycles: n={len(cycles)}")
     return cycles
+
+
+class CycleCollector:
+    """A class parsing Measurements to Cycles incrementally, as they are measured (see collect_cycles).
+
+    Attributes
+    ----------
+    is_full
+        (bool) Are cycles full?
+    start
+        (Measurement | None) The last collision event (the start of the current cycle).
+    number
+        (int) Number of the next cycle.
+    """
+
+    def __init__(self, is_full: bool):
+        """Constructor.
+
+        :param is_full: bool: Are cycles full?
+        """
+        self.is_full: bool = is_full
+        self.start: Measurement | None = None
+        self.number: int = 1
+        self._middle: Measurement | None = None
+
+    def stop(self, measurement: Measurement) -> None:
+        """Adds a stop event of the current cycle (the slowest one is kept).
+
+        :param measurement: Measurement: The stop event.
+        """
+        if self._middle is None or measurement.velocity.value < self._middle.velocity.value:
+            self._middle = measurement
+
+    def collision(self, measurement: Measurement) -> Cycle | None:
+        """Adds a collision event, which ends the current cycle and starts the next one.
+
+        :param measurement: Measurement: The collision event.
+        :returns: The ended cycle (None if there is no start or stop event).
+        """
+        cycle = None
+        if self.start is not None and self._middle is not None:
+            cycle = Cycle(self.number, self.start, self._middle, measurement, self.is_full)
+            logging.debug(f"Collected cycle: cycle={cycle}")
+            self.number += 1
+        if self.start is not None:
+            self._middle = None
+        self.start = measurement
+        return cycle
+
+    def feed(self, stop_events: list[Measurement], collision_events: list[Measurement]) -> Iterator[Cycle]:
+        """Adds events in the order of their time (a collision goes first at the same time).
+
+        :param stop_events: list[Measurement]: Stop events measurements.
+        :param collision_events: list[Measurement]: Collision events measurements.
+        :returns: Iterator of ended cycles.
+        """
+        events = merge(((m.time.value, 0, i) for i, m in enumerate(collision_events)),
+                       ((m.time.value, 1, i) for i, m in enumerate(stop_events)))
+        for _, is_stop, i in events:
+            if is_stop:
+                self.stop(stop_events[i])
+            elif (cycle := self.collision(collision_events[i])) is not None:
+                yield cycle
@@ -15,114 +15,63 @@ permissions and limitations under the License.
 """
 import logging
 
-from application.math.scalar import Scalar
-from application.math.vector import Vector
-from application.result.result import Result
+import numpy as np
 
+from application.result.result_table import ResultTable
 
-class ScalarError:
-    """A class containing a Scalar values' measurement error.
 
-    Attributes
-    ----------
-    abs
-        (Scalar) Absolute error.
-    rel
-        (Scalar) Relative error.
-    """
+class ErrorTable:
+    """A class containing measurement errors of many cycles as columns.
 
-    def __init__(self, x: Scalar, x0: Scalar):
-        """Constructor.
-
-        :param x: Scalar: Measure.
-        :param x0: Scalar: Model.
-        """
-        self.abs: Scalar = abs(x - x0)
-        self.rel: Scalar = self.abs / x if x != 0 else Scalar.nan()
-
-    def __str__(self):
-        return f"ScalarError(abs={self.abs} rel={self.rel})"
-
-
-class VectorError:
-    """A class containing a Vector values' measurement error.
+    Columns are keyed the same as ResultTable columns. Cycles are paired by their order, so the table
+    is as long as the shorter one of ResultTables.
 
     Attributes
     ----------
-    x
-        (ScalarError) A X coordinate's error.
-    y
-        (ScalarError) A Y coordinate's error.
-    value
-        (ScalarError) A value's error.
+    number
+        (np.ndarray) Numbers of cycles.
+    abs
+        (dict[str, np.ndarray]) Absolute errors.
+    rel
+        (dict[str, np.ndarray]) Relative errors (nan if the measured value is zero).
     """
 
-    def __init__(self, vec: Vector, vec0: Vector):
+    def __init__(self, measured: ResultTable, model: ResultTable):
         """Constructor.
 
-        param vec: Vector: Measure.
-        vec0: Vector: Model.
+        :param measured: ResultTable: Measure.
+        :param model: ResultTable: Model.
         """
-        self.x = ScalarError(vec.x, vec0.x)
-        self.y = ScalarError(vec.y, vec0.y)
-        self.value = ScalarError(vec.value, vec0.value)
+        n = min(len(measured), len(model))
+        self.number: np.ndarray = model.number[:n]
+        self.abs: dict[str, np.ndarray] = {}
+        self.rel: dict[str, np.ndarray] = {}
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for key, x0 in model.columns.items():
+                x = measured.columns[key][:n]
+                self.abs[key] = np.abs(x - x0[:n])
+                self.rel[key] = np.where(x != 0, self.abs[key] / x, np.nan)
+
+    def __len__(self):
+        return self.number.size
 
     def __str__(self):
-        return f"VectorError(x={self.x} y={self.y} value={self.value})"
-
-
-class Error:
-    """A class containing a Result values' measurement errors.
-
-    Attributes
-    ----------
-    duration
-    (ScalarError) A duration's error.
-    duration1
-    (ScalarError) A duration1's error.
-    duration2
-    (ScalarError) A duration2's error.
-    start_velocity
-    (VectorError) A start velocity's error.
-    end_velocity
-    (VectorError) A end velocity's error.
-    reach
-    (VectorError) A reach's error.
-    """
-
-    def __init__(self, measure: Result, model: Result):
-        """Constructor.
+        return f"ErrorTable(cycles={len(self)})"
 
-        :param measure: Result: Measure.
-        :param model: Result: Model.
-        """
-        self.duration = ScalarError(measure.duration, model.duration)
-        self.duration1 = ScalarError(measure.duration1, model.duration1)
-        self.duration2 = ScalarError(measure.duration2, model.duration2)
-        self.start_velocity = VectorError(measure.start_velocity, model.start_velocity)
-        self.end_velocity = VectorError(measure.end_velocity, model.end_velocity)
-        self.reach = VectorError(measure.reach, model.reach)
-
-    def __str__(self):
-        return (f"Error(duration={self.duration} "
-                f"duration1={self.duration1} "
-                f"duration2={self.duration2} "
-                f"start_velocity={self.start_velocity} "
-                f"end_velocity={self.end_velocity} "
-                f"reach={self.reach})")
 
+def prepare_errors(measured: ResultTable, model: ResultTable) -> ErrorTable:
+    """Prepares ErrorTable based on ResultTables.
 
-def prepare_errors(measured: list[Result], model: list[Result]) -> list[Error]:
-    """Prepares Error list based on Results.
+    Results are paired by their order. The table is as long as the shorter one of ResultTables.
 
-    :param measured: list[Result]: Measured results.
-    :param model: list[Result]: Model results.
-    :returns: List of errors.
+    :param measured: ResultTable: Measured results.
+    :param model: ResultTable: Model results.
+    :returns: ErrorTable.
     """
     logging.debug(f"Preparing errors.")
-    errors = []
-    for i in range(0, len(model)):
-        errors.append(Error(measured[i], model[i]))
-        logging.debug(f"Prepared error: error={errors[-1]} measured={measured[i]} model={model[i]}")
+    if len(measured) < len(model):
+        logging.warning(f"The simulation has less cycles than the model; comparing only measured cycles: "
+                        f"measured n={len(measured)} model n={len(model)}")
+    errors = ErrorTable(measured, model)
     logging.info(f"Prepared errors: n={len(errors)}")
     return errors
@@ -13,14 +13,12 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied. See the License for the specific language governing
 permissions and limitations under the License.
 """
-import logging
-from math import sin, cos, sqrt
+from math import sin, cos, sqrt, log, ceil
+from typing import Iterator
 
 from application.input.model.input import Input
 from application.math.scalar import Scalar
 from application.math.vector import Vector
-from application.result.cycle import Cycle, collect_cycles
-from application.simulation.model.measurement import Measurement
 from infrastructure.config.config import CONFIG
 
 
@@ -57,22 +55,6 @@ class Result:
         self.end_velocity = end_velocity
         self.reach = reach
 
-    @classmethod
-    def measured(cls, cycle: Cycle):
-        """Returns a Result parsed from a Cycle instance.
-
-        :param cycle: Cycle
-        """
-        return cls(cycle.number,
-                   cycle.is_full,
-                   cycle.middle.time - cycle.start.time,
-                   cycle.end.time - cycle.middle.time if cycle.is_full else Scalar.nan(),
-                   Vector(abs(cycle.start.velocity.x / CONFIG.scale),
-                          abs(cycle.start.velocity.y / CONFIG.scale)),
-                   Vector(cycle.end.velocity.x / CONFIG.scale, cycle.end.velocity.y / CONFIG.scale),
-                   Vector(abs(cycle.start.position.x - cycle.middle.position.x) / CONFIG.scale,
-                          abs(cycle.start.position.y - cycle.middle.position.y) / CONFIG.scale))
-
     @classmethod
     def model(cls, number: int, start_velocity: Vector, tilt: float, f: float, g: float, is_full: bool):
         """Returns Result computed using given data and physics formulas.
@@ -112,60 +94,111 @@ class Result:
                 f"reach={self.reach})")
 
 
-def prepare_simulation_results(stop_events: list[Measurement], collision_events: list[Measurement], is_full: bool) \
-        -> list[Result]:
-    """Parses a simulation's measurements into Results.
+class ClosedFormModel:
+    """A class representing the theoretical model of a scenario in the closed form.
+
+    According to formula (2), start velocities of cycles are a geometric sequence:
+
+    v_k0 = v_10 * r^(k-1), where r = sqrt((sin(tilt) - f * cos(tilt)) / (sin(tilt) + f * cos(tilt))),
 
-    :param stop_events: list[Measurement]: Stop events measurements.
-    :param collision_events: list[Measurement]: Collision events measurements.
-    :param is_full: bool: Is cycle full?
+    so any cycle can be computed directly, without computing the previous ones.
 
-    :returns: List of Results.
+    Attributes
+    ----------
+    input
+        (Input) The user's input.
+    tilt
+        (float) Tilt angle.
+    friction
+        (float) Friction coefficient.
+    velocity
+        (float) The first cycle's start velocity's value.
+    g
+        (float) Gravitational acceleration.
+    precision
+        (float) Cycles are counted until the end velocity is not bigger.
+    is_full
+        (bool) Are cycles full? (formula 7)
+    ratio
+        (float) A ratio of the end and the start velocity of a cycle.
+    cycles
+        (int) An amount of cycles.
     """
-    logging.info(f"Preparing simulation results: is_full={is_full}")
-    results = []
-    cycles = collect_cycles(stop_events, collision_events, is_full)
-    for cycle in cycles:
-        results.append(Result.measured(cycle))
-        logging.debug(f"Prepared result: result={results[-1]} cycle={cycle}")
-    logging.info(f"Prepared simulation results: n={len(results)}")
-    return results
+
+    def __init__(self, inp: Input, g: float | None = None, precision: float | None = None):
+        """Constructor.
+
+        :param inp: Input: The user's input.
+        :param g: float | None: Gravitational acceleration (default from config).
+        :param precision: float | None: Cycles are counted until the end velocity is not bigger
+        (default measure_precision from config).
+        """
+        self.input: Input = inp
+        self.tilt: float = inp.tilt.value
+        self.friction: float = inp.friction.value
+        self.velocity: float = inp.velocity.value.value
+        self.g: float = CONFIG.g if g is None else g
+        self.precision: float = CONFIG.measure_precision if precision is None else precision
+        self.is_full: bool = (self.friction * cos(self.tilt)) / sin(self.tilt) < 1
+        self.ratio: float = sqrt((sin(self.tilt) - self.friction * cos(self.tilt))
+                                 / (sin(self.tilt) + self.friction * cos(self.tilt))) if self.is_full else 0
+        self.cycles: int = cycles_amount(self.velocity, self.ratio, self.precision) if self.is_full else 1
+
+    def start_velocity(self, k: int) -> float:
+        """Returns the start velocity's value of k-th cycle.
+
+        :param k: int: Number of the cycle (starting from 1).
+        """
+        return self.velocity * self.ratio ** (k - 1)
+
+    def cycle(self, k: int) -> Result:
+        """Returns the model Result of k-th cycle.
+
+        :param k: int: Number of the cycle (starting from 1).
+        :raises IndexError: If the scenario has no k-th cycle.
+        """
+        if not 1 <= k <= self.cycles:
+            raise IndexError(f"No such cycle: k={k} cycles={self.cycles}")
+        if k == 1:
+            start_velocity = self.input.velocity
+        else:
+            v0 = self.start_velocity(k)
+            start_velocity = Vector.from_float(cos(self.tilt) * v0, sin(self.tilt) * v0, CONFIG.unit.velocity)
+        return Result.model(k, start_velocity, self.tilt, self.friction, self.g, self.is_full)
+
+    def __iter__(self) -> Iterator[Result]:
+        """Lazily yields Results of all cycles."""
+        for k in range(1, self.cycles + 1):
+            yield self.cycle(k)
+
+    def __len__(self):
+        return self.cycles
+
+    def __str__(self):
+        return (f"ClosedFormModel(is_full={self.is_full} "
+                f"ratio={self.ratio} "
+                f"cycles={self.cycles})")
 
 
-def calculate_theoretical_model(inp: Input) -> list[Result]:
-    """Prepares model results.
+def cycles_amount(velocity: float, ratio: float, precision: float) -> int:
+    """Counts cycles of a full scenario.
 
-    :param inp: Input: The user's input.
+    A next cycle happens if the end velocity of the previous one is bigger than the precision:
+    v_10 * r^k > precision, so the amount of cycles is the smallest k that makes the inequality false.
+    It is estimated with a logarithm and then checked against the inequality itself.
 
-    :returns: List of Results.
+    :param velocity: float: The first cycle's start velocity's value.
+    :param ratio: float: A ratio of the end and the start velocity of a cycle.
+    :param precision: float: Measure precision.
+    :returns: An amount of cycles.
     """
-    logging.info(f"Calculating model: input={inp}")
-    if (inp.friction * cos(inp.tilt.value)) / (sin(inp.tilt.value)) < 1:
-        results = [Result.model(1,
-                                inp.velocity,
-                                inp.tilt.value,
-                                inp.friction.value,
-                                CONFIG.g,
-                                True)]
-        logging.debug(f"Calculated model result: n={0} result={results[-1]}")
-        i = 2
-        while results[-1].end_velocity.value > CONFIG.measure_precision:
-            results.append(Result.model(i,
-                                        results[-1].end_velocity,
-                                        inp.tilt.value,
-                                        inp.friction.value,
-                                        CONFIG.g,
-                                        True))
-            logging.debug(f"Calculated model result: n={i} result={results[-1]}")
-            i += 1
-    else:
-        results = [Result.model(1,
-                                inp.velocity,
-                                inp.tilt.value,
-                                inp.friction.value,
-                                CONFIG.g,
-                                False)]
-        logging.info(f"Not full cycle occurred. result={results[0]}")
-
-    logging.info(f"Calculated model: n={len(results)}")
-    return results
+    if ratio >= 1:
+        raise ValueError(f"Infinite amount of cycles: ratio={ratio}")
+    if ratio <= 0 or velocity * ratio <= precision:
+        return 1
+    k = max(1, ceil(log(precision / velocity) / log(ratio)))
+    while velocity * ratio ** k > precision:
+        k += 1
+    while k > 1 and velocity * ratio ** (k - 1) <= precision:
+        k -= 1
+    return k
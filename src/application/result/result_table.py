@@ -0,0 +1,248 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+from operator import attrgetter
+
+import numpy as np
+
+from application.input.model.input import Input
+from application.math.scalar import Scalar
+from application.math.vector import Vector
+from application.result.cycle import Cycle, collect_cycles
+from application.result.result import Result, ClosedFormModel
+from application.simulation.model.measurement import Measurement
+from infrastructure.config.config import CONFIG
+
+DURATION1 = "duration1"
+DURATION2 = "duration2"
+DURATION = "duration"
+START_VELOCITY = "start_velocity"
+END_VELOCITY = "end_velocity"
+REACH = "reach"
+
+SUFFIX_X = "_x"
+SUFFIX_Y = "_y"
+SUFFIX_VALUE = "_value"
+
+SCALARS = (DURATION1, DURATION2, DURATION)
+VECTORS = (START_VELOCITY, END_VELOCITY, REACH)
+COLUMNS = SCALARS + tuple(vector + suffix for vector in VECTORS for suffix in (SUFFIX_X, SUFFIX_Y, SUFFIX_VALUE))
+
+
+class ResultTable:
+    """A class containing Results of many cycles as columns (one NumPy array per output value).
+
+    Values are stored with the full float precision; output adapters round them (see rounded).
+    Vectors are stored as three columns: key_x, key_y and key_value.
+
+    Attributes
+    ----------
+    number
+        (np.ndarray) Numbers of cycles.
+    is_full
+        (np.ndarray) Are cycles full?
+    columns
+        (dict[str, np.ndarray]) Columns of values, keyed by COLUMNS names.
+    """
+
+    def __init__(self, number: np.ndarray, is_full: np.ndarray, columns: dict[str, np.ndarray]):
+        """Constructor.
+
+        :param number: np.ndarray: Numbers of cycles.
+        :param is_full: np.ndarray: Are cycles full?
+        :param columns: dict[str, np.ndarray]: Columns of values.
+        """
+        self.number: np.ndarray = number
+        self.is_full: np.ndarray = is_full
+        self.columns: dict[str, np.ndarray] = columns
+
+    @classmethod
+    def from_values(cls, number, is_full, duration1, duration2, start_velocity: tuple, end_velocity: tuple,
+                    reach: tuple):
+        """Creates ResultTable instance from per-cycle values.
+
+        :param number: Array-like of numbers of cycles.
+        :param is_full: Array-like of are cycles full?
+        :param duration1: Array-like of durations from the first to the second measurement.
+        :param duration2: Array-like of durations from the second to the third measurement.
+        :param start_velocity: tuple: Array-likes of start velocities' x and y coordinates.
+        :param end_velocity: tuple: Array-likes of end velocities' x and y coordinates.
+        :param reach: tuple: Array-likes of reaches' x and y coordinates.
+        """
+        is_full = np.asarray(is_full, dtype=bool)
+        columns = {DURATION1: as_array(duration1), DURATION2: as_array(duration2)}
+        columns[DURATION] = np.where(is_full, columns[DURATION1] + columns[DURATION2], columns[DURATION1])
+        for key, (x, y) in zip(VECTORS, (start_velocity, end_velocity, reach)):
+            x = columns[key + SUFFIX_X] = as_array(x)
+            y = columns[key + SUFFIX_Y] = as_array(y)
+            columns[key + SUFFIX_VALUE] = np.hypot(x, y)
+        return cls(np.asarray(number, dtype=np.int64), is_full, columns)
+
+    @classmethod
+    def model(cls, number, tilt, friction, g: float, is_full, start_velocity):
+        """Returns ResultTable computed using physics formulas (1) - (6).
+
+        :param number: Array-like of numbers of cycles.
+        :param tilt: Array-like of tilt angles.
+        :param friction: Array-like of friction coefficients.
+        :param g: float: Gravitational acceleration.
+        :param is_full: Array-like of are cycles full?
+        :param start_velocity: Array-like of start velocities' values.
+        """
+        tilt = np.asarray(tilt, dtype=np.float64)
+        friction = np.asarray(friction, dtype=np.float64)
+        is_full = np.asarray(is_full, dtype=bool)
+        v0 = np.asarray(start_velocity, dtype=np.float64)
+        sin_tilt = np.sin(tilt)
+        cos_tilt = np.cos(tilt)
+        up = g * (sin_tilt + friction * cos_tilt)
+        down = g * (sin_tilt - friction * cos_tilt)
+        v1 = np.where(is_full, v0 * np.sqrt(np.where(is_full, down / up, 0)), 0)
+        reach = v0 * v0 / (2 * up)
+        return cls.from_values(number,
+                               is_full,
+                               v0 / up,
+                               np.where(is_full, v1 / down, np.nan),
+                               (cos_tilt * v0, sin_tilt * v0),
+                               (-cos_tilt * v1, -sin_tilt * v1),
+                               (cos_tilt * reach, sin_tilt * reach))
+
+    @classmethod
+    def measured(cls, cycles: list[Cycle]):
+        """Returns ResultTable parsed from Cycle instances.
+
+        :param cycles: list[Cycle]
+        """
+        start, middle, end = zip_measurements(cycles)
+        is_full = np.array([cycle.is_full for cycle in cycles], dtype=bool)
+        return cls.from_values([cycle.number for cycle in cycles],
+                               is_full,
+                               collect(middle, "time") - collect(start, "time"),
+                               np.where(is_full, collect(end, "time") - collect(middle, "time"), np.nan),
+                               (np.abs(collect(start, "velocity.x")) / CONFIG.scale,
+                                np.abs(collect(start, "velocity.y")) / CONFIG.scale),
+                               (collect(end, "velocity.x") / CONFIG.scale,
+                                collect(end, "velocity.y") / CONFIG.scale),
+                               (np.abs(collect(start, "position.x") - collect(middle, "position.x")) / CONFIG.scale,
+                                np.abs(collect(start, "position.y") - collect(middle, "position.y")) / CONFIG.scale))
+
+    def head(self, n: int):
+        """Returns ResultTable of first n cycles.
+
+        :param n: int: An amount of cycles.
+        """
+        return ResultTable(self.number[:n], self.is_full[:n], {key: column[:n] for key, column in self.columns.items()})
+
+    def result(self, i: int) -> Result:
+        """Returns i-th cycle as Result.
+
+        :param i: int: Index of the cycle.
+        """
+        def vector(key: str, unit: str) -> Vector:
+            return Vector.from_float(float(self.columns[key + SUFFIX_X][i]), float(self.columns[key + SUFFIX_Y][i]),
+                                     unit)
+
+        return Result(int(self.number[i]),
+                      bool(self.is_full[i]),
+                      Scalar(float(self.columns[DURATION1][i]), CONFIG.unit.time),
+                      Scalar(float(self.columns[DURATION2][i]), CONFIG.unit.time),
+                      vector(START_VELOCITY, CONFIG.unit.velocity),
+                      vector(END_VELOCITY, CONFIG.unit.velocity),
+                      vector(REACH, CONFIG.unit.distance))
+
+    def __len__(self):
+        return self.number.size
+
+    def __str__(self):
+        return f"ResultTable(cycles={len(self)} full={int(self.is_full.sum())})"
+
+
+def as_array(values) -> np.ndarray:
+    """Converts values to a float array.
+
+    :param values: Array-like of values.
+    :returns: Array of values.
+    """
+    return np.asarray(values, dtype=np.float64)
+
+
+def rounded(values) -> np.ndarray:
+    """Rounds values to the amount of decimal places set in config (for output only).
+
+    :param values: Array-like of values.
+    :returns: Array of rounded values.
+    """
+    return np.round(np.asarray(values, dtype=np.float64), CONFIG.math_precision)
+
+
+def zip_measurements(cycles: list[Cycle]) -> tuple[list[Measurement], list[Measurement], list[Measurement]]:
+    """Splits cycles into lists of their first, second and third measurements.
+
+    :param cycles: list[Cycle]
+    :returns: Lists of first, second and third measurements.
+    """
+    return [c.start for c in cycles], [c.middle for c in cycles], [c.end for c in cycles]
+
+
+def collect(measurements: list[Measurement], attribute: str) -> np.ndarray:
+    """Collects values of one Scalar attribute of measurements.
+
+    :param measurements: list[Measurement]
+    :param attribute: str: Path of the Scalar attribute (e.g. "time", "velocity.x").
+    :returns: Array of values.
+    """
+    value = attrgetter(attribute + ".value")
+    return np.array([value(m) for m in measurements], dtype=np.float64)
+
+
+def calculate_model_table(inp: Input) -> ResultTable:
+    """Prepares model results as ResultTable.
+
+    :param inp: Input: The user's input.
+    :returns: ResultTable.
+    """
+    logging.info(f"Calculating model table: input={inp}")
+    model = ClosedFormModel(inp)
+    table = model_table(model, np.arange(1, model.cycles + 1))
+    logging.info(f"Calculated model table: table={table} model={model}")
+    return table
+
+
+def model_table(model: ClosedFormModel, number) -> ResultTable:
+    """Returns chosen cycles of a model as ResultTable.
+
+    :param model: ClosedFormModel: The model.
+    :param number: Array-like of numbers of cycles (starting from 1).
+    :returns: ResultTable.
+    """
+    k = np.asarray(number, dtype=np.int64)
+    return ResultTable.model(k, model.tilt, model.friction, model.g, np.full(k.size, model.is_full),
+                             model.velocity * model.ratio ** (k - 1))
+
+
+def prepare_simulation_table(stop_events: list[Measurement], collision_events: list[Measurement], is_full: bool) \
+        -> ResultTable:
+    """Parses a simulation's measurements into ResultTable.
+
+    :param stop_events: list[Measurement]: Stop events measurements.
+    :param collision_events: list[Measurement]: Collision events measurements.
+    :param is_full: bool: Is cycle full?
+    :returns: ResultTable.
+    """
+    logging.info(f"Preparing simulation table: is_full={is_full}")
+    table = ResultTable.measured(collect_cycles(stop_events, collision_events, is_full))
+    logging.info(f"Prepared simulation table: table={table}")
+    return table
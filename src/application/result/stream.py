@@ -0,0 +1,47 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+from typing import Iterable, Iterator
+
+from application.result.cycle import Cycle
+from application.result.error import ErrorTable
+from application.result.result import ClosedFormModel
+from application.result.result_table import ResultTable, model_table
+
+
+def stream_tables(cycles: Iterable[Cycle], model: ClosedFormModel) \
+        -> Iterator[tuple[ResultTable, ResultTable, ErrorTable]]:
+    """Pairs every measured cycle with its model cycle as soon as it is measured.
+
+    Each item holds one cycle: measured results, model results and errors. Cycles beyond the model are dropped,
+    as in ErrorTable.
+
+    :param cycles: Iterable[Cycle]: Measured cycles (e.g. SimulationPort.stream).
+    :param model: ClosedFormModel: The model.
+    :returns: Iterator of (measured, model, error) tables (lazy).
+    """
+    n = 0
+    for cycle in cycles:
+        if cycle.number > model.cycles:
+            continue
+        measured = ResultTable.measured([cycle])
+        expected = model_table(model, [cycle.number])
+        n += 1
+        yield measured, expected, ErrorTable(measured, expected)
+    if n < model.cycles:
+        logging.warning(f"The simulation has less cycles than the model; comparing only measured cycles: "
+                        f"measured n={n} model n={model.cycles}")
+    logging.info(f"Streamed cycles: n={n}")
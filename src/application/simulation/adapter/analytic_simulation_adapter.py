@@ -0,0 +1,91 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+from math import sin, cos, sqrt
+
+from application.input.model.input import Input
+from application.math.scalar import Scalar
+from application.simulation.model.measurement import Measurement, RawEvent, convert_events
+from application.simulation.simulation import block_start, STOP_FRAMES, physics_rate
+from application.simulation.simulation_port import SimulationPort
+from infrastructure.config.config import CONFIG
+
+
+class AnalyticSimulationAdapter(SimulationPort):
+    """Simulates the scenario analytically, event by event, without time-stepping.
+
+    The block moves along the plane with a piecewise constant acceleration: it slows down with
+    g * (sin + f * cos) while sliding up and speeds up with g * (sin - f * cos) while sliding down. Bounces
+    from the wall are elastic. So the turning point and the next collision of every cycle are computed exactly.
+
+    Events are emitted as the pymunk engine does: collision events hold the velocity before the bounce,
+    stop events hold the zero velocity at the turning point. A block that stays at the turning point ends
+    the simulation STOP_FRAMES steps later.
+    """
+
+    def simulate(self, inp: Input, model_cycles_amount: int, is_full: bool) -> \
+            tuple[list[Measurement], list[Measurement], Scalar]:
+        """Simulates the scenario by solving its events one by one.
+
+        The end measurement is the block's state when the simulation stops: after the last collision it is
+        the state right after the bounce (the velocity points up the plane), at rest it is the turning point
+        STOP_FRAMES steps later. Unlike the pymunk engine, the simulation stops exactly at the last event,
+        not one step after it.
+
+        :param inp: Input: A simulation's input.
+        :param model_cycles_amount: int: A expected amount of cycles based on theoretical results.
+        :param is_full: bool: Is the model cycle full?
+        :returns: Look up SimulationPort.simulate.
+        """
+        tilt = inp.tilt.value
+        f = inp.friction.value
+        g = CONFIG.g * CONFIG.scale
+        up = g * (sin(tilt) + f * cos(tilt))
+        down = g * (sin(tilt) - f * cos(tilt))
+        dx, dy = cos(tilt), -sin(tilt)
+        x0, y0 = block_start(tilt)
+        logging.info(f"Running analytic simulation: input={inp} up={up} down={down}")
+
+        collision_events: list[RawEvent] = []
+        stop_events: list[RawEvent] = []
+        time = 0.0
+        velocity = inp.velocity.value.value
+        start = (time, x0, y0, dx * velocity, dy * velocity)
+        end = start
+        while velocity > 0:
+            if time > CONFIG.timeout:
+                logging.warning(f"Analytic simulation timed out: time={time} timeout={CONFIG.timeout}")
+                break
+            reach = velocity * velocity / (2 * up)
+            time += velocity / up
+            end = (time, x0 + dx * reach, y0 + dy * reach, 0.0, 0.0)
+            stop_events.append(end)
+            if down <= 0:
+                end = (time + STOP_FRAMES / physics_rate(), *end[1:])
+                break
+            velocity = sqrt(2 * reach * down)
+            time += velocity / down
+            collision_events.append((time, x0, y0, -dx * velocity, -dy * velocity))
+            end = (time, x0, y0, dx * velocity, dy * velocity)
+            if is_full and len(collision_events) >= model_cycles_amount:
+                break
+
+        logging.info(f"Analytic simulation finished: "
+                     f"end_time={end[0]} "
+                     f"wall-block collisions n={len(collision_events)} "
+                     f"block stops n={len(stop_events)}")
+        collisions = convert_events([start, *collision_events, end])
+        return collisions, convert_events(stop_events), Scalar(end[0], CONFIG.unit.time)
@@ -0,0 +1,56 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+
+from application.input.model.input import Input
+from application.math.scalar import Scalar
+from application.simulation.batch_simulation import BatchSimulation
+from application.simulation.model.measurement import Measurement
+from application.simulation.simulation_port import SimulationPort
+from infrastructure.config.config import CONFIG
+
+
+class BatchSimulationAdapter(SimulationPort):
+    """Simulates scenarios as lanes of one NumPy batch (see BatchSimulation)."""
+
+    def simulate(self, inp: Input, model_cycles_amount: int, is_full: bool) -> \
+            tuple[list[Measurement], list[Measurement], Scalar]:
+        """Simulates the scenario as a batch of one lane.
+
+        :param inp: Input: A simulation's input.
+        :param model_cycles_amount: int: A expected amount of cycles based on theoretical results.
+        :param is_full: bool: Is the model cycle full?
+        :returns: Look up SimulationPort.simulate.
+        """
+        return self.simulate_batch([inp], [model_cycles_amount], [is_full])[0]
+
+    def simulate_batch(self, inputs: list[Input], model_cycles_amounts: list[int], is_full: list[bool]) -> \
+            list[tuple[list[Measurement], list[Measurement], Scalar]]:
+        """Simulates all scenarios at once, each in its own lane.
+
+        :param inputs: list[Input]: Simulation's inputs.
+        :param model_cycles_amounts: list[int]: Expected amounts of cycles based on theoretical results.
+        :param is_full: list[bool]: Are the model cycles full?
+        :returns: Look up SimulationPort.simulate_batch.
+        """
+        logging.debug(f"Simulating a batch: n={len(inputs)}")
+        simulation = BatchSimulation([inp.tilt.value for inp in inputs],
+                                     [inp.friction.value for inp in inputs],
+                                     [inp.velocity.value.value / CONFIG.scale for inp in inputs],
+                                     model_cycles_amounts)
+        simulation.run()
+        return [(simulation.collisions(i), simulation.stops(i), Scalar(simulation.end_time[i], CONFIG.unit.time))
+                for i in range(0, len(simulation))]
@@ -0,0 +1,80 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+from typing import Iterator
+
+from application.input.model.input import Input
+from application.math.scalar import Scalar
+from application.result.cycle import Cycle
+from application.simulation.model.measurement import Measurement
+from application.simulation.simulation import simulate_lanes, stream_cycles, MAX_LANES
+from application.simulation.space_pool import POOL
+from application.simulation.simulation_port import SimulationPort
+
+
+class PymunkSimulationAdapter(SimulationPort):
+    """Simulates the scenario in the pymunk engine (see simulate).
+
+    A batch of scenarios is simulated as lanes of shared spaces (see init_lanes), MAX_LANES per space.
+    Spaces are reused for scenarios of the same geometry from the process' pool (POOL, see SpacePool). The pool
+    is not a part of the adapter, so a sweep's worker process keeps its spaces across chunks, although the adapter
+    is sent to it with every chunk.
+    """
+
+    def simulate(self, inp: Input, model_cycles_amount: int, is_full: bool) -> \
+            tuple[list[Measurement], list[Measurement], Scalar]:
+        """Simulates the scenario in a pymunk space (a kept one if the pool has a space of its geometry).
+
+        The end measurement is the block's state after the last step: one step after the last collision
+        (the block already bounced) or after STOP_FRAMES stopped frames.
+
+        :param inp: Input: A simulation's input.
+        :param model_cycles_amount: int: A expected amount of cycles based on theoretical results.
+        :param is_full: bool: Is the model cycle full?
+        :returns: Look up SimulationPort.simulate.
+        """
+        logging.debug(f"Simulating with pymunk: input={inp}")
+        space, blocks = POOL.acquire([inp])
+        return simulate_lanes(space, blocks, [inp], [model_cycles_amount], [is_full])[0]
+
+    def simulate_batch(self, inputs: list[Input], model_cycles_amounts: list[int], is_full: list[bool]) -> \
+            list[tuple[list[Measurement], list[Measurement], Scalar]]:
+        """Simulates scenarios as lanes of shared pymunk spaces, so one step advances many scenarios.
+
+        :param inputs: list[Input]: Simulation's inputs.
+        :param model_cycles_amounts: list[int]: Expected amounts of cycles based on theoretical results.
+        :param is_full: list[bool]: Are the model cycles full?
+        :returns: Look up SimulationPort.simulate_batch.
+        """
+        logging.debug(f"Simulating lanes with pymunk: n={len(inputs)}")
+        results = []
+        for i in range(0, len(inputs), MAX_LANES):
+            space, blocks = POOL.acquire(inputs[i:i + MAX_LANES])
+            results.extend(simulate_lanes(space, blocks, inputs[i:i + MAX_LANES],
+                                          model_cycles_amounts[i:i + MAX_LANES], is_full[i:i + MAX_LANES]))
+        return results
+
+    def stream(self, inp: Input, model_cycles_amount: int, is_full: bool) -> Iterator[Cycle]:
+        """Simulates the scenario and yields each cycle as soon as it is measured (see stream_cycles).
+
+        :param inp: Input: A simulation's input.
+        :param model_cycles_amount: int: A expected amount of cycles based on theoretical results.
+        :param is_full: bool: Is the model cycle full?
+        :returns: Iterator of Cycles (lazy).
+        """
+        logging.debug(f"Streaming with pymunk: input={inp}")
+        space, blocks = POOL.acquire([inp])
+        yield from stream_cycles(space, blocks[0], inp, model_cycles_amount, is_full)
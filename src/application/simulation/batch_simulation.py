@@ -0,0 +1,263 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+
+import numpy as np
+
+from application.input.model.input import Input
+from application.result.batch_model import BatchModel
+from application.result.result_table import ResultTable, prepare_simulation_table
+from application.simulation.model.measurement import Measurement, RawEvent, convert_events
+from application.simulation.simulation import block_start, STOP_FRAMES, physics_rate
+from infrastructure.config.config import CONFIG
+
+
+class BatchSimulation:
+    """A class simulating many independent blocks at once with NumPy.
+
+    Every block (a lane) slides along its own plane, so the motion is one-dimensional: a position along the plane
+    (0 at the wall, positive up the plane) and a velocity along the plane. All lanes are advanced in lockstep by
+    steps of dt. Inside a step a lane moves with a constant acceleration until the step's end or its next event,
+    so turning points and wall hits are found with masks and timestamped exactly.
+
+    A lane is finished after the expected amount of wall hits (a full cycle), after a wall hit slower than
+    the precision (the block rests at the wall), STOP_FRAMES steps after it stops for good (not full cycle)
+    or after the timeout. Events are stored in flat arrays sorted by lanes: events of
+    the i-th lane are in the offsets[i]:offsets[i + 1] slice.
+
+    The block's mass does not change the motion (all forces are proportional to it), so it is not needed.
+
+    Attributes
+    ----------
+    tilt
+        (np.ndarray) Tilt angles of lanes.
+    friction
+        (np.ndarray) Friction coefficients of lanes.
+    velocity
+        (np.ndarray) Start velocities' values of lanes.
+    cycles
+        (np.ndarray) Amounts of wall hits that finish full lanes.
+    is_full
+        (np.ndarray) Are lanes' cycles full?
+    dt
+        (float) A duration of one step.
+    precision
+        (float) A lane hitting the wall slower than that is finished.
+    steps
+        (int) An amount of done steps.
+    end_time
+        (np.ndarray) Timestamps of lanes' ends.
+    collision_offsets
+        (np.ndarray) Offsets of lanes' collision events.
+    collision_time, collision_position, collision_velocity
+        (np.ndarray) Collision events: timestamps, positions along the plane and velocities before the bounce.
+    stop_offsets
+        (np.ndarray) Offsets of lanes' stop events.
+    stop_time, stop_position
+        (np.ndarray) Stop events: timestamps and positions along the plane.
+    """
+
+    def __init__(self, tilt, friction, velocity, cycles, dt: float | None = None, g: float | None = None,
+                 precision: float | None = None):
+        """Constructor.
+
+        :param tilt: Array-like of tilt angles.
+        :param friction: Array-like of friction coefficients.
+        :param velocity: Array-like of start velocities' values.
+        :param cycles: Array-like of amounts of wall hits that finish full lanes (see BatchModel.cycles).
+        :param dt: float | None: A duration of one step (default 1 / physics_rate()).
+        :param g: float | None: Gravitational acceleration (default from config).
+        :param precision: float | None: A lane hitting the wall slower than that is finished
+        (default measure_precision from config).
+        """
+        g = CONFIG.g if g is None else g
+        self.precision: float = CONFIG.measure_precision if precision is None else precision
+        self.dt: float = 1 / physics_rate() if dt is None else dt
+        self.tilt, self.friction, self.velocity, self.cycles = (a.ravel() for a in np.broadcast_arrays(
+            np.asarray(tilt, dtype=np.float64),
+            np.asarray(friction, dtype=np.float64),
+            np.asarray(velocity, dtype=np.float64),
+            np.asarray(cycles, dtype=np.int64)))
+        self._up = g * (np.sin(self.tilt) + self.friction * np.cos(self.tilt))
+        self._down = g * (np.sin(self.tilt) - self.friction * np.cos(self.tilt))
+        self.is_full = self._down > 0
+        self.steps: int = 0
+        self.end_time = np.zeros(self.tilt.size)
+        self._end_position = np.zeros(self.tilt.size)
+        self._end_velocity = np.zeros(self.tilt.size)
+        self.collision_offsets = self.stop_offsets = np.zeros(self.tilt.size + 1, dtype=np.int64)
+        self.collision_time = self.collision_position = self.collision_velocity = np.empty(0)
+        self.stop_time = self.stop_position = np.empty(0)
+
+    @classmethod
+    def from_model(cls, model: BatchModel, dt: float | None = None):
+        """Creates BatchSimulation instance of BatchModel's scenarios.
+
+        :param model: BatchModel: The scenarios' model.
+        :param dt: float | None: A duration of one step (default 1 / physics_rate()).
+        """
+        return cls(model.tilt, model.friction, model.velocity, model.cycles, dt)
+
+    @classmethod
+    def from_inputs(cls, inputs: list[Input], dt: float | None = None):
+        """Creates BatchSimulation instance from Input instances.
+
+        :param inputs: list[Input]: Inputs.
+        :param dt: float | None: A duration of one step (default 1 / physics_rate()).
+        """
+        return cls.from_model(BatchModel.from_inputs(inputs), dt)
+
+    def run(self) -> None:
+        """Runs the simulation of all lanes."""
+        logging.info(f"Running batch simulation: lanes n={self.tilt.size} dt={self.dt} timeout={CONFIG.timeout}")
+        up, down, full = self._up, self._down, self.is_full
+        position = np.zeros(self.tilt.size)
+        velocity = self.velocity.copy()
+        time = np.zeros(self.tilt.size)
+        hits = np.zeros(self.tilt.size, dtype=np.int64)
+        # A lane that cannot move is finished at once.
+        done = (velocity <= 0) & ~full
+        collisions: list[tuple[np.ndarray, ...]] = []
+        stops: list[tuple[np.ndarray, ...]] = []
+
+        while not done.all():
+            remaining = np.where(done, 0, self.dt)
+            while (lanes := np.flatnonzero(remaining > 0)).size:
+                s, v, r = position[lanes], velocity[lanes], remaining[lanes]
+                rising = v > 0
+                # The next event: the turning point while sliding up, the wall while sliding down.
+                until_event = np.where(rising, v / up[lanes], time_to_wall(s, -v, down[lanes]))
+                h = np.minimum(r, until_event)
+                a = np.where(rising, -up[lanes], -down[lanes])
+                s = s + v * h + a * h * h / 2
+                v = v + a * h
+                time[lanes] += h
+                remaining[lanes] = r - h
+
+                event = until_event <= r
+                turning = event & rising
+                if turning.any():
+                    v[turning] = 0
+                    stops.append((lanes[turning], time[lanes[turning]], s[turning]))
+                    rest = turning & ~full[lanes]
+                    done[lanes[rest]] = True
+                    remaining[lanes[rest]] = 0
+                    time[lanes[rest]] += STOP_FRAMES * self.dt
+                wall = event & ~rising
+                if wall.any():
+                    s[wall] = 0
+                    collisions.append((lanes[wall], time[lanes[wall]], v[wall]))
+                    v[wall] = -v[wall]
+                    hit = lanes[wall]
+                    hits[hit] += 1
+                    last = hit[(hits[hit] >= self.cycles[hit]) | (v[wall] < self.precision)]
+                    done[last] = True
+                    remaining[last] = 0
+                position[lanes] = s
+                velocity[lanes] = v
+            self.steps += 1
+            timed_out = ~done & (time > CONFIG.timeout)
+            if timed_out.any():
+                logging.warning(f"Batch simulation timed out: lanes n={np.count_nonzero(timed_out)}")
+                done |= timed_out
+
+        self.end_time, self._end_position, self._end_velocity = time, position, velocity
+        self.collision_offsets, (self.collision_time, self.collision_velocity) = group(collisions, self.tilt.size)
+        self.stop_offsets, (self.stop_time, self.stop_position) = group(stops, self.tilt.size)
+        self.collision_position = np.zeros(self.collision_time.size)
+        logging.info(f"Batch simulation finished: steps={self.steps} "
+                     f"collisions n={self.collision_time.size} stops n={self.stop_time.size}")
+
+    def raw_event(self, i: int, time: float, position: float, velocity: float) -> RawEvent:
+        """Returns a raw event of a lane in the simulation's coordinates (as captured by the pymunk engine).
+
+        :param i: int: Index of the lane.
+        :param time: float: Timestamp of the event.
+        :param position: float: Position along the plane.
+        :param velocity: float: Velocity along the plane.
+        """
+        x0, y0 = block_start(self.tilt[i])
+        dx, dy = np.cos(self.tilt[i]) * CONFIG.scale, -np.sin(self.tilt[i]) * CONFIG.scale
+        return (float(time), float(x0 + dx * position), float(y0 + dy * position),
+                float(dx * velocity), float(dy * velocity))
+
+    def collisions(self, i: int) -> list[Measurement]:
+        """Returns collision events of a lane with the start and the end (see simulate).
+
+        :param i: int: Index of the lane.
+        """
+        events = slice(self.collision_offsets[i], self.collision_offsets[i + 1])
+        return convert_events([self.raw_event(i, 0, 0, self.velocity[i]),
+                               *(self.raw_event(i, t, s, v) for t, s, v in zip(self.collision_time[events],
+                                                                               self.collision_position[events],
+                                                                               self.collision_velocity[events])),
+                               self.raw_event(i, self.end_time[i], self._end_position[i], self._end_velocity[i])])
+
+    def stops(self, i: int) -> list[Measurement]:
+        """Returns stop events of a lane.
+
+        :param i: int: Index of the lane.
+        """
+        events = slice(self.stop_offsets[i], self.stop_offsets[i + 1])
+        return convert_events([self.raw_event(i, t, s, 0) for t, s in zip(self.stop_time[events],
+                                                                           self.stop_position[events])])
+
+    def table(self, i: int) -> ResultTable:
+        """Returns measured results of a lane as ResultTable.
+
+        :param i: int: Index of the lane.
+        """
+        return prepare_simulation_table(self.stops(i), self.collisions(i), bool(self.is_full[i]))
+
+    def __len__(self):
+        return self.tilt.size
+
+    def __str__(self):
+        return (f"BatchSimulation(lanes={self.tilt.size} "
+                f"dt={self.dt} "
+                f"steps={self.steps})")
+
+
+def time_to_wall(distance: np.ndarray, speed: np.ndarray, acceleration: np.ndarray) -> np.ndarray:
+    """Returns times of covering distances with constant accelerations (see stepper.time_to_reach).
+
+    :param distance: np.ndarray: Distances.
+    :param speed: np.ndarray: Start speeds (towards the target).
+    :param acceleration: np.ndarray: Accelerations (towards the target).
+    :returns: The times (inf if a target is never reached).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta = speed * speed + 2 * acceleration * distance
+        time = 2 * distance / (speed + np.sqrt(delta))
+    time[(delta < 0) | ((speed <= 0) & (acceleration <= 0)) | np.isnan(time)] = np.inf
+    time[distance <= 0] = 0
+    return time
+
+
+def group(parts: list[tuple[np.ndarray, ...]], lanes: int) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Groups events recorded step by step by lanes (the time order inside a lane is kept).
+
+    :param parts: list[tuple[np.ndarray, ...]]: Recorded parts: (lanes, column, column, ...).
+    :param lanes: int: An amount of lanes.
+    :returns: Offsets of lanes' events and sorted columns.
+    """
+    offsets = np.zeros(lanes + 1, dtype=np.int64)
+    if not parts:
+        return offsets, [np.empty(0), np.empty(0)]
+    lane, *columns = (np.concatenate(column) for column in zip(*parts))
+    order = np.argsort(lane, kind="stable")
+    np.cumsum(np.bincount(lane, minlength=lanes), out=offsets[1:])
+    return offsets, [column[order] for column in columns]
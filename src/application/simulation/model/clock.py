@@ -0,0 +1,70 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from pymunk import Space
+
+
+class SimulationClock:
+    """A class representing the simulation's clock.
+
+    The clock counts steps of a pymunk space, so the simulation's time does not depend on the real time
+    or the machine's load. Steps last dt by default, but a step can be given its own duration (adaptive stepping).
+
+    Attributes
+    ----------
+    dt
+        (float) A default duration of one step.
+    steps
+        (int) An amount of done steps.
+    last_dt
+        (float) A duration of the last step.
+    """
+
+    def __init__(self, dt: float):
+        """Constructor.
+
+        :param dt: float: A default duration of one step.
+        """
+        self.dt: float = dt
+        self.steps: int = 0
+        self.last_dt: float = dt
+        self._default_steps: int = 0
+        self._other_time: float = 0
+
+    @property
+    def time(self) -> float:
+        """Returns the elapsed simulation's time."""
+        return self._default_steps * self.dt + self._other_time
+
+    def step(self, space: Space, dt: float | None = None) -> None:
+        """Steps a space by one step and advances the clock.
+
+        The clock is advanced before the step, so the events detected while stepping are timestamped
+        with the end of the step.
+
+        :param space: pymunk.Space: A stepped space.
+        :param dt: float | None: A duration of the step (default dt).
+        """
+        self.steps += 1
+        if dt is None:
+            self._default_steps += 1
+            self.last_dt = self.dt
+        else:
+            self._other_time += dt
+            self.last_dt = dt
+        space.step(self.last_dt)
+
+    def __str__(self):
+        return f"SimulationClock(dt={self.dt} steps={self.steps} time={self.time})"
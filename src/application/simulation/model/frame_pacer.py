@@ -0,0 +1,67 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from math import floor
+
+RESOLUTION = 1e-9
+
+
+class FramePacer:
+    """A class deciding which steps of the simulation are drawn.
+
+    Frames are due every frame_dt of the simulation's time, so several steps are done per drawn frame
+    when the physics runs faster than the rendering. The simulation's time follows the real time; a due frame
+    is dropped when the real time is more than one frame ahead (drawing fell behind), so the physics catches up
+    without drawing.
+
+    Attributes
+    ----------
+    frame_dt
+        (float) A duration of one frame (in the simulation's time).
+    frames
+        (int) An amount of drawn frames.
+    dropped
+        (int) An amount of dropped frames.
+    """
+
+    def __init__(self, render_fps: float):
+        """Constructor.
+
+        :param render_fps: float: An amount of drawn frames per second.
+        """
+        self.frame_dt: float = 1 / render_fps
+        self.frames: int = 0
+        self.dropped: int = 0
+        self._next: int = 0
+
+    def is_due(self, time: float, real_time: float) -> bool:
+        """Checks if a step should be drawn.
+
+        :param time: float: The simulation's time of the step.
+        :param real_time: float: The real time elapsed since the start of the simulation.
+        :returns: True if the frame should be drawn.
+        """
+        frame = floor(time / self.frame_dt + RESOLUTION)
+        if frame < self._next:
+            return False
+        self._next = frame + 1
+        if real_time - time > self.frame_dt:
+            self.dropped += 1
+            return False
+        self.frames += 1
+        return True
+
+    def __str__(self):
+        return f"FramePacer(frame_dt={self.frame_dt} frames={self.frames} dropped={self.dropped})"
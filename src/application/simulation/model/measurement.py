@@ -13,13 +13,15 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied. See the License for the specific language governing
 permissions and limitations under the License.
 """
-from pymunk import Vec2d
+from pymunk import Vec2d, Body
 
 from application.math.math_util import translate_abs, translate
 from application.math.scalar import Scalar
 from application.math.vector import Vector
 from infrastructure.config.config import CONFIG
 
+RawEvent = tuple[float, float, float, float, float]
+
 
 class Measurement:
     """A class representing a simulation's measurement.
@@ -55,5 +57,48 @@ class Measurement:
         x, y = translate(velocity.x, velocity.y)
         self.velocity = Vector.from_float(x, y, CONFIG.unit.velocity)
 
+    @classmethod
+    def from_raw(cls, event: RawEvent):
+        """Creates Measurement instance from a raw event.
+
+        :param event: RawEvent: A raw event (see capture).
+        """
+        time, x, y, vx, vy = event
+        return cls(time, Vec2d(x, y), Vec2d(vx, vy))
+
     def __str__(self):
         return f"Measurement(time={self.time} position={self.position} velocity={self.velocity})"
+
+
+def capture(time: float, body: Body) -> RawEvent:
+    """Captures a raw event of a body: (time, x, y, vx, vy) in the simulation's coordinates.
+
+    Raw events are cheap to record inside the simulation's loop and are converted to Measurements after it.
+
+    :param time: float: Timestamp of the event.
+    :param body: pymunk.Body: The measured body.
+    :returns: A raw event.
+    """
+    position = body.position
+    velocity = body.velocity
+    return time, position.x, position.y, velocity.x, velocity.y
+
+
+def rewind(event: RawEvent, duration: float) -> RawEvent:
+    """Moves a raw event back in time, assuming a constant velocity.
+
+    :param event: RawEvent: A raw event.
+    :param duration: float: A duration to move back.
+    :returns: The moved raw event.
+    """
+    time, x, y, vx, vy = event
+    return time - duration, x - vx * duration, y - vy * duration, vx, vy
+
+
+def convert_events(events: list[RawEvent]) -> list[Measurement]:
+    """Converts raw events to Measurements.
+
+    :param events: list[RawEvent]: Raw events.
+    :returns: List of Measurements.
+    """
+    return [Measurement.from_raw(event) for event in events]
@@ -0,0 +1,122 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from math import sin, cos, sqrt, inf
+
+from pymunk import Body, Vec2d, Shape, Poly
+
+from application.input.model.input import Input
+from application.simulation.model.stop_detector import RESOLUTION
+from infrastructure.config.config import CONFIG
+
+REFINEMENT = 16
+GROWTH = 2
+
+
+class AdaptiveStepper:
+    """A class choosing durations of the simulation's steps.
+
+    Between events the block slides with a constant acceleration, so steps are long there. pymunk moves
+    the block with its velocity from the start of the step, so a step's local position error is a * dt^2 / 2
+    and the longest step keeps it under the tolerance. Steps are halved while the block approaches the turning
+    point or the wall: a step ends one minimal step (REFINEMENT times shorter than the frame's step) after
+    the predicted event, so the event is detected within the minimal step instead of a whole frame.
+    A step grows at most GROWTH times from the previous one, so pymunk does not resolve a contact with a long step
+    right after a short one. A resting block is stepped with the longest step.
+
+    Attributes
+    ----------
+    dt_min
+        (float) The minimal duration of a step.
+    dt_max
+        (float) The maximal duration of a step.
+    direction
+        (Vec2d) A unit vector pointing up the plane (in the simulation's coordinates).
+    block
+        (pymunk.Poly) The block's shape.
+    wall
+        (pymunk.Shape) The wall's shape.
+    up
+        (float) The block's deceleration while sliding up (in the simulation's units).
+    down
+        (float) The block's acceleration while sliding down (in the simulation's units).
+    rest
+        (float) A speed below which the block rests (in the simulation's units).
+    last_dt
+        (float) The duration of the last step (the next one is at most GROWTH times longer).
+    """
+
+    def __init__(self, inp: Input, block: Poly, wall: Shape, dt: float, tolerance: float):
+        """Constructor.
+
+        :param inp: Input: The simulation's input.
+        :param block: pymunk.Poly: The block's shape.
+        :param wall: pymunk.Shape: The wall's shape.
+        :param dt: float: A duration of the frame's step (1 / fps).
+        :param tolerance: float: The maximal local position error of a step (in the model's distance unit).
+        """
+        tilt = inp.tilt.value
+        f = inp.friction.value
+        g = CONFIG.g * CONFIG.scale
+        self.dt_min: float = dt / REFINEMENT
+        self.direction: Vec2d = Vec2d(cos(tilt), -sin(tilt))
+        self.block: Poly = block
+        self.wall: Shape = wall
+        self.up: float = g * (sin(tilt) + f * cos(tilt))
+        self.down: float = g * (sin(tilt) - f * cos(tilt))
+        self.dt_max: float = max(dt, sqrt(2 * tolerance * CONFIG.scale / self.up))
+        self.rest: float = CONFIG.measure_precision * CONFIG.scale * RESOLUTION
+        self.last_dt: float = dt
+
+    def next_dt(self, body: Body) -> float:
+        """Returns a duration of the next step.
+
+        :param body: pymunk.Body: The block's body.
+        """
+        along = body.velocity.dot(self.direction)
+        if abs(along) < self.rest:
+            until_event = inf
+        elif along > 0:
+            until_event = along / self.up
+        else:
+            until_event = time_to_reach(self.gap(body), -along, self.down)
+        self.last_dt = min(self.dt_max, until_event + self.dt_min, GROWTH * self.last_dt)
+        return self.last_dt
+
+    def gap(self, body: Body) -> float:
+        """Returns the distance between the block and the wall (the wall is perpendicular to the plane).
+
+        :param body: pymunk.Body: The block's body.
+        """
+        return min(self.wall.point_query(body.local_to_world(vertex)).distance for vertex in self.block.get_vertices())
+
+    def __str__(self):
+        return f"AdaptiveStepper(dt_min={self.dt_min} dt_max={self.dt_max} up={self.up} down={self.down})"
+
+
+def time_to_reach(distance: float, speed: float, acceleration: float) -> float:
+    """Returns the time of covering a distance with a constant acceleration.
+
+    :param distance: float: The distance.
+    :param speed: float: The start speed (towards the target).
+    :param acceleration: float: The acceleration (towards the target).
+    :returns: The time (inf if the target is never reached).
+    """
+    if distance <= 0:
+        return 0
+    delta = speed * speed + 2 * acceleration * distance
+    if delta < 0 or (speed <= 0 and acceleration <= 0):
+        return inf
+    return 2 * distance / (speed + sqrt(delta))
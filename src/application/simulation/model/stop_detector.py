@@ -0,0 +1,160 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+from math import inf, hypot, cos, sin
+
+from pymunk import Body
+
+from application.simulation.model.measurement import RawEvent, capture
+from infrastructure.config.config import CONFIG
+
+RESOLUTION = 1e-9
+
+
+class StopDetector:
+    """A class detecting stop events of the block online.
+
+    The block is stopped when both coordinates of its velocity are smaller than the stop speed.
+    Stopped frames of one cycle (between two collision events) are reduced to one stop event: the one with
+    the smallest speed (rounded as Scalar values, so the first of equally slow frames wins). So only one event
+    per cycle is kept instead of one per stopped frame.
+
+    If the tilt is given, turning points are localized inside frames: when the velocity along the plane changes
+    its sign from up to down between two frames of a moving block, the stop event is placed at the sign change.
+    The block decelerates and accelerates with different rates on both sides of the turning point (and does not
+    slide back at all if the friction holds it), so with the deceleration given the moment is computed from the
+    velocity of the previous frame; otherwise the velocity is interpolated linearly. A velocity below RESOLUTION
+    of the stop speed counts as zero, so a block coming to rest turns once, not on every jitter afterwards.
+    It takes precedence over stopped frames of the cycle, so stops are found even if no frame is slow enough.
+
+    Attributes
+    ----------
+    speed
+        (float) The stop speed (in the simulation's units).
+    events
+        (list[RawEvent]) Reduced stop events of finished cycles.
+    cycle
+        (int) Index of the current cycle (stop events of previous cycles are final).
+    frames
+        (int) An amount of stopped frames.
+    is_stopped
+        (bool) Is the block stopped in the last frame?
+    direction
+        (tuple[float, float] | None) A unit vector pointing up the plane (in the simulation's coordinates).
+    deceleration
+        (float | None) The block's deceleration while sliding up (in the simulation's units).
+    """
+
+    def __init__(self, speed: float, tilt: float | None = None, deceleration: float | None = None):
+        """Constructor.
+
+        :param speed: float: The stop speed (in the simulation's units).
+        :param tilt: float | None: The tilt angle; turning points are not localized if None (default).
+        :param deceleration: float | None: The block's deceleration while sliding up (in the simulation's units);
+        the velocity is interpolated linearly if None (default).
+        """
+        self.speed: float = speed
+        self.events: list[RawEvent] = []
+        self.frames: int = 0
+        self.is_stopped: bool = False
+        self.cycle: int = -1
+        self._best: RawEvent | None = None
+        self._best_speed: float = inf
+        self._precision: int = CONFIG.math_precision
+        self.direction: tuple[float, float] | None = (cos(tilt), -sin(tilt)) if tilt is not None else None
+        self._previous: RawEvent | None = None
+        self._along: float = 0
+        self.deceleration: float | None = deceleration
+
+    def update(self, time: float, body: Body, cycle: int) -> None:
+        """Checks the block in one frame.
+
+        :param time: float: Timestamp of the frame.
+        :param body: pymunk.Body: The block's body.
+        :param cycle: int: Index of the current cycle (an amount of collision events so far).
+        """
+        if cycle != self.cycle:
+            self.flush()
+            self.cycle = cycle
+        vx, vy = body.velocity
+        if self.direction is not None:
+            self.locate(time, body, vx * self.direction[0] + vy * self.direction[1])
+        stopped = abs(vx) < self.speed and abs(vy) < self.speed
+        if stopped != self.is_stopped:
+            self.is_stopped = stopped
+            logging.debug(f"Block {'stopped' if stopped else 'started moving'}: time={time} cycle={cycle}")
+        if not stopped:
+            return
+        self.frames += 1
+        speed = round(hypot(vx, vy), self._precision)
+        if speed < self._best_speed:
+            self._best = capture(time, body)
+            self._best_speed = speed
+
+    def locate(self, time: float, body: Body, along: float) -> None:
+        """Localizes a turning point between the previous and the current frame (once per cycle).
+
+        :param time: float: Timestamp of the frame.
+        :param body: pymunk.Body: The block's body.
+        :param along: float: The block's velocity along the plane (positive up the plane).
+        """
+        event = capture(time, body)
+        zero = self.speed * RESOLUTION
+        if self._previous is not None and self._along > zero >= along and self._best_speed >= 0:
+            if self.deceleration is not None:
+                fraction = min(self._along / (self.deceleration * (time - self._previous[0])), 1)
+            else:
+                fraction = self._along / (self._along - along)
+            self._best = turning_point(self._previous, event, fraction)
+            self._best_speed = -1
+            logging.debug(f"Block turning point localized: event={self._best}")
+        self._previous = event
+        self._along = along
+
+    def flush(self) -> None:
+        """Saves the best stop event of the current cycle."""
+        if self._best is not None:
+            self.events.append(self._best)
+            logging.debug(f"Block stop detected: event={self._best}")
+        self._best = None
+        self._best_speed = inf
+
+    def finish(self) -> list[RawEvent]:
+        """Finishes the detection.
+
+        :returns: Reduced stop events (at most one per cycle).
+        """
+        self.flush()
+        logging.debug(f"Stop detection finished: {self}")
+        return self.events
+
+    def __str__(self):
+        return f"StopDetector(speed={self.speed} events={len(self.events)} frames={self.frames})"
+
+
+def turning_point(previous: RawEvent, event: RawEvent, fraction: float) -> RawEvent:
+    """Places a turning point between two raw events of consecutive frames.
+
+    The block decelerates uniformly to zero, so it moves with a half of the previous frame's velocity.
+
+    :param previous: RawEvent: A raw event of the previous frame.
+    :param event: RawEvent: A raw event of the current frame.
+    :param fraction: float: A fraction of the frame (from 0 to 1) when the block stops.
+    :returns: The turning point's raw event (with zero velocity).
+    """
+    t0, x0, y0, vx0, vy0 = previous
+    duration = (event[0] - t0) * fraction
+    return t0 + duration, x0 + vx0 * duration / 2, y0 + vy0 * duration / 2, 0.0, 0.0
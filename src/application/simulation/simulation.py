@@ -16,18 +16,28 @@ permissions and limitations under the License.
 import logging
 import sys
 from math import tan, radians, sin, cos
-from time import time
+from time import perf_counter
+from typing import Iterator
 
 import pygame
 import pymunk.pygame_util
-from pymunk import Space, Body, Arbiter
+from pymunk import Space, Body, Arbiter, Shape, Vec2d, ShapeFilter
 
 from application.input.model.input import Input
 from application.math.math_util import translate_abs
 from application.math.scalar import Scalar
-from application.simulation.model.measurement import Measurement
+from application.result.cycle import Cycle, CycleCollector
+from application.simulation.model.clock import SimulationClock
+from application.simulation.model.frame_pacer import FramePacer
+from application.simulation.model.measurement import Measurement, RawEvent, capture, convert_events, rewind
+from application.simulation.model.stepper import AdaptiveStepper
+from application.simulation.model.stop_detector import StopDetector
 from infrastructure.config.config import CONFIG
 
+STOP_FRAMES = 10
+SEGMENT_RADIUS = 4
+MAX_LANES = 32
+
 
 def init_space(inp: Input) -> tuple[Space, Body]:
     """Initializes a simulation's space.
@@ -38,10 +48,47 @@ def init_space(inp: Input) -> tuple[Space, Body]:
     logging.info(f"Initializing simulation space: input={inp}")
     space = pymunk.Space()
     space.gravity = (0, CONFIG.g * CONFIG.scale)
+    block_body = add_scene(space, inp, 1)
+    logging.info(f"Initialized simulation space with parameters: gravity={space.gravity} "
+                 f"bodies={space.bodies}")
+    return space, block_body
+
+
+def init_lanes(inputs: list[Input]) -> tuple[Space, list[Body]]:
+    """Initializes one simulation's space for many scenarios (lanes).
+
+    Every lane has its own plane, wall and block in the same place. Lanes are isolated by shape filters
+    (lane i is in the category 2^i and collides only with it), so at most MAX_LANES lanes fit one space.
+    The wall and the block of lane i have the collision type i + 1.
+
+    :param inputs: list[Input]: Users' inputs (one per lane).
+    :returns: pymunk.Space instance and pymunk.Body instances (bodies of the blocks).
+    """
+    if len(inputs) > MAX_LANES:
+        raise ValueError(f"Too many lanes for one space: n={len(inputs)} max={MAX_LANES}")
+    logging.info(f"Initializing simulation space with lanes: n={len(inputs)}")
+    space = pymunk.Space()
+    space.gravity = (0, CONFIG.g * CONFIG.scale)
+    blocks = [add_scene(space, inp, lane + 1, ShapeFilter(categories=1 << lane, mask=1 << lane))
+              for lane, inp in enumerate(inputs)]
+    logging.info(f"Initialized simulation space with parameters: gravity={space.gravity} "
+                 f"bodies={len(space.bodies)}")
+    return space, blocks
+
+
+def add_scene(space: Space, inp: Input, collision_type: int, shape_filter: ShapeFilter = ShapeFilter()) -> Body:
+    """Adds a plane, a wall and a block to a space.
 
+    :param space: pymunk.Space
+    :param inp: Input: A user's input.
+    :param collision_type: int: A collision type of the wall and the block.
+    :param shape_filter: pymunk.ShapeFilter: A filter of all added shapes (default collides with everything).
+    :returns: pymunk.Body instance (body of the block).
+    """
     plane = pymunk.Segment(space.static_body, translate_abs(50, 0),
-                           translate_abs(10000, tan(inp.tilt.value) * 10000), 4)
+                           translate_abs(10000, tan(inp.tilt.value) * 10000), SEGMENT_RADIUS)
     plane.friction = 1
+    plane.filter = shape_filter
 
     logging.debug(f"Initialized object PLANE: body={plane.body} "
                   f"a={plane.a} "
@@ -50,9 +97,10 @@ def init_space(inp: Input) -> tuple[Space, Body]:
                   f"friction={plane.friction}")
 
     wall = pymunk.Segment(space.static_body, translate_abs(100, 0),
-                          translate_abs(0, (100 / tan(inp.tilt.value))), 4)
+                          translate_abs(0, (100 / tan(inp.tilt.value))), SEGMENT_RADIUS)
     wall.elasticity = 1
-    wall.collision_type = 1
+    wall.collision_type = collision_type
+    wall.filter = shape_filter
     logging.debug(f"Initialized object WALL: body={wall.body} "
                   f"a={wall.a} "
                   f"b={wall.b} "
@@ -64,14 +112,14 @@ def init_space(inp: Input) -> tuple[Space, Body]:
                              moment=pymunk.moment_for_box(sys.float_info.max,
                                                           (CONFIG.block_size, CONFIG.block_size)))
     block_body.angle = radians(270) - inp.tilt.value
-    block_body.position = translate_abs(100 - 50 * sin(inp.tilt.value) ** 2,
-                                        50 * sin(inp.tilt.value) * cos(inp.tilt.value))
+    block_body.position = block_start(inp.tilt.value)
 
     block = pymunk.Poly(block_body, [(0, 0), (0, CONFIG.block_size),
                                      (CONFIG.block_size, 0), (CONFIG.block_size, CONFIG.block_size)])
     block.elasticity = 1
     block.friction = inp.friction.value
-    block.collision_type = 1
+    block.collision_type = collision_type
+    block.filter = shape_filter
     logging.debug(f"Initialized object BLOCK: body={block.body} "
                   f"angle={block.body.angle} "
                   f"position={block.body.position} "
@@ -81,20 +129,223 @@ def init_space(inp: Input) -> tuple[Space, Body]:
                   f"collision_type={block.collision_type}")
 
     space.add(block_body, block, plane, wall)
-    logging.info(f"Initialized simulation space with parameters: gravity={space.gravity} "
-                 f"bodies={space.bodies}")
-    return space, block_body
+    return block_body
+
+
+def block_start(tilt: float) -> Vec2d:
+    """Returns the block's start position in the simulation's coordinates.
+
+    The block's corner is placed in the corner between the plane and the wall, moved by the segments' radius
+    from both of them, so the block touches the wall and lies on the plane without overlapping them.
+
+    :param tilt: float: The tilt angle.
+    """
+    return Vec2d(*translate_abs(100 - 50 * sin(tilt) ** 2 + SEGMENT_RADIUS * (cos(tilt) - sin(tilt)),
+                                50 * sin(tilt) * cos(tilt) + SEGMENT_RADIUS * (sin(tilt) + cos(tilt))))
+
+
+def handle_collision(arbiter: Arbiter, space: Space, data: tuple[list[RawEvent], SimulationClock]) -> None:
+    """A collision handler. Records a raw event (converted to Measurement after the simulation).
+
+    A contact of a block moving away from the wall (the block starts touching it) is not a collision.
+    With the interpolation on (simulation.interpolation config), the event is moved back to the moment of
+    the contact inside the step.
+
+    :param arbiter: pymunk.Arbiter: Collision data object.
+    :param space: pymunk.Space
+    :param data: tuple[list[RawEvent], SimulationClock]: List of raw collision events and the simulation's clock.
+    """
+    events, clock = data
+    if arbiter.shapes[1].body.velocity.dot(arbiter.contact_point_set.normal) >= 0:
+        logging.debug(f"Block-wall contact ignored (moving away): time={clock.time}")
+        return
+    event = capture(clock.time, arbiter.shapes[1].body)
+    if CONFIG.interpolation:
+        event = rewind(event, contact_delay(arbiter, clock.last_dt))
+    events.append(event)
+    logging.debug(f"Block-wall collision detected: event={events[-1]}")
 
 
-def handle_collision(arbiter: Arbiter, space: Space, data: list[Measurement]) -> None:
-    """A collision handler.
+def contact_delay(arbiter: Arbiter, dt: float) -> float:
+    """Estimates how long before the end of the step the block has touched the wall.
+
+    The block moves with a constant velocity inside a step, so the delay is the penetration depth divided by
+    the approach speed along the contact's normal.
 
     :param arbiter: pymunk.Arbiter: Collision data object.
+    :param dt: float: A duration of one step.
+    :returns: The delay (from 0 to dt).
+    """
+    contact = arbiter.contact_point_set
+    depth = -min((point.distance for point in contact.points), default=0)
+    speed = -arbiter.shapes[1].body.velocity.dot(contact.normal)
+    if depth <= 0 or speed <= 0:
+        return 0
+    return min(depth / speed, dt)
+
+
+def deceleration(inp: Input) -> float:
+    """Returns the block's deceleration while sliding up the plane.
+
+    :param inp: Input: A user's input.
+    :returns: The deceleration (in the simulation's units).
+    """
+    return CONFIG.g * CONFIG.scale * (sin(inp.tilt.value) + inp.friction.value * cos(inp.tilt.value))
+
+
+def find_wall(space: Space) -> Shape:
+    """Finds the wall's shape in a space initialized with init_space.
+
+    :param space: pymunk.Space
+    :returns: The wall's shape.
+    """
+    return next(shape for shape in space.static_body.shapes if shape.collision_type == 1)
+
+
+def init_display() -> tuple[pygame.Surface, pymunk.pygame_util.DrawOptions, pygame.time.Clock]:
+    """Sets up a pygame window for the simulation.
+
+    :returns: pygame display surface, pymunk draw options and pygame clock.
+    """
+    display = pygame.display.set_mode(CONFIG.resolution)
+    pygame.display.set_caption("InclinedPlane -- SIMULATION")
+    draw_options = pymunk.pygame_util.DrawOptions(display)
+    fps_clock = pygame.time.Clock()
+    logging.debug(f"Set up pygame display: resolution={CONFIG.resolution} fps={CONFIG.fps} "
+                  f"render_fps={render_rate()}")
+    return display, draw_options, fps_clock
+
+
+def physics_rate() -> int:
+    """Returns an amount of the simulation's steps per second: simulation.substeps steps per frame
+    (simulation.fps config).
+
+    :returns: The physics rate.
+    """
+    return CONFIG.fps * CONFIG.substeps
+
+
+def render_rate() -> float:
+    """Returns an amount of drawn frames per second (simulation.render_fps config, at most the physics rate).
+
+    :returns: The render rate (fps if render_fps is not set).
+    """
+    if CONFIG.render_fps is None:
+        return CONFIG.fps
+    return min(CONFIG.render_fps, physics_rate())
+
+
+def draw(space: Space, display: pygame.Surface, draw_options: pymunk.pygame_util.DrawOptions) -> None:
+    """Draws a space on the pygame display.
+
     :param space: pymunk.Space
-    :param data: list[Measurement]: List of collision events.
+    :param display: pygame.Surface: A target display.
+    :param draw_options: pymunk.pygame_util.DrawOptions: Draw options bound to the display.
+    """
+    display.fill((65, 65, 65))
+    space.debug_draw(draw_options)
+    pygame.display.update()
+
+
+class Lane:
+    """A class representing one scenario simulated in a space: its block and its events.
+
+    Attributes
+    ----------
+    block
+        (pymunk.Body) The block's body.
+    model_cycles_amount
+        (int) A expected amount of cycles based on theoretical results.
+    is_full
+        (bool) Is the model cycle full?
+    collision_events
+        (list[RawEvent]) Raw collision events (not taken yet, see take).
+    taken
+        (int) An amount of collision events taken by take.
+    stop_detector
+        (StopDetector) The lane's stop detector.
+    start
+        (Measurement) The start measurement.
+    is_finished
+        (bool) Has the lane met its end condition?
+    result
+        (tuple[list[Measurement], list[Measurement], Scalar] | None) The lane's result (see finish) once it is
+        finished.
     """
-    data.append(Measurement(round(time(), 2), arbiter.shapes[1].body.position, arbiter.shapes[1].body.velocity))
-    logging.debug(f"Block-wall collision detected: measurement={data[-1]}")
+
+    def __init__(self, block: Body, inp: Input, model_cycles_amount: int, is_full: bool, time: float):
+        """Constructor. Pushes the block with the input's start velocity.
+
+        :param block: pymunk.Body: The block's body.
+        :param inp: Input: A user's input.
+        :param model_cycles_amount: int: A expected amount of cycles based on theoretical results.
+        :param is_full: bool: Is the model cycle full?
+        :param time: float: The start time.
+        """
+        vel = inp.velocity.translated()
+        block.apply_impulse_at_world_point((vel.x.value * inp.mass.value, vel.y.value * inp.mass.value),
+                                           translate_abs(0, 0))
+        self.block: Body = block
+        self.model_cycles_amount: int = model_cycles_amount
+        self.is_full: bool = is_full
+        self.collision_events: list[RawEvent] = []
+        self.taken: int = 0
+        self.stop_detector: StopDetector = StopDetector(CONFIG.measure_precision * CONFIG.scale,
+                                                        inp.tilt.value if CONFIG.interpolation else None,
+                                                        deceleration(inp))
+        self.start: Measurement = Measurement(time, block.position, block.velocity)
+        self.is_finished: bool = False
+        self.result: tuple[list[Measurement], list[Measurement], Scalar] | None = None
+
+    @property
+    def collisions(self) -> int:
+        """Returns an amount of detected collisions."""
+        return self.taken + len(self.collision_events)
+
+    def update(self, time: float) -> None:
+        """Checks the end condition and the block in one frame.
+
+        :param time: float: Timestamp of the frame.
+        """
+        if ((not self.is_full and self.stop_detector.frames > STOP_FRAMES)
+                or (self.is_full and self.collisions >= self.model_cycles_amount)):
+            self.is_finished = True
+        self.stop_detector.update(time, self.block, self.collisions)
+
+    def take(self) -> tuple[list[RawEvent], list[RawEvent]]:
+        """Takes the final events out of the lane, so a streamed simulation does not keep them.
+
+        Collision events are final when the stop events of their cycles are (see StopDetector.cycle).
+
+        :returns: Raw collision events and raw stop events.
+        """
+        ready = max(0, min(self.collisions, self.stop_detector.cycle) - self.taken)
+        collisions = self.collision_events[:ready]
+        del self.collision_events[:ready]
+        self.taken += ready
+        stops = self.stop_detector.events[:]
+        self.stop_detector.events.clear()
+        return collisions, stops
+
+    def finish(self, time: float) -> tuple[list[Measurement], list[Measurement], Scalar]:
+        """Finishes the lane. Events taken by take are not included.
+
+        :param time: float: The end time.
+        :returns: Look up simulate.
+        """
+        stop_events = self.stop_detector.finish()
+        end_time = Scalar(time, CONFIG.unit.time)
+        end_measurement = Measurement(end_time.value, self.block.position, self.block.velocity)
+        logging.info(f"Simulation finished: "
+                     f"duration={end_time - self.start.time} "
+                     f"end_time={end_time} "
+                     f"end_measurement={end_measurement} "
+                     f"wall-block collisions n={self.collisions} "
+                     f"block stops n={len(stop_events)}")
+        collisions = convert_events(self.collision_events)
+        collisions.insert(0, self.start)
+        collisions.append(end_measurement)
+        return collisions, convert_events(stop_events), end_time - self.start.time
 
 
 def simulate(space: Space, block: Body, inp: Input, model_cycles_amount: int, is_full: bool) -> \
@@ -105,6 +356,21 @@ def simulate(space: Space, block: Body, inp: Input, model_cycles_amount: int, is
 
     Simulation events: Look up the Measurement object docstring.
 
+    In the headless mode (simulation.headless config) no window is opened and the space is stepped
+    as fast as possible. Otherwise the window is drawn simulation.render_fps times per second of the simulation's
+    time (see FramePacer), so several steps are done per drawn frame and frames are dropped when drawing falls
+    behind the real time.
+
+    Every frame (1 / simulation.fps) is split into simulation.substeps steps; events are detected on every step.
+
+    Measurements are timestamped with the simulation's clock (elapsed steps), not the real time.
+    While stepping, events are recorded as raw tuples and converted to Measurements after the run.
+    Stopped frames are reduced to one stop event per cycle (see StopDetector). With the interpolation on
+    (simulation.interpolation config), collision and stop times are localized inside steps.
+
+    With simulation.tolerance set, the headless simulation is stepped adaptively (see AdaptiveStepper):
+    steps are long while the block slides and are refined near the wall and the turning point.
+
     :param space: pymunk.Space
     :param block: pymunk.Body: The block's body.
     :param inp: Input: A user's input.
@@ -114,68 +380,137 @@ def simulate(space: Space, block: Body, inp: Input, model_cycles_amount: int, is
     a list of Measurements from a stop events,
     elapsed duration of a simulation.
     """
-    display = pygame.display.set_mode(CONFIG.resolution)
-    pygame.display.set_caption("InclinedPlane -- SIMULATION")
-    draw_options = pymunk.pygame_util.DrawOptions(display)
-    clock = pygame.time.Clock()
-    logging.debug(f"Set up pygame display: resolution={CONFIG.resolution} fps={CONFIG.fps}")
-
-    vel = inp.velocity.translated()
-    block.apply_impulse_at_world_point((vel.x.value * inp.mass.value, vel.y.value * inp.mass.value),
-                                       translate_abs(0, 0))
-
-    collision_events: list[Measurement] = []
-    stop_events: list[Measurement] = []
-    space.on_collision(
-        1,
-        1,
-        handle_collision,
-        None,
-        None,
-        None,
-        data=collision_events
-    )
-
-    pygame.init()
-
-    start_time = Scalar(round(time(), 2), CONFIG.unit.time)
-    start_measurement = Measurement(start_time.value, block.position, block.velocity)
+    return simulate_lanes(space, [block], [inp], [model_cycles_amount], [is_full])[0]
+
+
+def simulate_lanes(space: Space, blocks: list[Body], inputs: list[Input], model_cycles_amounts: list[int],
+                   is_full: list[bool]) -> list[tuple[list[Measurement], list[Measurement], Scalar]]:
+    """Simulates scenarios of a space initialized with init_lanes (or init_space for one scenario).
+
+    One step of the space advances all lanes (see step_lanes).
+
+    :param space: pymunk.Space
+    :param blocks: list[pymunk.Body]: Bodies of the blocks (one per lane).
+    :param inputs: list[Input]: Users' inputs.
+    :param model_cycles_amounts: list[int]: Expected amounts of cycles based on theoretical results.
+    :param is_full: list[bool]: Are the model cycles full?
+    :returns: Results of simulate for each lane.
+    """
+    lanes = []
+    for lanes in step_lanes(space, blocks, inputs, model_cycles_amounts, is_full):
+        pass
+    return [lane.result for lane in lanes]
+
+
+def stream_cycles(space: Space, block: Body, inp: Input, model_cycles_amount: int, is_full: bool) -> Iterator[Cycle]:
+    """Simulates the scenario like simulate, but yields every cycle as soon as it is complete.
+
+    Final events are taken out of the lane after every step (see Lane.take), so the memory does not grow
+    with the amount of cycles.
+
+    :param space: pymunk.Space
+    :param block: pymunk.Body: The block's body.
+    :param inp: Input: A user's input.
+    :param model_cycles_amount: int: A expected amount of cycles based on theoretical results.
+    :param is_full: bool: Is the model cycle full?
+    :returns: Iterator of Cycles (lazy).
+    """
+    collector = CycleCollector(is_full)
+    lanes = []
+    for lanes in step_lanes(space, [block], [inp], [model_cycles_amount], [is_full]):
+        if collector.start is None:
+            collector.collision(lanes[0].start)
+        collisions, stops = lanes[0].take()
+        yield from collector.feed(convert_events(stops), convert_events(collisions))
+    collisions, stops, _ = lanes[0].result
+    yield from collector.feed(stops, collisions[1:])
+
+
+def step_lanes(space: Space, blocks: list[Body], inputs: list[Input], model_cycles_amounts: list[int],
+               is_full: list[bool]) -> Iterator[list[Lane]]:
+    """Steps scenarios of a space initialized with init_lanes (or init_space for one scenario).
+
+    One step of the space advances all lanes. The collision handler of lane i (collision type i + 1) records
+    events of its block only. A lane which meets its end condition is finished (see Lane.result) and removed
+    from the space, so the remaining lanes step faster. Adaptive stepping (simulation.tolerance config) works
+    only with one lane.
+
+    :param space: pymunk.Space
+    :param blocks: list[pymunk.Body]: Bodies of the blocks (one per lane).
+    :param inputs: list[Input]: Users' inputs.
+    :param model_cycles_amounts: list[int]: Expected amounts of cycles based on theoretical results.
+    :param is_full: list[bool]: Are the model cycles full?
+    :returns: Iterator of all lanes, yielded after every step (all lanes are finished when it is exhausted).
+    """
+    if CONFIG.headless:
+        logging.debug(f"Running headless: fps={CONFIG.fps} substeps={CONFIG.substeps} timeout={CONFIG.timeout}")
+    else:
+        display, draw_options, fps_clock = init_display()
+        pacer = FramePacer(render_rate())
+
+    clock = SimulationClock(1 / physics_rate())
+    stepper = None
+    if CONFIG.tolerance is not None:
+        if CONFIG.headless and len(blocks) == 1:
+            stepper = AdaptiveStepper(inputs[0], next(iter(blocks[0].shapes)), find_wall(space), clock.dt,
+                                      CONFIG.tolerance)
+            logging.debug(f"Stepping adaptively: stepper={stepper}")
+        else:
+            logging.warning("Adaptive stepping works only in the headless mode with one lane; "
+                            "stepping with a fixed step.")
+
+    lanes = [Lane(block, inp, cycles, full, clock.time)
+             for block, inp, cycles, full in zip(blocks, inputs, model_cycles_amounts, is_full)]
+    for collision_type, lane in enumerate(lanes, start=1):
+        space.on_collision(
+            collision_type,
+            collision_type,
+            handle_collision,
+            None,
+            None,
+            None,
+            data=(lane.collision_events, clock)
+        )
+
+    if not CONFIG.headless:
+        pygame.init()
+
     logging.info("Running simulation: "
-                 f"start_time={start_time} "
-                 f"start_measurement={start_measurement} "
-                 f"start_pos={block.position} "
-                 f"start_velocity={block.velocity}")
-    running = True
+                 f"headless={CONFIG.headless} "
+                 f"lanes={len(lanes)} "
+                 f"start_time={clock.time} "
+                 f"start_measurements={[str(lane.start) for lane in lanes]}")
+    start_real_time = perf_counter()
+    running = dict(enumerate(lanes))
     while running:
-        curr_time = round(time(), 2)
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-        if (not is_full and len(stop_events) > 10) or (is_full and len(collision_events) >= model_cycles_amount + 1):
-            running = False
-
-        if abs(block.velocity[0]) < (CONFIG.measure_precision * CONFIG.scale) and abs(block.velocity[1]) < (
-                CONFIG.measure_precision * CONFIG.scale):
-            stop_events.append(Measurement(curr_time, block.position, block.velocity))
-            logging.debug(f"Block stop detected: measurement={stop_events[-1]}")
-
-        display.fill((65, 65, 65))
-        space.debug_draw(draw_options)
-        pygame.display.update()
-        clock.tick(CONFIG.fps)
-        space.step(1 / CONFIG.fps)
-    pygame.quit()
-
-    end_time = Scalar(round(time(), 2), CONFIG.unit.time)
-    end_measurement = Measurement(end_time.value, block.position, block.velocity)
-    logging.info(f"Simulation finished: "
-                 f"duration={end_time - start_time} "
-                 f"end_time={end_time} "
-                 f"end_measurement={end_measurement} "
-                 f"wall-block collisions n={len(collision_events)} "
-                 f"block stops n={len(stop_events)}")
-
-    collision_events.insert(0, start_measurement)
-    collision_events.append(end_measurement)
-
-    return collision_events, stop_events, end_time - start_time
+        curr_time = clock.time
+        for i, lane in list(running.items()):
+            if lane.is_finished:
+                lane.result = lane.finish(curr_time)
+                space.remove(lane.block, *lane.block.shapes)
+                del running[i]
+        if not running:
+            break
+        if not CONFIG.headless:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    for lane in running.values():
+                        lane.is_finished = True
+        elif curr_time > CONFIG.timeout:
+            logging.warning(f"Headless simulation timed out: time={curr_time} timeout={CONFIG.timeout}")
+            for lane in running.values():
+                lane.is_finished = True
+
+        for lane in running.values():
+            lane.update(curr_time)
+
+        if not CONFIG.headless and pacer.is_due(curr_time, perf_counter() - start_real_time):
+            draw(space, display, draw_options)
+            fps_clock.tick(render_rate())
+        clock.step(space, stepper.next_dt(blocks[0]) if stepper is not None else None)
+        yield lanes
+    if not CONFIG.headless:
+        pygame.quit()
+        logging.info(f"Simulation rendered: pacer={pacer}")
+
+    logging.info(f"Simulation finished: steps={clock.steps} end_time={clock.time}")
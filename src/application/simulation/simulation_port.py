@@ -0,0 +1,66 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from application.input.model.input import Input
+from application.math.scalar import Scalar
+from application.result.cycle import Cycle, collect_cycles
+from application.simulation.model.measurement import Measurement
+
+
+class SimulationPort(ABC):
+    """Abstract port responsible for simulating a scenario."""
+
+    @abstractmethod
+    def simulate(self, inp: Input, model_cycles_amount: int, is_full: bool) -> \
+            tuple[list[Measurement], list[Measurement], Scalar]:
+        """Simulates the scenario.
+
+        Measurements are in the simulation's coordinates and units (see Input.simulation), so every engine
+        is parsed with the same prepare_simulation_table.
+
+        :param inp: Input: A simulation's input.
+        :param model_cycles_amount: int: A expected amount of cycles based on theoretical results.
+        :param is_full: bool: Is the model cycle full?
+        :returns: A list of Measurements from a collision events (with the start and the end of the simulation),
+        a list of Measurements from a stop events,
+        elapsed duration of a simulation.
+        """
+        pass
+
+    def simulate_batch(self, inputs: list[Input], model_cycles_amounts: list[int], is_full: list[bool]) -> \
+            list[tuple[list[Measurement], list[Measurement], Scalar]]:
+        """Simulates many scenarios. By default they are simulated one by one (see simulate).
+
+        :param inputs: list[Input]: Simulation's inputs.
+        :param model_cycles_amounts: list[int]: Expected amounts of cycles based on theoretical results.
+        :param is_full: list[bool]: Are the model cycles full?
+        :returns: Results of simulate for each scenario.
+        """
+        return [self.simulate(inp, cycles, full) for inp, cycles, full in zip(inputs, model_cycles_amounts, is_full)]
+
+    def stream(self, inp: Input, model_cycles_amount: int, is_full: bool) -> Iterator[Cycle]:
+        """Simulates the scenario and yields its cycles. By default the whole scenario is simulated first
+        (see simulate); engines measuring cycles one by one yield each as soon as it is complete.
+
+        :param inp: Input: A simulation's input.
+        :param model_cycles_amount: int: A expected amount of cycles based on theoretical results.
+        :param is_full: bool: Is the model cycle full?
+        :returns: Iterator of Cycles (lazy).
+        """
+        collisions, stops, _ = self.simulate(inp, model_cycles_amount, is_full)
+        yield from collect_cycles(stops, collisions, is_full)
@@ -0,0 +1,110 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+from math import radians
+
+from pymunk import Space, Body
+
+from application.input.model.input import Input
+from application.simulation.simulation import init_lanes, block_start
+from infrastructure.config.config import CONFIG
+
+POOL_CAPACITY = 16
+
+
+class SpacePool:
+    """A class keeping prepared simulation's spaces for reuse.
+
+    Spaces are keyed by their geometry: tilts of lanes, the scale and the block's size. A space with the same
+    geometry is reused after resetting its blocks, so scenarios sharing tilts (e.g. sweeps ordered by tilt) skip
+    building shapes. At most capacity spaces are kept; the least recently used one is dropped.
+
+    Attributes
+    ----------
+    capacity
+        (int) A maximal amount of kept spaces.
+    spaces
+        (dict[tuple, tuple[Space, list[Body]]]) Kept spaces and their blocks, keyed by geometry
+        (from the least to the most recently used).
+    hits
+        (int) An amount of reused spaces.
+    misses
+        (int) An amount of built spaces.
+    """
+
+    def __init__(self, capacity: int = POOL_CAPACITY):
+        """Constructor.
+
+        :param capacity: int: A maximal amount of kept spaces.
+        """
+        self.capacity: int = capacity
+        self.spaces: dict[tuple, tuple[Space, list[Body]]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def acquire(self, inputs: list[Input]) -> tuple[Space, list[Body]]:
+        """Returns a space with one lane per input (see init_lanes), ready for simulate_lanes.
+
+        :param inputs: list[Input]: Users' inputs (one per lane).
+        :returns: pymunk.Space instance and pymunk.Body instances (bodies of the blocks).
+        """
+        key = (tuple(inp.tilt.value for inp in inputs), CONFIG.scale, CONFIG.block_size)
+        if key in self.spaces:
+            space, blocks = self.spaces.pop(key)
+            for block, inp in zip(blocks, inputs):
+                reset(space, block, inp)
+            self.hits += 1
+            logging.debug(f"Reusing simulation space: key={key} {self}")
+        else:
+            space, blocks = init_lanes(inputs)
+            self.misses += 1
+            if len(self.spaces) >= self.capacity:
+                del self.spaces[next(iter(self.spaces))]
+        self.spaces[key] = space, blocks
+        return space, blocks
+
+    def __getstate__(self):
+        # Kept spaces are not sent to worker processes; each process fills its own pool (POOL).
+        return {"capacity": self.capacity, "spaces": {}, "hits": 0, "misses": 0}
+
+    def __str__(self):
+        return f"SpacePool(spaces={len(self.spaces)} hits={self.hits} misses={self.misses})"
+
+
+POOL = SpacePool()
+
+
+def reset(space: Space, block: Body, inp: Input) -> None:
+    """Puts a block back to its start state for a new input of the same geometry.
+
+    The block is removed from the space and added again, so no contact of the previous run is cached.
+
+    :param space: pymunk.Space: The block's space.
+    :param block: pymunk.Body: The block's body.
+    :param inp: Input: A user's input.
+    """
+    if block.space is not None:
+        space.remove(block, *block.shapes)
+    block.mass = inp.mass.value
+    block.angle = radians(270) - inp.tilt.value
+    block.position = block_start(inp.tilt.value)
+    block.velocity = (0, 0)
+    block.angular_velocity = 0
+    block.force = (0, 0)
+    block.torque = 0
+    for shape in block.shapes:
+        shape.friction = inp.friction.value
+    space.add(block, *block.shapes)
@@ -0,0 +1,31 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+
+
+class SweepSpecError(Exception):
+    """Exception raised when a sweep spec cannot be parsed.
+    Attributes:
+        desc: str: Description of the exception.
+        field: str | None: Spec field that exception refers to.
+    """
+    CODE = "SSE"
+
+    def __init__(self, _desc: str, field: str | None):
+        self.desc = _desc
+        self.field = field
+
+    def __str__(self):
+        return f"{self.desc} (field={self.field} code={self.CODE})"
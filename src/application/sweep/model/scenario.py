@@ -0,0 +1,74 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from application.input.model.input import Input
+from application.result.error import ErrorTable
+from application.result.result_table import ResultTable
+
+
+class Scenario:
+    """A class representing one scenario of a sweep.
+
+    Attributes
+    ----------
+    id
+        (int) Id of the scenario (starting from 1).
+    input
+        (Input) The scenario's input.
+    """
+
+    def __init__(self, _id: int, inp: Input):
+        """Constructor.
+
+        :param _id: int: Id of the scenario.
+        :param inp: Input: The scenario's input.
+        """
+        self.id: int = _id
+        self.input: Input = inp
+
+    def __str__(self):
+        return f"Scenario(id={self.id} input={self.input})"
+
+
+class ScenarioResult:
+    """A class containing results of one scenario of a sweep.
+
+    Attributes
+    ----------
+    scenario
+        (Scenario) The scenario.
+    measured
+        (ResultTable) Results from a simulation.
+    model
+        (ResultTable) Results from a model.
+    error
+        (ErrorTable) Errors.
+    """
+
+    def __init__(self, scenario: Scenario, measured: ResultTable, model: ResultTable, error: ErrorTable):
+        """Constructor.
+
+        :param scenario: Scenario: The scenario.
+        :param measured: ResultTable: Results from a simulation.
+        :param model: ResultTable: Results from a model.
+        :param error: ErrorTable: Errors.
+        """
+        self.scenario: Scenario = scenario
+        self.measured: ResultTable = measured
+        self.model: ResultTable = model
+        self.error: ErrorTable = error
+
+    def __str__(self):
+        return f"ScenarioResult(scenario={self.scenario} cycles={len(self.model)})"
@@ -0,0 +1,191 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pymunk
+
+from application.input.model.input import Input
+from application.result.error import ErrorTable
+from application.result.result_table import ResultTable
+from application.sweep.model.scenario import Scenario, ScenarioResult
+from infrastructure.config.config import CONFIG
+
+ENGINE_VERSION = 1
+VERSION_FILE = "version"
+SUFFIX = ".npz"
+SUFFIX_TEMPORARY = ".tmp"
+MEGABYTE = 1 << 20
+STALE_TEMPORARY = 3600
+
+NUMBER = "number"
+IS_FULL = "is_full"
+TABLES = ("measured", "model")
+
+
+class ResultCache:
+    """An on-disk cache of scenarios' results, one .npz file per scenario.
+
+    An entry is keyed by a hash of the engine's version, the config's fingerprint (see Config.fingerprint)
+    and the scenario's input, so a scenario is found in the cache whatever its id and sweep are. Entries are
+    written atomically, so worker processes can share the cache. The least recently used entries are evicted
+    when the cache is larger than max_size. Entries of another engine's version are removed when the cache is
+    opened (change ENGINE_VERSION when the simulation's results change).
+
+    Attributes
+    ----------
+    path
+        (Path) The cache's directory.
+    max_size
+        (int) The cache's maximal size in bytes.
+    version
+        (str) The engine's version.
+    """
+
+    def __init__(self, path: Path, max_size: int):
+        """Constructor. Opens the cache and removes entries of another engine's version.
+
+        :param path: Path: The cache's directory.
+        :param max_size: int: The cache's maximal size in bytes.
+        """
+        self.path: Path = path
+        self.max_size: int = max_size
+        self.version: str = engine_version()
+        os.makedirs(self.path.absolute(), exist_ok=True)
+        version_file = self.path / VERSION_FILE
+        if not version_file.exists() or version_file.read_text() != self.version:
+            logging.warning(f"Invalidating the result cache: path={self.path.absolute()} version={self.version}")
+            self.clear()
+            version_file.write_text(self.version)
+
+    def key(self, inp: Input) -> str:
+        """Returns a key of a scenario's entry.
+
+        :param inp: Input: The scenario's input.
+        :returns: A hex SHA-256 digest.
+        """
+        values = [inp.tilt.value, inp.mass.value, inp.velocity.value.value, inp.friction.value]
+        return hashlib.sha256(json.dumps([self.version, CONFIG.fingerprint(), values]).encode()).hexdigest()
+
+    def get(self, scenario: Scenario) -> ScenarioResult | None:
+        """Returns the scenario's cached results and marks them as recently used.
+
+        :param scenario: Scenario: The scenario.
+        :returns: The scenario's results or None if they are not cached.
+        """
+        entry = self.path / (self.key(scenario.input) + SUFFIX)
+        try:
+            with np.load(entry) as data:
+                measured, model = (load_table(data, name) for name in TABLES)
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as error:
+            logging.warning(f"Removing a broken result cache entry: path={entry} error={error!r}")
+            entry.unlink(missing_ok=True)
+            return None
+        return ScenarioResult(scenario, measured, model, ErrorTable(measured, model))
+
+    def put(self, result: ScenarioResult) -> None:
+        """Saves the scenario's results.
+
+        :param result: ScenarioResult: The scenario's results.
+        """
+        arrays = {}
+        for name, table in zip(TABLES, (result.measured, result.model)):
+            arrays[f"{name}.{NUMBER}"] = table.number
+            arrays[f"{name}.{IS_FULL}"] = table.is_full
+            arrays.update({f"{name}.{key}": column for key, column in table.columns.items()})
+        with tempfile.NamedTemporaryFile(dir=self.path, suffix=SUFFIX_TEMPORARY, delete=False) as file:
+            try:
+                np.savez(file, **arrays)
+            except BaseException:
+                file.close()
+                os.unlink(file.name)
+                raise
+        try:
+            os.replace(file.name, self.path / (self.key(result.scenario.input) + SUFFIX))
+        except BaseException:
+            os.unlink(file.name)
+            raise
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache is not larger than max_size.
+
+        Temporary files older than STALE_TEMPORARY seconds (left by crashed workers) are removed as well.
+        """
+        stale = time.time() - STALE_TEMPORARY
+        for temporary in self.temporaries():
+            try:
+                if temporary.stat().st_mtime < stale:
+                    temporary.unlink()
+            except FileNotFoundError:
+                continue
+        entries = []
+        for entry in self.entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+        entries.sort()
+        size = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, entry_size, entry in entries:
+            if size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            size -= entry_size
+            evicted += 1
+        logging.info(f"Result cache size: size={size / MEGABYTE:.1f} MB evicted={evicted}")
+
+    def clear(self) -> None:
+        """Removes all entries and temporary files."""
+        for entry in self.entries() + self.temporaries():
+            entry.unlink(missing_ok=True)
+
+    def entries(self) -> list[Path]:
+        """Returns paths of entries."""
+        return [entry for entry in self.path.iterdir() if entry.suffix == SUFFIX]
+
+    def temporaries(self) -> list[Path]:
+        """Returns paths of temporary files of entries being written."""
+        return [entry for entry in self.path.iterdir() if entry.suffix == SUFFIX_TEMPORARY]
+
+
+def engine_version() -> str:
+    """Returns the engine's version (ENGINE_VERSION and pymunk's version)."""
+    return f"{ENGINE_VERSION}-pymunk-{pymunk.version}"
+
+
+def load_table(data, name: str) -> ResultTable:
+    """Loads ResultTable saved by ResultCache.put.
+
+    :param data: The loaded .npz file.
+    :param name: str: Name of the table.
+    :returns: ResultTable.
+    """
+    prefix = name + "."
+    columns = {key[len(prefix):]: data[key] for key in data.files
+               if key.startswith(prefix) and key not in (prefix + NUMBER, prefix + IS_FULL)}
+    return ResultTable(data[prefix + NUMBER], data[prefix + IS_FULL], columns)
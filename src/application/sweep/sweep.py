@@ -0,0 +1,170 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+from math import ceil
+from typing import Iterable, Iterator
+
+from application.input.model.input import Input
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table, prepare_simulation_table
+from application.simulation.simulation_port import SimulationPort
+from application.sweep.model.scenario import Scenario, ScenarioResult
+from application.sweep.result_cache import ResultCache
+from infrastructure.config.config import CONFIG, Config
+from infrastructure.log.util.get_level import FORMAT
+
+CHUNKS_PER_WORKER = 8
+SEQUENTIAL_CHUNK_SIZE = 256
+
+
+def run_scenario(scenario: Scenario, simulation: SimulationPort, cache: ResultCache | None = None) \
+        -> ScenarioResult:
+    """Runs the model, the simulation and the comparison for one scenario.
+
+    :param scenario: Scenario: The scenario.
+    :param simulation: SimulationPort: The simulation's engine.
+    :param cache: ResultCache | None: The result cache (None = no cache).
+    :returns: The scenario's results.
+    """
+    return run_chunk([scenario], simulation, cache)[0]
+
+
+def run_chunk(scenarios: list[Scenario], simulation: SimulationPort, cache: ResultCache | None = None) \
+        -> list[ScenarioResult]:
+    """Runs a chunk of scenarios (a task of a worker process).
+
+    Scenarios found in the cache are not simulated; results of the other ones are saved to the cache.
+
+    :param scenarios: list[Scenario]: Scenarios.
+    :param simulation: SimulationPort: The simulation's engine.
+    :param cache: ResultCache | None: The result cache (None = no cache).
+    :returns: List of scenarios' results (in the order of scenarios).
+    """
+    if cache is None:
+        return simulate_chunk(scenarios, simulation)
+    cached = {}
+    for scenario in scenarios:
+        if (result := cache.get(scenario)) is not None:
+            cached[scenario.id] = result
+    missing = [scenario for scenario in scenarios if scenario.id not in cached]
+    logging.info(f"Found scenarios in the result cache: n={len(cached)}/{len(scenarios)}")
+    simulated = {}
+    if missing:
+        for result in simulate_chunk(missing, simulation):
+            cache.put(result)
+            simulated[result.scenario.id] = result
+    return [cached[scenario.id] if scenario.id in cached else simulated[scenario.id] for scenario in scenarios]
+
+
+def simulate_chunk(scenarios: list[Scenario], simulation: SimulationPort) -> list[ScenarioResult]:
+    """Runs the model, the simulation and the comparison for a chunk of scenarios.
+
+    Scenarios of the chunk are simulated together (see SimulationPort.simulate_batch).
+
+    :param scenarios: list[Scenario]: Scenarios.
+    :param simulation: SimulationPort: The simulation's engine.
+    :returns: List of scenarios' results.
+    """
+    logging.info(f"Running scenarios: n={len(scenarios)} ids={[scenario.id for scenario in scenarios]}")
+    models = [calculate_model_table(scenario.input) for scenario in scenarios]
+    is_full = [bool(model.is_full[0]) for model in models]
+    runs = simulation.simulate_batch([Input.simulation(scenario.input) for scenario in scenarios],
+                                     [len(model) for model in models],
+                                     is_full)
+
+    results = []
+    for scenario, model, full, (collisions, measurements, sim_duration) in zip(scenarios, models, is_full, runs):
+        measured = prepare_simulation_table(measurements, collisions, full)
+        errors = prepare_errors(measured, model)
+        logging.info(f"Finished scenario: id={scenario.id} cycles={len(model)} sim_duration={sim_duration}")
+        results.append(ScenarioResult(scenario, measured, model, errors))
+    return results
+
+
+def init_worker(config: Config) -> None:
+    """Initializes a worker process.
+
+    The module-global config of the worker is replaced with a snapshot of the main process' config.
+    Workers log only warnings and errors to the console.
+
+    :param config: Config: The main process' config snapshot.
+    """
+    CONFIG.load(config)
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter(FORMAT))
+    logger = logging.getLogger()
+    logger.handlers.clear()
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING)
+
+
+def get_workers(workers: int | None) -> int:
+    """Resolves an amount of worker processes.
+
+    :param workers: int | None: Configured amount (None or 0 = amount of CPUs).
+    :returns: Amount of worker processes.
+    """
+    if workers is None or workers == 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def run_sweep(scenarios: Iterable[Scenario], simulation: SimulationPort, workers: int | None = 1,
+              cache: ResultCache | None = None) -> Iterator[ScenarioResult]:
+    """Runs scenarios.
+
+    Scenarios are run in chunks (see run_chunk). With one worker chunks of SEQUENTIAL_CHUNK_SIZE scenarios
+    are run in order. With more workers the scenarios are spread across a process pool in chunks, and results
+    are yielded in the completion order. The cache is evicted (see ResultCache.evict) after every chunk.
+
+    :param scenarios: Iterable[Scenario]: Scenarios.
+    :param simulation: SimulationPort: The simulation's engine (sent to worker processes).
+    :param workers: int | None: An amount of worker processes (None or 0 = amount of CPUs).
+    :param cache: ResultCache | None: The result cache (None = no cache).
+    :returns: Iterator of scenarios' results (lazy).
+    """
+    workers = get_workers(workers)
+    if workers == 1:
+        logging.info(f"Running sweep sequentially: chunk_size={SEQUENTIAL_CHUNK_SIZE}")
+        scenarios = iter(scenarios)
+        while chunk := list(islice(scenarios, SEQUENTIAL_CHUNK_SIZE)):
+            results = run_chunk(chunk, simulation, cache)
+            if cache is not None:
+                cache.evict()
+            yield from results
+        return
+
+    scenarios = list(scenarios)
+    size = max(1, ceil(len(scenarios) / (workers * CHUNKS_PER_WORKER)))
+    chunks = [scenarios[i:i + size] for i in range(0, len(scenarios), size)]
+    if not CONFIG.headless:
+        logging.warning(f"Running a parallel sweep with the simulation's window: workers={workers}")
+    logging.info(f"Running sweep in a process pool: scenarios={len(scenarios)} workers={workers} "
+                 f"chunks={len(chunks)} chunk_size={size}")
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(CONFIG,)) as executor:
+        futures = [executor.submit(run_chunk, chunk, simulation, cache) for chunk in chunks]
+        done = 0
+        for future in as_completed(futures):
+            results = future.result()
+            if cache is not None:
+                cache.evict()
+            done += len(results)
+            logging.info(f"Received sweep results: n={len(results)} done={done}/{len(scenarios)}")
+            yield from results
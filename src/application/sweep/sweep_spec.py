@@ -0,0 +1,151 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import itertools
+import logging
+from pathlib import Path
+
+import yaml
+
+from application.input.exceptions import InputParsingError
+from application.input.model.input import Input, convert_to_scalar
+from application.sweep.exceptions import SweepSpecError
+from application.sweep.model.scenario import Scenario
+
+TILT = "tilt"
+FRICTION = "friction"
+MASS = "mass"
+VELOCITY = "velocity"
+FIELDS = (TILT, FRICTION, MASS, VELOCITY)
+
+START = "start"
+STOP = "stop"
+NUM = "num"
+SCALE = "scale"
+SCALE_LINEAR = "linear"
+SCALE_LOG = "log"
+
+
+def load_sweep_spec(path: Path) -> list[Scenario]:
+    """Loads a sweep spec from a YAML file and expands it into scenarios.
+
+    The spec contains one entry for each Input field (tilt, friction, mass, velocity). An entry is either:
+
+    - a single value,
+
+    - a list of values,
+
+    - a range: {start: a, stop: b, num: n, scale: linear | log} (both ends included).
+
+    Values can be given the same way as in the console (eg. "0.3p" = 0.3 * pi).
+
+    :param path: Path: A spec file's path.
+    :returns: List of Scenarios (cartesian product of all fields' values).
+    """
+    logging.info(f"Loading a sweep spec: path={path.absolute()}")
+    with open(path, "r") as file:
+        spec = yaml.safe_load(file)
+    if not isinstance(spec, dict):
+        raise SweepSpecError("A sweep spec must be a mapping of fields.", None)
+    unknown = set(spec.keys()) - set(FIELDS)
+    if unknown:
+        raise SweepSpecError(f"Unknown sweep spec fields. Given={sorted(unknown)}", None)
+    return expand_spec(spec)
+
+
+def expand_spec(spec: dict) -> list[Scenario]:
+    """Expands a parsed sweep spec into scenarios.
+
+    :param spec: dict: A sweep spec.
+    :returns: List of Scenarios.
+    """
+    values = [expand_field(field, spec.get(field)) for field in FIELDS]
+    scenarios = []
+    for _id, (tilt, friction, mass, velocity) in enumerate(itertools.product(*values), start=1):
+        try:
+            inp = Input.values(tilt, mass, velocity, friction)
+        except InputParsingError as e:
+            logging.error(f"Sweep scenario out of bounds: id={_id} field={e.field.value} desc={e.desc}")
+            raise SweepSpecError(f"Scenario {_id}: {e.desc}", e.field.value.lower())
+        scenarios.append(Scenario(_id, inp))
+    logging.info(f"Expanded a sweep spec: scenarios n={len(scenarios)} "
+                 + " ".join(f"{field}_n={len(v)}" for field, v in zip(FIELDS, values)))
+    return scenarios
+
+
+def expand_field(field: str, entry) -> list[float]:
+    """Expands one sweep spec entry into a list of values.
+
+    :param field: str: Field's name.
+    :param entry: A single value, a list of values or a range dict.
+    :returns: List of values.
+    """
+    if entry is None:
+        raise SweepSpecError("Missing sweep spec field.", field)
+    if isinstance(entry, list):
+        if len(entry) == 0:
+            raise SweepSpecError("Empty list of values.", field)
+        return [get_number(field, value) for value in entry]
+    if isinstance(entry, dict):
+        return get_range(field, entry)
+    return [get_number(field, entry)]
+
+
+def get_range(field: str, entry: dict) -> list[float]:
+    """Expands a range entry into a list of values.
+
+    :param field: str: Field's name.
+    :param entry: dict: {start: a, stop: b, num: n, scale: linear | log}.
+    :returns: List of values.
+    """
+    try:
+        start = get_number(field, entry[START])
+        stop = get_number(field, entry[STOP])
+        num = int(entry[NUM])
+    except (KeyError, TypeError, ValueError):
+        raise SweepSpecError(f"A range needs {START}, {STOP} and {NUM} values. Given={entry}", field)
+    scale = entry.get(SCALE, SCALE_LINEAR)
+    if num < 1:
+        raise SweepSpecError(f"A range needs at least one value. Given={num}", field)
+    if num == 1:
+        return [start]
+    match scale:
+        case "linear":
+            step = (stop - start) / (num - 1)
+            return [start + i * step for i in range(0, num - 1)] + [stop]
+        case "log":
+            if start <= 0 or stop <= 0:
+                raise SweepSpecError(f"A log range needs positive ends. Given={start}, {stop}", field)
+            ratio = (stop / start) ** (1 / (num - 1))
+            return [start * ratio ** i for i in range(0, num - 1)] + [stop]
+        case _:
+            raise SweepSpecError(f"Unknown range scale. Given={scale}", field)
+
+
+def get_number(field: str, value) -> float:
+    """Converts a spec value to a float.
+
+    :param field: str: Field's name.
+    :param value: A number or an unparsed string (eg. "0.3p").
+    :returns: float
+    """
+    if isinstance(value, bool):
+        raise SweepSpecError(f"A value must be a number. Given={value}", field)
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return convert_to_scalar(str(value), None).value
+    except InputParsingError as e:
+        raise SweepSpecError(e.desc, field)
@@ -14,13 +14,22 @@ or implied. See the License for the specific language governing
 permissions and limitations under the License.
 """
 import logging
+from pathlib import Path
 
 from application.input.adapter.console_input_adapter import ConsoleInputAdapter
 from application.output.adapter.csv.csv_output_adapter import CsvOutputAdapter
+from application.output.adapter.fanout.fan_out_output_adapter import FanOutOutputAdapter
+from application.output.adapter.npz.npz_output_adapter import NpzOutputAdapter
+from application.output.adapter.sqlite.sqlite_output_adapter import SqliteOutputAdapter
+from application.simulation.adapter.analytic_simulation_adapter import AnalyticSimulationAdapter
+from application.simulation.adapter.batch_simulation_adapter import BatchSimulationAdapter
+from application.simulation.adapter.pymunk_simulation_adapter import PymunkSimulationAdapter
 from infrastructure.config.config import CONFIG
 from infrastructure.log.adapter.console_log_adapter import ConsoleLogAdapter
 from infrastructure.log.adapter.file_log_adapter import FileLogAdapter
 
+OUTPUT_SUFFIXES = {"CSV": ".csv", "NPZ": ".npz", "SQLITE": ".db"}
+
 
 class AppPorts:
     """Contains ports."""
@@ -29,6 +38,7 @@ class AppPorts:
         self.log = configure_log_port()
         self.input = configures_input_port()
         self.output = configure_output_port()
+        self.simulation = configure_simulation_port()
 
 
 def configure_log_port():
@@ -60,13 +70,61 @@ def configures_input_port():
 
 
 def configure_output_port():
-    """Configures output port."""
-    match CONFIG.output_port:
+    """Configures output port.
+
+    A list of ports is sent to concurrently (see FanOutOutputAdapter); every port writes to output.path
+    with its own suffix (OUTPUT_SUFFIXES).
+    """
+    if not isinstance(CONFIG.output_port, list):
+        return configure_output_adapter(CONFIG.output_port, CONFIG.output_path)
+    if len(CONFIG.output_port) == 0 or len(set(CONFIG.output_port)) < len(CONFIG.output_port):
+        logging.critical("INIT FAIL -- output.port list is empty or has duplicates.")
+        exit(1)
+    logging.info(f"Chosen output configuration: {CONFIG.output_port} queue_size={CONFIG.output_queue_size}")
+    ports = [configure_output_adapter(port, CONFIG.output_path.with_suffix(OUTPUT_SUFFIXES.get(port, "")))
+             for port in CONFIG.output_port]
+    return FanOutOutputAdapter(ports, CONFIG.output_queue_size)
+
+
+def configure_output_adapter(port: str, path: Path):
+    """Configures one output adapter.
+
+    :param port: str: Name of the output port.
+    :param path: Path: Path to the target file.
+    """
+    match port:
         case "CSV":
             logging.info("Chosen output configuration: CSV")
-            if CONFIG.output_path is None:
+            if path is None:
                 logging.critical("INIT FAIL -- no output.path config.")
-            return CsvOutputAdapter(CONFIG.output_path)
+            return CsvOutputAdapter(path)
+        case "NPZ":
+            logging.info("Chosen output configuration: NPZ")
+            if path is None:
+                logging.critical("INIT FAIL -- no output.path config.")
+            return NpzOutputAdapter(path, CONFIG.output_compress)
+        case "SQLITE":
+            logging.info("Chosen output configuration: SQLITE")
+            if path is None:
+                logging.critical("INIT FAIL -- no output.path config.")
+            return SqliteOutputAdapter(path)
         case _:
             logging.critical("INIT FAIL -- unknown output.port config.")
             exit(1)
+
+
+def configure_simulation_port():
+    """Configures simulation port."""
+    match CONFIG.simulation_port:
+        case "PYMUNK":
+            logging.info("Chosen simulation configuration: PYMUNK")
+            return PymunkSimulationAdapter()
+        case "ANALYTIC":
+            logging.info("Chosen simulation configuration: ANALYTIC")
+            return AnalyticSimulationAdapter()
+        case "BATCH":
+            logging.info("Chosen simulation configuration: BATCH")
+            return BatchSimulationAdapter()
+        case _:
+            logging.critical("INIT FAIL -- unknown simulation.port config.")
+            exit(1)
@@ -13,6 +13,8 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied. See the License for the specific language governing
 permissions and limitations under the License.
 """
+import hashlib
+import json
 import logging
 import os
 from math import pi
@@ -20,10 +22,16 @@ from pathlib import Path
 
 import yaml
 
+from infrastructure.config.cache_config import CacheConfig
 from infrastructure.config.config_name import ConfigName
 from infrastructure.config.input_config import InputConfig
+from infrastructure.config.sweep_config import SweepConfig
 from infrastructure.config.unit_config import UnitConfig
 
+REQUIRED = object()
+FINGERPRINT = ("g", "scale", "resolution", "block_size", "fps", "substeps", "timeout", "interpolation", "tolerance",
+               "simulation_port", "measure_precision", "math_precision")
+
 
 class Config:
     """Class contains a config."""
@@ -33,15 +41,26 @@ class Config:
                  log_port: str,
                  log_level: str,
                  log_path: str | None,
-                 output_port: str,
+                 output_port: str | list[str],
                  output_path: str,
+                 output_compress: bool,
+                 output_queue_size: int,
                  resolution: tuple[int, int],
                  scale: int,
                  block_size: int,
                  fps: int,
+                 render_fps: int | None,
+                 substeps: int,
+                 headless: bool,
+                 timeout: float,
+                 interpolation: bool,
+                 tolerance: float | None,
+                 simulation_port: str,
                  g: float,
                  input_config: InputConfig,
-                 unit_config: UnitConfig) -> None:
+                 unit_config: UnitConfig,
+                 sweep_config: SweepConfig,
+                 cache_config: CacheConfig) -> None:
         self.math_precision = math_precision
         self.measure_precision = measure_precision
         self.log_port = log_port
@@ -49,13 +68,24 @@ class Config:
         self.log_path = Path(log_path)
         self.output_port = output_port
         self.output_path = Path(output_path)
+        self.output_compress = output_compress
+        self.output_queue_size = output_queue_size
         self.resolution = resolution
         self.scale = scale
         self.block_size = block_size
         self.fps = fps
+        self.render_fps = render_fps
+        self.substeps = substeps
+        self.headless = headless
+        self.timeout = timeout
+        self.interpolation = interpolation
+        self.tolerance = tolerance
+        self.simulation_port = simulation_port
         self.g = g
         self.input = input_config
         self.unit = unit_config
+        self.sweep = sweep_config
+        self.cache = cache_config
 
     @classmethod
     def default(cls):
@@ -78,13 +108,24 @@ class Config:
                      "./log/log.log",
                      "CSV",
                      "./output.csv",
+                     False,
+                     16,
                      (800, 800),
                      10,
                      40,
                      60,
+                     None,
+                     1,
+                     False,
+                     600,
+                     True,
+                     None,
+                     "PYMUNK",
                      9.81,
                      inp,
-                     UnitConfig())
+                     UnitConfig(),
+                     SweepConfig(None, 1),
+                     CacheConfig(None, 1024))
         logging.debug(f"Default config loaded: config={config}")
         return config
 
@@ -114,6 +155,8 @@ class Config:
         struct.setdefault(ConfigName.output.value, {})
         struct[ConfigName.output.value].setdefault(ConfigName.port.value, self.output_port)
         struct[ConfigName.output.value].setdefault(ConfigName.path.value, self.output_path.__str__())
+        struct[ConfigName.output.value].setdefault(ConfigName.compress.value, self.output_compress)
+        struct[ConfigName.output.value].setdefault(ConfigName.queue_size.value, self.output_queue_size)
 
         struct.setdefault(ConfigName.sim.value, {})
         struct[ConfigName.sim.value].setdefault(ConfigName.resolution.value,
@@ -121,6 +164,23 @@ class Config:
         struct[ConfigName.sim.value].setdefault(ConfigName.scale.value, self.scale)
         struct[ConfigName.sim.value].setdefault(ConfigName.block_size.value, self.block_size)
         struct[ConfigName.sim.value].setdefault(ConfigName.fps.value, self.fps)
+        struct[ConfigName.sim.value].setdefault(ConfigName.render_fps.value, self.render_fps)
+        struct[ConfigName.sim.value].setdefault(ConfigName.substeps.value, self.substeps)
+        struct[ConfigName.sim.value].setdefault(ConfigName.headless.value, self.headless)
+        struct[ConfigName.sim.value].setdefault(ConfigName.timeout.value, self.timeout)
+        struct[ConfigName.sim.value].setdefault(ConfigName.interpolation.value, self.interpolation)
+        struct[ConfigName.sim.value].setdefault(ConfigName.tolerance.value, self.tolerance)
+        struct[ConfigName.sim.value].setdefault(ConfigName.port.value, self.simulation_port)
+
+        struct.setdefault(ConfigName.sweep.value, {})
+        struct[ConfigName.sweep.value].setdefault(ConfigName.path.value,
+                                                  self.sweep.path.__str__() if self.sweep.path is not None else None)
+        struct[ConfigName.sweep.value].setdefault(ConfigName.workers.value, self.sweep.workers)
+
+        struct.setdefault(ConfigName.cache.value, {})
+        struct[ConfigName.cache.value].setdefault(ConfigName.path.value,
+                                                  self.cache.path.__str__() if self.cache.path is not None else None)
+        struct[ConfigName.cache.value].setdefault(ConfigName.max_size.value, self.cache.max_size)
 
         struct.setdefault(ConfigName.math_precision.value, self.math_precision)
         struct.setdefault(ConfigName.measure_precision.value, self.measure_precision)
@@ -139,6 +199,7 @@ class Config:
         if not path.exists():
             logging.warning(f"A config file does not exists; generating a new one: path={path.absolute()}")
             self.generate_file(path)
+        default = Config.default()
         with open(path, "r") as conf:
             config = yaml.safe_load(conf)
             self.math_precision = get_value(config, ConfigName.math_precision)
@@ -151,10 +212,22 @@ class Config:
             self.log_level = get_value(config, ConfigName.log, ConfigName.level)
             self.output_path = Path(get_value(config, ConfigName.output, ConfigName.path))
             self.output_port = get_value(config, ConfigName.output, ConfigName.port)
+            self.output_compress = get_value(config, ConfigName.output, ConfigName.compress,
+                                             default=default.output_compress)
+            self.output_queue_size = get_value(config, ConfigName.output, ConfigName.queue_size,
+                                               default=default.output_queue_size)
             self.resolution = tuple(get_value(config, ConfigName.sim, ConfigName.resolution))
             self.scale = get_value(config, ConfigName.sim, ConfigName.scale)
             self.block_size = get_value(config, ConfigName.sim, ConfigName.block_size)
             self.fps = get_value(config, ConfigName.sim, ConfigName.fps)
+            self.render_fps = get_value(config, ConfigName.sim, ConfigName.render_fps, default=default.render_fps)
+            self.substeps = get_value(config, ConfigName.sim, ConfigName.substeps, default=default.substeps)
+            self.headless = get_value(config, ConfigName.sim, ConfigName.headless, default=default.headless)
+            self.timeout = get_value(config, ConfigName.sim, ConfigName.timeout, default=default.timeout)
+            self.interpolation = get_value(config, ConfigName.sim, ConfigName.interpolation,
+                                           default=default.interpolation)
+            self.tolerance = get_value(config, ConfigName.sim, ConfigName.tolerance, default=default.tolerance)
+            self.simulation_port = get_value(config, ConfigName.sim, ConfigName.port, default=default.simulation_port)
             self.g = get_value(config, ConfigName.g)
             self.input = InputConfig(get_value(config, ConfigName.input, ConfigName.port),
                                      get_value(config, ConfigName.input, ConfigName.min_tilt),
@@ -166,23 +239,51 @@ class Config:
                                      get_value(config, ConfigName.input, ConfigName.max_velocity),
                                      get_value(config, ConfigName.input, ConfigName.max_friction),
                                      self.math_precision)
+            self.sweep = SweepConfig(get_value(config, ConfigName.sweep, ConfigName.path, default=default.sweep.path),
+                                     get_value(config, ConfigName.sweep, ConfigName.workers,
+                                               default=default.sweep.workers))
+            self.cache = CacheConfig(get_value(config, ConfigName.cache, ConfigName.path, default=default.cache.path),
+                                     get_value(config, ConfigName.cache, ConfigName.max_size,
+                                               default=default.cache.max_size))
 
         logging.info(f"Updated the config.")
 
+    def fingerprint(self) -> str:
+        """Returns a hash of the fields that results depend on (physics, the engine and precisions).
+
+        :returns: A hex SHA-256 digest.
+        """
+        fields = {name: getattr(self, name) for name in FINGERPRINT}
+        return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+    def load(self, config) -> None:
+        """Overwrites the Config instance with values of another instance (eg. a snapshot sent to a worker process).
 
-def get_value(config: dict, *names: ConfigName):
+        :param config: Config: A source config.
+        """
+        self.__dict__.update(config.__dict__)
+        logging.debug(f"Loaded the config from a snapshot.")
+
+
+def get_value(config: dict, *names: ConfigName, default=REQUIRED):
     """Gets a value from a config dict loaded from YAML.
 
+    Keys added after a config file was generated may be missing; they take the default value if it is given.
+
     :param config: dict: A config YAML dict.
     :param names: ConfigName: (args) A YAML path to a value (group, group, ..., value).
+    :param default: The value of a missing key (default: the key is required).
 
     :returns: Config value.
     """
     value = config
     log_name = ""
     for name in names:
-        value = value[name.value]
         log_name += name.value + "."
+        if default is not REQUIRED and (not isinstance(value, dict) or name.value not in value):
+            logging.warning(f"Missing in config file: {log_name[:-1]}; using the default value={default}")
+            return default
+        value = value[name.value]
     logging.debug(f"From config file: {log_name[:-1]}={value}")
     return value
 
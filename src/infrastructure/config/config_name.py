@@ -35,12 +35,26 @@ class ConfigName(Enum):
     min_friction = "min_friction"
 
     output = "output"
+    compress = "compress"
+    queue_size = "queue_size"
 
     sim = "simulation"
     resolution = "resolution"
     scale = "scale"
     block_size = "block_size"
     fps = "fps"
+    render_fps = "render_fps"
+    substeps = "substeps"
+    headless = "headless"
+    timeout = "timeout"
+    interpolation = "interpolation"
+    tolerance = "tolerance"
+
+    sweep = "sweep"
+    workers = "workers"
+
+    cache = "cache"
+    max_size = "max_size"
 
     math_precision = "math_precision"
     measure_precision = "measure_precision"
@@ -0,0 +1,23 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from pathlib import Path
+
+
+class SweepConfig:
+    """Sweep config."""
+    def __init__(self, path: str | None, workers: int | None):
+        self.path: Path | None = Path(path) if path is not None else None
+        self.workers: int | None = workers
@@ -13,10 +13,14 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
 or implied. See the License for the specific language governing
 permissions and limitations under the License.
 """
+import multiprocessing
+
 from application.input.model.input import Input
-from application.result.error import prepare_errors
-from application.result.result import prepare_simulation_results, calculate_theoretical_model
-from application.simulation.simulation import init_space, simulate
+from application.result.result import ClosedFormModel
+from application.result.stream import stream_tables
+from application.sweep.result_cache import ResultCache, MEGABYTE
+from application.sweep.sweep import run_sweep
+from application.sweep.sweep_spec import load_sweep_spec
 from infrastructure.app_ports import AppPorts
 from infrastructure.catcher import catcher
 from infrastructure.config.config import CONFIG
@@ -25,6 +29,37 @@ from infrastructure.log.util.pre_logging import init_pre_logging
 from infrastructure.print_banner import print_banner
 
 
+def single_run(ports: AppPorts):
+    """Runs one scenario read from the input port.
+
+    The run is streamed: every cycle is compared with the model and sent to the output as soon as it is measured.
+
+    :param ports: AppPorts: The app's ports.
+    """
+    # Reading input
+    user_input = ports.input.get_input()
+    simulation_input = Input.simulation(user_input)
+
+    # Model
+    model = ClosedFormModel(user_input)
+
+    # Simulation, comparison & sending results
+    cycles = ports.simulation.stream(simulation_input, model.cycles, model.is_full)
+    ports.output.send_output_stream(stream_tables(cycles, model))
+
+
+def sweep_run(ports: AppPorts):
+    """Runs all scenarios of the sweep spec set in the config.
+
+    Results are cached if cache.path is set in the config.
+
+    :param ports: AppPorts: The app's ports.
+    """
+    scenarios = load_sweep_spec(CONFIG.sweep.path)
+    cache = ResultCache(CONFIG.cache.path, CONFIG.cache.max_size * MEGABYTE) if CONFIG.cache.path is not None else None
+    ports.output.send_sweep_output(run_sweep(scenarios, ports.simulation, CONFIG.sweep.workers, cache))
+
+
 @catcher
 def main():
     # Initialization
@@ -34,22 +69,12 @@ def main():
     ports.log.setup()
     print_banner(INIT_CONFIG.version)
 
-    # Reading input
-    user_input = ports.input.get_input()
-    simulation_input = Input.simulation(user_input)
-
-    # Calculating model
-    model = calculate_theoretical_model(user_input)
-    is_full = model[0].is_full
-
-    # Simulation
-    space, block = init_space(simulation_input)
-    collisions, measurements, sim_duration = simulate(space, block, simulation_input, len(model), is_full)
-
-    # Preparing & sending results
-    measured = prepare_simulation_results(measurements, collisions, is_full)
-    errors = prepare_errors(measured, model)
-    ports.output.send_output(measured, model, errors)
+    if CONFIG.sweep.path is None:
+        single_run(ports)
+    else:
+        sweep_run(ports)
 
 
-main()
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
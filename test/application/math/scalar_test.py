@@ -0,0 +1,53 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from application.math.scalar import Scalar
+
+
+# POSITIVE
+def test_scalar_keeps_full_precision():
+    # given
+    a = Scalar(1 / 3, "m")
+
+    # when
+    b = a * 3 - 1
+
+    # then
+    assert a.value == 1 / 3
+    assert b.unit == "m"
+    assert abs(b.value) < 1e-15
+
+
+def test_scalar_rounds_while_comparing():
+    # given
+    a = Scalar(0.10001)
+    b = Scalar(0.1)
+
+    # then
+    assert a == b
+    assert a == 0.1
+    assert not a < b
+    assert a.rounded == 0.1
+    assert str(a) == "0.1"
+
+
+# NEGATIVE
+def test_scalar_operand_not_supported():
+    # given
+    a = Scalar(1)
+
+    # then
+    assert a.__add__("1") is NotImplemented
+    assert a.__eq__(None) is NotImplemented
@@ -0,0 +1,46 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import numpy as np
+
+from application.math.scalar import Scalar
+from application.math.vector import Vector
+
+
+# POSITIVE
+def test_vector_value_is_lazy_and_cached():
+    # given
+    vector = Vector(Scalar(3, "m"), Scalar(4, "m"))
+
+    # when
+    value = vector.value
+
+    # then
+    assert value == Scalar(5, "m")
+    assert vector.value is value
+    assert vector.x == Scalar(3, "m")
+    assert vector.xy == (3, 4)
+
+
+def test_vector_from_arrays():
+    # when
+    vectors = Vector.from_arrays(np.array([3.0, 0.0]), np.array([4.0, -2.0]), "m/s")
+
+    # then
+    assert len(vectors) == 2
+    assert vectors[0].value.value == 5
+    assert abs(vectors[1]) == Vector.from_float(0, 2, "m/s")
+    assert (vectors[1] * 2).y == Scalar(-4, "m/s")
+    assert vectors[1].translated().y == Scalar(2, "m/s")
@@ -0,0 +1,103 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import csv
+from pathlib import Path
+
+import pytest
+
+from application.input.model.input import Input
+from application.output.adapter.csv.csv_output_adapter import CsvOutputAdapter, get_header, get_scenario_header, \
+    SCHEMA
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table, COLUMNS, DURATION1, rounded
+from application.sweep.model.scenario import Scenario, ScenarioResult
+
+
+def parts(n: int):
+    model = calculate_model_table(Input.values(0.7, 1, 5, 0.1))
+    for i in range(0, n):
+        part = model.head(i + 1)
+        part = type(part)(part.number[i:], part.is_full[i:], {key: column[i:] for key, column in part.columns.items()})
+        yield part, part, prepare_errors(part, part)
+
+
+def read(path: Path) -> list[list[str]]:
+    with open(path, newline="") as file:
+        return list(csv.reader(file))
+
+
+# POSITIVE
+def test_send_output_stream(tmp_path: Path):
+    # given
+    adapter = CsvOutputAdapter(tmp_path / "output.csv")
+
+    # when
+    adapter.send_output_stream(parts(3))
+
+    # then
+    rows = read(tmp_path / "output.csv")
+    assert rows[0] == get_header()
+    assert [row[0] for row in rows[1:]] == ["1", "2", "3"]
+
+
+def test_schema_layout():
+    # given
+    measured, model, error = next(parts(1))
+
+    # when
+    row = next(SCHEMA.rows(measured, model, error))
+
+    # then
+    assert len(SCHEMA.header) == len(row) == 2 + 4 * len(COLUMNS)
+    assert SCHEMA.header[:2] == ["cycle_number", DURATION1 + "_measured"]
+    assert SCHEMA.header[1 + 2 * len(COLUMNS):3 + 2 * len(COLUMNS)] == [DURATION1 + "_error", DURATION1 + "_rerror"]
+    assert SCHEMA.header[-1] == "is_full"
+    assert row[0] == 1
+    assert row[1] == rounded(measured.columns[DURATION1][0])
+    assert row[-1] is True
+
+
+def test_send_sweep_output(tmp_path: Path):
+    # given
+    adapter = CsvOutputAdapter(tmp_path / "output.csv")
+    inp = Input.values(0.7, 1, 5, 0.1)
+    results = [ScenarioResult(Scenario(i + 1, inp), *part) for i, part in enumerate(parts(2))]
+
+    # when
+    adapter.send_sweep_output(results)
+
+    # then
+    rows = read(tmp_path / "output.csv")
+    assert rows[0] == get_scenario_header() + get_header()
+    assert [row[:2] for row in rows[1:]] == [["1", str(inp.tilt.rounded)], ["2", str(inp.tilt.rounded)]]
+    assert [row[5] for row in rows[1:]] == ["1", "2"]
+
+
+# NEGATIVE
+def test_send_output_stream_keeps_written_parts(tmp_path: Path):
+    # given
+    adapter = CsvOutputAdapter(tmp_path / "output.csv")
+
+    def interrupted():
+        yield from parts(2)
+        raise KeyboardInterrupt
+
+    # when
+    with pytest.raises(KeyboardInterrupt):
+        adapter.send_output_stream(interrupted())
+
+    # then
+    assert len(read(tmp_path / "output.csv")) == 3
@@ -0,0 +1,142 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+import pytest
+
+from application.input.model.input import Input
+from application.output.adapter.csv.csv_output_adapter import CsvOutputAdapter
+from application.output.adapter.fanout.fan_out_output_adapter import FanOutOutputAdapter
+from application.output.adapter.npz.npz_output_adapter import NpzOutputAdapter, load_npz
+from application.output.output_port import OutputPort
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table
+from application.sweep.model.scenario import Scenario, ScenarioResult
+
+INPUT = Input.values(0.7, 1, 5, 0.1)
+
+
+class RecordingOutputAdapter(OutputPort):
+    def __init__(self, release: threading.Event | None = None, fail_after: int | None = None):
+        self.release = release
+        self.fail_after = fail_after
+        self.received = []
+
+    def send_output(self, measured, model, error) -> None:
+        self.send_output_stream([(measured, model, error)])
+
+    def send_output_stream(self, results: Iterable) -> None:
+        self.send_sweep_output(results)
+
+    def send_sweep_output(self, results: Iterable) -> None:
+        for result in results:
+            if self.release is not None:
+                self.release.wait()
+            if self.fail_after is not None and len(self.received) == self.fail_after:
+                raise IOError("disk full")
+            self.received.append(result)
+
+
+def results(n: int):
+    model = calculate_model_table(INPUT)
+    for i in range(n):
+        yield ScenarioResult(Scenario(i + 1, INPUT), model, model, prepare_errors(model, model))
+
+
+# POSITIVE
+def test_send_sweep_output_to_all_ports(tmp_path: Path):
+    # given
+    adapter = FanOutOutputAdapter([CsvOutputAdapter(tmp_path / "output.csv"),
+                                   NpzOutputAdapter(tmp_path / "output.npz", False)], 2)
+
+    # when
+    adapter.send_sweep_output(results(5))
+
+    # then
+    with open(tmp_path / "output.csv") as file:
+        assert len(file.readlines()) == 1 + 5 * len(calculate_model_table(INPUT))
+    assert sorted(set(load_npz(tmp_path / "output.npz")["scenario_id"].tolist())) == [1, 2, 3, 4, 5]
+
+
+def test_send_output_stream_keeps_order():
+    # given
+    port = RecordingOutputAdapter()
+    adapter = FanOutOutputAdapter([port, RecordingOutputAdapter()], 1)
+
+    # when
+    adapter.send_output_stream(range(100))
+
+    # then
+    assert port.received == list(range(100))
+
+
+def test_slow_port_blocks_producer():
+    # given
+    release = threading.Event()
+    port = RecordingOutputAdapter(release)
+    adapter = FanOutOutputAdapter([port], 2)
+    produced = []
+
+    def producer():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    # when
+    thread = threading.Thread(target=adapter.send_sweep_output, args=(producer(),))
+    thread.start()
+    time.sleep(0.2)
+    blocked = len(produced)
+    release.set()
+    thread.join()
+
+    # then
+    # one result taken by the port, two in the queue and one waiting to be put
+    assert blocked <= 4
+    assert port.received == list(range(10))
+
+
+# NEGATIVE
+def test_failing_port_does_not_block_others():
+    # given
+    failing = RecordingOutputAdapter(fail_after=3)
+    port = RecordingOutputAdapter()
+    adapter = FanOutOutputAdapter([failing, port], 1)
+
+    # when, then
+    with pytest.raises(IOError):
+        adapter.send_sweep_output(range(50))
+    assert failing.received == [0, 1, 2]
+    assert port.received == list(range(50))
+
+
+def test_interrupted_results_are_saved(tmp_path: Path):
+    # given
+    adapter = FanOutOutputAdapter([NpzOutputAdapter(tmp_path / "output.npz", False)], 2)
+
+    def interrupted():
+        yield from results(2)
+        raise KeyboardInterrupt
+
+    # when
+    with pytest.raises(KeyboardInterrupt):
+        adapter.send_sweep_output(interrupted())
+
+    # then
+    assert sorted(set(load_npz(tmp_path / "output.npz")["scenario_id"].tolist())) == [1, 2]
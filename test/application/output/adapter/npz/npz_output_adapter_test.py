@@ -0,0 +1,139 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from application.input.model.input import Input
+from application.output.adapter.npz.npz_output_adapter import NpzOutputAdapter, ColumnSpool, load_npz, SCHEMA
+from application.output.row_schema import get_scenario_header
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table, DURATION1
+from application.sweep.model.scenario import Scenario, ScenarioResult
+
+INPUT = Input.values(0.7, 1, 5, 0.1)
+
+
+def parts(n: int):
+    model = calculate_model_table(INPUT)
+    for i in range(0, n):
+        part = model.head(i + 1)
+        part = type(part)(part.number[i:], part.is_full[i:], {key: column[i:] for key, column in part.columns.items()})
+        yield part, part, prepare_errors(part, part)
+
+
+# POSITIVE
+@pytest.mark.parametrize("compress", [False, True])
+def test_send_output_stream(tmp_path: Path, compress: bool):
+    # given
+    adapter = NpzOutputAdapter(tmp_path / "output.npz", compress)
+    model = calculate_model_table(INPUT)
+
+    # when
+    adapter.send_output_stream(parts(3))
+
+    # then
+    with np.load(tmp_path / "output.npz") as columns:
+        assert sorted(columns.files) == sorted(SCHEMA.header)
+        assert columns["cycle_number"].tolist() == [1, 2, 3]
+        assert columns["is_full"].dtype == bool
+        assert np.array_equal(columns[DURATION1 + "_model"], model.columns[DURATION1][:3])
+
+
+def test_load_npz_memory_maps_uncompressed(tmp_path: Path):
+    # given
+    NpzOutputAdapter(tmp_path / "output.npz", False).send_output_stream(parts(3))
+
+    # when
+    columns = load_npz(tmp_path / "output.npz")
+
+    # then
+    with np.load(tmp_path / "output.npz") as loaded:
+        for name in loaded.files:
+            assert isinstance(columns[name], np.memmap)
+            assert np.array_equal(columns[name], loaded[name], equal_nan=True)
+
+
+def test_load_npz_reads_compressed(tmp_path: Path):
+    # given
+    NpzOutputAdapter(tmp_path / "output.npz", True).send_output_stream(parts(3))
+
+    # when
+    columns = load_npz(tmp_path / "output.npz")
+
+    # then
+    assert not isinstance(columns["cycle_number"], np.memmap)
+    assert columns["cycle_number"].tolist() == [1, 2, 3]
+
+
+def test_send_sweep_output(tmp_path: Path):
+    # given
+    adapter = NpzOutputAdapter(tmp_path / "output.npz", False)
+    results = [ScenarioResult(Scenario(i + 1, INPUT), *part) for i, part in enumerate(parts(2))]
+
+    # when
+    adapter.send_sweep_output(results)
+
+    # then
+    columns = load_npz(tmp_path / "output.npz")
+    assert set(get_scenario_header()) <= set(columns)
+    assert columns["scenario_id"].tolist() == [1, 2]
+    assert columns["scenario_id"].dtype == np.int64
+    assert columns["tilt"].tolist() == [INPUT.tilt.value] * 2
+
+
+# NEGATIVE
+def test_send_output_stream_keeps_finished_parts(tmp_path: Path):
+    # given
+    adapter = NpzOutputAdapter(tmp_path / "output.npz", False)
+
+    def interrupted():
+        yield from parts(2)
+        raise KeyboardInterrupt
+
+    # when
+    with pytest.raises(KeyboardInterrupt):
+        adapter.send_output_stream(interrupted())
+
+    # then
+    assert load_npz(tmp_path / "output.npz")["cycle_number"].tolist() == [1, 2]
+
+
+def test_failed_save_keeps_original_error(tmp_path: Path, monkeypatch):
+    # given
+    adapter = NpzOutputAdapter(tmp_path / "output.npz", False)
+
+    def save(spool, path, compress):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(ColumnSpool, "save", save)
+
+    def interrupted():
+        yield from parts(2)
+        raise KeyboardInterrupt
+
+    # when, then
+    with pytest.raises(KeyboardInterrupt):
+        adapter.send_output_stream(interrupted())
+
+
+def test_send_output_stream_empty(tmp_path: Path):
+    # when
+    NpzOutputAdapter(tmp_path / "output.npz", False).send_output_stream([])
+
+    # then
+    assert len(load_npz(tmp_path / "output.npz")["cycle_number"]) == 0
@@ -0,0 +1,127 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from application.input.model.input import Input
+from application.output.adapter.sqlite import sqlite_output_adapter
+from application.output.adapter.sqlite.sqlite_output_adapter import SqliteOutputAdapter
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table
+from application.sweep.model.scenario import Scenario, ScenarioResult
+from infrastructure.config.config import CONFIG
+
+QUERY = ("SELECT scenario.id FROM scenario JOIN cycle ON cycle.scenario = scenario.id "
+         "WHERE scenario.tilt BETWEEN ? AND ? AND cycle.cycle_number = 1 AND cycle.duration_rerror > ?")
+
+
+def parts(n: int, inp: Input = Input.values(0.7, 1, 5, 0.1)):
+    model = calculate_model_table(inp)
+    for i in range(0, n):
+        part = model.head(i + 1)
+        part = type(part)(part.number[i:], part.is_full[i:], {key: column[i:] for key, column in part.columns.items()})
+        yield part, part, prepare_errors(part, part)
+
+
+def sweep(tilts: list[float]):
+    for i, tilt in enumerate(tilts):
+        inp = Input.values(tilt, 1, 5, 0.1)
+        model = calculate_model_table(inp)
+        measured = type(model)(model.number, model.is_full, {key: column * (1 + tilt / 10)
+                                                             for key, column in model.columns.items()})
+        yield ScenarioResult(Scenario(i + 1, inp), measured, model, prepare_errors(measured, model))
+
+
+def query(path: Path, sql: str, parameters=()) -> list:
+    with closing(sqlite3.connect(path)) as connection:
+        return connection.execute(sql, parameters).fetchall()
+
+
+# POSITIVE
+def test_send_output_stream(tmp_path: Path):
+    # given
+    adapter = SqliteOutputAdapter(tmp_path / "output.db")
+
+    # when
+    adapter.send_output_stream(parts(3))
+    adapter.send_output_stream(parts(2))
+
+    # then
+    path = tmp_path / "output.db"
+    assert query(path, "SELECT id, config_hash FROM run") == [(1, CONFIG.fingerprint()), (2, CONFIG.fingerprint())]
+    assert query(path, "SELECT scenario, cycle_number, is_full FROM cycle") \
+           == [(1, 1, 1), (1, 2, 1), (1, 3, 1), (2, 1, 1), (2, 2, 1)]
+    assert query(path, "PRAGMA journal_mode") == [("wal",)]
+
+
+def test_scenarios_join_runs_by_config_hash(tmp_path: Path):
+    # given
+    SqliteOutputAdapter(tmp_path / "output.db").send_sweep_output(sweep([0.3, 0.5]))
+
+    # when
+    rows = query(tmp_path / "output.db", "SELECT scenario.scenario_id FROM scenario JOIN run ON scenario.run = run.id "
+                                         "WHERE run.config_hash = ?", (CONFIG.fingerprint(),))
+
+    # then
+    assert rows == [(1,), (2,)]
+
+
+def test_send_sweep_output(tmp_path: Path, monkeypatch):
+    # given
+    monkeypatch.setattr(sqlite_output_adapter, "TRANSACTION_ROWS", 10)
+    adapter = SqliteOutputAdapter(tmp_path / "output.db")
+    tilts = [0.3, 0.5, 0.7, 0.9]
+
+    # when
+    adapter.send_sweep_output(sweep(tilts))
+
+    # then
+    path = tmp_path / "output.db"
+    assert [row[0] for row in query(path, "SELECT tilt FROM scenario ORDER BY scenario_id")] == tilts
+    assert query(path, QUERY, (0.4, 0.8, 0.05)) == [(3,)]
+    assert query(path, "SELECT count(*) FROM cycle")[0][0] == sum(len(result.error) for result in sweep(tilts))
+
+
+def test_query_uses_indexes(tmp_path: Path):
+    # given
+    SqliteOutputAdapter(tmp_path / "output.db").send_sweep_output(sweep([0.3, 0.5, 0.7]))
+
+    # when
+    plan = [row[-1] for row in query(tmp_path / "output.db", "EXPLAIN QUERY PLAN " + QUERY, (0.4, 0.8, 0.05))]
+
+    # then
+    assert plan[0].startswith("SEARCH scenario USING COVERING INDEX scenario_tilt")
+    assert plan[1].startswith("SEARCH cycle USING PRIMARY KEY")
+
+
+# NEGATIVE
+def test_send_sweep_output_keeps_finished_scenarios(tmp_path: Path):
+    # given
+    adapter = SqliteOutputAdapter(tmp_path / "output.db")
+
+    def interrupted():
+        yield from sweep([0.3, 0.5])
+        raise KeyboardInterrupt
+
+    # when
+    with pytest.raises(KeyboardInterrupt):
+        adapter.send_sweep_output(interrupted())
+
+    # then
+    assert query(tmp_path / "output.db", "SELECT scenario_id FROM scenario") == [(1,), (2,)]
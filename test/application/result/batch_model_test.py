@@ -0,0 +1,60 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import pytest
+
+from application.input.model.input import Input
+from application.result.batch_model import BatchModel
+from application.result.result import ClosedFormModel
+
+
+@pytest.fixture
+def inputs() -> list[Input]:
+    return [Input.values(0.7, 1, 5, 0.1),
+            Input.values(0.4, 2, 3, 0.2),
+            Input.values(0.3, 1, 2, 0.5),
+            Input.values(1.2, 1, 10, 0.9)]
+
+
+# POSITIVE
+def test_batch_model_matches_model(inputs: list[Input]):
+    # given
+    models = [ClosedFormModel(inp) for inp in inputs]
+
+    # when
+    batch = BatchModel.from_inputs(inputs)
+
+    # then
+    assert list(batch.cycles) == [len(model) for model in models]
+    assert list(batch.is_full) == [model.is_full for model in models]
+    for i, model in enumerate(models):
+        cycles = slice(batch.offsets[i], batch.offsets[i + 1])
+        for expected, duration, start_velocity, reach in zip(model, batch.duration[cycles],
+                                                             batch.start_velocity[cycles], batch.reach[cycles]):
+            assert duration == pytest.approx(expected.duration.value, abs=1e-3)
+            assert start_velocity == pytest.approx(expected.start_velocity.value.value, abs=1e-3)
+            assert reach == pytest.approx(expected.reach.value.value, abs=1e-3)
+
+
+def test_batch_model_cycles_layout(inputs: list[Input]):
+    # when
+    batch = BatchModel.from_inputs(inputs)
+
+    # then
+    assert batch.offsets[-1] == batch.cycles.sum() == batch.duration1.size
+    for i in range(0, len(batch)):
+        cycles = slice(batch.offsets[i], batch.offsets[i + 1])
+        assert list(batch.number[cycles]) == list(range(1, batch.cycles[i] + 1))
+        assert (batch.scenario[cycles] == i).all()
@@ -0,0 +1,103 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import math
+
+import pytest
+
+from application.input.model.input import Input
+from application.output.adapter.csv.csv_output_adapter import get_rows
+from application.result.batch_model import BatchModel
+from application.result.error import prepare_errors
+from application.result.result import ClosedFormModel
+from application.result.result_table import calculate_model_table, ResultTable, DURATION, START_VELOCITY, \
+    END_VELOCITY, SUFFIX_VALUE, SUFFIX_X, COLUMNS
+from infrastructure.config.config import CONFIG
+
+
+@pytest.fixture
+def inputs() -> list[Input]:
+    return [Input.values(0.7, 1, 5, 0.1),
+            Input.values(0.3, 1, 2, 0.5)]
+
+
+# POSITIVE
+def test_model_table_matches_model(inputs: list[Input]):
+    for inp in inputs:
+        # given
+        model = list(ClosedFormModel(inp))
+
+        # when
+        table = calculate_model_table(inp)
+
+        # then
+        assert len(table) == len(model)
+        for i, expected in enumerate(model):
+            result = table.result(i)
+            assert result.number == expected.number
+            assert result.is_full == expected.is_full
+            assert result.duration.value == pytest.approx(expected.duration.value, abs=1e-3)
+            assert result.end_velocity.x.value == pytest.approx(expected.end_velocity.x.value, abs=1e-3)
+            assert result.reach.value.value == pytest.approx(expected.reach.value.value, abs=1e-3)
+
+
+def test_batch_model_table_matches_model_table(inputs: list[Input]):
+    # given
+    batch = BatchModel.from_inputs(inputs)
+
+    for i, inp in enumerate(inputs):
+        # when
+        table = batch.table(i)
+        expected = calculate_model_table(inp)
+
+        # then
+        assert list(table.number) == list(expected.number)
+        for key, column in expected.columns.items():
+            assert table.columns[key] == pytest.approx(column, abs=1e-3, nan_ok=True)
+
+
+def test_errors_are_paired_by_order():
+    # given
+    model = ResultTable.from_values([1, 2, 3], [True] * 3, [1, 1, 1], [1, 1, 1], ([2, 2, 2], [0, 0, 0]),
+                                    ([-1, -1, -1], [0, 0, 0]), ([1, 1, 1], [0, 0, 0]))
+    measured = ResultTable.from_values([1, 2], [True] * 2, [1.5, 1], [1, 1], ([4, 0], [0, 0]),
+                                       ([-1, -1], [0, 0]), ([1, 1], [0, 0]))
+
+    # when
+    errors = prepare_errors(measured, model)
+
+    # then
+    assert len(errors) == 2
+    assert list(errors.abs[DURATION]) == [0.5, 0]
+    assert list(errors.rel[DURATION]) == pytest.approx([0.2, 0])
+    assert list(errors.abs[END_VELOCITY + SUFFIX_X]) == [0, 0]
+    assert errors.rel[END_VELOCITY + SUFFIX_VALUE][0] == 0
+    assert math.isnan(errors.rel[START_VELOCITY + SUFFIX_VALUE][1])
+
+
+def test_tables_keep_full_precision():
+    # given
+    third = 1 / 3
+
+    # when
+    table = ResultTable.from_values([1], [True], [third], [third], ([third], [0]), ([-third], [0]), ([third], [0]))
+    errors = prepare_errors(table, ResultTable.from_values([1], [True], [0], [0], ([0], [0]), ([0], [0]),
+                                                           ([0], [0])))
+    row = next(get_rows(table, table, errors))
+
+    # then
+    assert table.columns[DURATION][0] == 2 * third
+    assert errors.abs[DURATION][0] == 2 * third
+    assert row[COLUMNS.index(DURATION) + 1] == round(2 * third, CONFIG.math_precision)
@@ -0,0 +1,87 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import pytest
+
+from application.input.model.input import Input
+from application.result.result import ClosedFormModel, Result, cycles_amount
+from infrastructure.config.config import CONFIG
+
+
+# POSITIVE
+def test_closed_form_model_matches_recurrence():
+    # given
+    inp = Input.values(0.7, 1, 5, 0.1)
+    results = [Result.model(1, inp.velocity, inp.tilt.value, inp.friction.value, CONFIG.g, True)]
+    while results[-1].end_velocity.value.value > CONFIG.measure_precision:
+        results.append(Result.model(len(results) + 1, results[-1].end_velocity, inp.tilt.value,
+                                    inp.friction.value, CONFIG.g, True))
+
+    # when
+    model = ClosedFormModel(inp)
+
+    # then
+    assert len(model) == len(results)
+    for expected, result in zip(results, model):
+        assert result.number == expected.number
+        assert result.duration.value == pytest.approx(expected.duration.value, abs=1e-3)
+        assert result.end_velocity.value.value == pytest.approx(expected.end_velocity.value.value, abs=1e-3)
+        assert result.reach.x.value == pytest.approx(expected.reach.x.value, abs=1e-3)
+
+
+def test_closed_form_model_random_access():
+    # given
+    model = ClosedFormModel(Input.values(0.7, 1, 5, 0.01), precision=1e-9)
+
+    # when
+    last = model.cycle(model.cycles)
+
+    # then
+    assert model.cycles > 1000
+    assert last.number == model.cycles
+    assert model.start_velocity(model.cycles) * model.ratio <= 1e-9 < model.start_velocity(model.cycles)
+
+
+def test_closed_form_model_not_full():
+    # when
+    model = ClosedFormModel(Input.values(0.3, 1, 2, 0.5))
+
+    # then
+    assert not model.is_full
+    assert len(model) == 1
+    assert list(model)[0].end_velocity.value.value == 0
+
+
+def test_cycles_amount_boundaries():
+    assert cycles_amount(1, 0.5, 0.25) == 2
+    assert cycles_amount(1, 0.5, 0.2) == 3
+    assert cycles_amount(1, 0.5, 1) == 1
+
+
+# NEGATIVE
+def test_closed_form_model_cycle_out_of_range():
+    # given
+    model = ClosedFormModel(Input.values(0.7, 1, 5, 0.1))
+
+    # when, then
+    with pytest.raises(IndexError):
+        model.cycle(model.cycles + 1)
+    with pytest.raises(IndexError):
+        model.cycle(0)
+
+
+def test_cycles_amount_infinite():
+    with pytest.raises(ValueError):
+        cycles_amount(1, 1, 0.1)
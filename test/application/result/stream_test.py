@@ -0,0 +1,80 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from pymunk import Vec2d
+
+from application.input.model.input import Input
+from application.output.adapter.csv.csv_output_adapter import get_rows
+from application.result.cycle import CycleCollector
+from application.result.error import prepare_errors
+from application.result.result import ClosedFormModel
+from application.result.result_table import calculate_model_table, prepare_simulation_table
+from application.result.stream import stream_tables
+from application.simulation.adapter.pymunk_simulation_adapter import PymunkSimulationAdapter
+from application.simulation.model.measurement import Measurement
+
+
+def measurement(time: float, speed: float) -> Measurement:
+    return Measurement(time, Vec2d(0, 0), Vec2d(speed, 0))
+
+
+# POSITIVE
+def test_stream_matches_tables():
+    # given
+    inp = Input.values(0.5, 1, 8, 0.2)
+    model = ClosedFormModel(inp)
+    table = calculate_model_table(inp)
+
+    # when
+    streamed = [row for part in stream_tables(PymunkSimulationAdapter().stream(Input.simulation(inp), model.cycles,
+                                                                                  model.is_full), model)
+                for row in get_rows(*part)]
+    collisions, stops, _ = PymunkSimulationAdapter().simulate(Input.simulation(inp), model.cycles, model.is_full)
+    measured = prepare_simulation_table(stops, collisions, model.is_full)
+    rows = list(get_rows(measured, table, prepare_errors(measured, table)))
+
+    # then
+    assert streamed == rows
+    assert len(rows) == model.cycles
+
+
+def test_stream_yields_cycles_one_by_one():
+    # given
+    inp = Input.values(0.5, 1, 8, 0.2)
+    model = ClosedFormModel(inp)
+
+    # when
+    cycles = PymunkSimulationAdapter().stream(Input.simulation(inp), model.cycles, model.is_full)
+    first = next(cycles)
+    rest = list(cycles)
+
+    # then
+    assert first.number == 1
+    assert [cycle.number for cycle in rest] == list(range(2, len(rest) + 2))
+    assert len(rest) >= model.cycles - 1
+
+
+def test_cycle_collector_feeds_events_by_time():
+    # given
+    collector = CycleCollector(True)
+    collisions = [measurement(0, 5), measurement(2, 4), measurement(4, 3)]
+    stops = [measurement(1, 0.5), measurement(1.5, 0.1), measurement(2, 0), measurement(3, 0.2)]
+
+    # when
+    cycles = list(collector.feed(stops[:2], collisions[:2])) + list(collector.feed(stops[2:], collisions[2:]))
+
+    # then
+    assert [cycle.middle.time.value for cycle in cycles] == [1.5, 2]
+    assert [cycle.number for cycle in cycles] == [1, 2]
@@ -0,0 +1,89 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import numpy as np
+
+from application.input.model.input import Input
+from application.result.result_table import calculate_model_table, prepare_simulation_table, DURATION1, DURATION2, \
+    REACH, END_VELOCITY, SUFFIX_VALUE
+from application.simulation.adapter.analytic_simulation_adapter import AnalyticSimulationAdapter
+from application.simulation.adapter.pymunk_simulation_adapter import PymunkSimulationAdapter
+from application.simulation.simulation_port import SimulationPort
+
+
+def run(simulation: SimulationPort, inp: Input):
+    model = calculate_model_table(inp)
+    is_full = bool(model.is_full[0])
+    collisions, stops, duration = simulation.simulate(Input.simulation(inp), len(model), is_full)
+    return prepare_simulation_table(stops, collisions, is_full), model
+
+
+# POSITIVE
+def test_analytic_simulation_matches_model():
+    # given
+    inp = Input.values(0.5, 1, 8, 0.2)
+
+    # when
+    measured, model = run(AnalyticSimulationAdapter(), inp)
+
+    # then
+    assert len(measured) == len(model)
+    for key in (DURATION1, DURATION2, REACH + SUFFIX_VALUE, END_VELOCITY + SUFFIX_VALUE):
+        np.testing.assert_allclose(measured.columns[key], model.columns[key], atol=1e-3)
+
+
+def test_analytic_simulation_ends_after_bounce():
+    # given
+    inp = Input.values(0.5, 1, 8, 0.2)
+    model = calculate_model_table(inp)
+
+    # when
+    collisions, stops, duration = AnalyticSimulationAdapter().simulate(Input.simulation(inp), len(model), True)
+
+    # then
+    last, end = collisions[-2:]
+    assert len(collisions) == len(model) + 2
+    assert end.time.value == last.time.value == duration.value
+    assert end.velocity.x.value == -last.velocity.x.value
+    assert end.velocity.y.value == -last.velocity.y.value
+
+
+def test_analytic_simulation_not_full():
+    # given
+    inp = Input.values(0.3, 1, 2, 0.5)
+
+    # when
+    measured, model = run(AnalyticSimulationAdapter(), inp)
+
+    # then
+    assert len(measured) == len(model) == 1
+    assert not measured.is_full[0]
+    np.testing.assert_allclose(measured.columns[DURATION1], model.columns[DURATION1], atol=1e-3)
+    np.testing.assert_allclose(measured.columns[REACH + SUFFIX_VALUE], model.columns[REACH + SUFFIX_VALUE], atol=1e-3)
+
+
+def test_engines_emit_same_streams():
+    # given
+    inp = Input.values(0.7, 1, 5, 0.1)
+
+    # when
+    analytic, model = run(AnalyticSimulationAdapter(), inp)
+    pymunk, _ = run(PymunkSimulationAdapter(), inp)
+
+    # then
+    assert len(analytic) == len(model) <= len(pymunk)
+    np.testing.assert_allclose(pymunk.columns[DURATION1][:5], analytic.columns[DURATION1][:5], atol=0.05)
+    np.testing.assert_allclose(pymunk.columns[REACH + SUFFIX_VALUE][:5], analytic.columns[REACH + SUFFIX_VALUE][:5],
+                               rtol=0.2)
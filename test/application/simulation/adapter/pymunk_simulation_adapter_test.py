@@ -0,0 +1,84 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import pickle
+
+import pytest
+
+from application.input.model.input import Input
+from application.result.result_table import calculate_model_table
+from application.simulation.adapter.pymunk_simulation_adapter import PymunkSimulationAdapter
+from application.simulation.simulation import init_lanes, MAX_LANES
+from application.simulation.space_pool import POOL
+
+
+def batch(values: list[tuple]) -> tuple[list[Input], list[int], list[bool]]:
+    models = [calculate_model_table(Input.values(*v)) for v in values]
+    return ([Input.simulation(Input.values(*v)) for v in values], [len(model) for model in models],
+            [bool(model.is_full[0]) for model in models])
+
+
+def times(run) -> tuple[list[float], list[float], float]:
+    collisions, stops, duration = run
+    return [m.time.value for m in collisions], [m.time.value for m in stops], duration.value
+
+
+# POSITIVE
+def test_lanes_match_single_runs():
+    # given
+    inputs, cycles, is_full = batch([(0.7, 1, 5, 0.1), (0.5, 1, 8, 0.2), (0.3, 1, 2, 0.5), (0.5, 1, 8, 0.2)])
+    adapter = PymunkSimulationAdapter()
+
+    # when
+    lanes = adapter.simulate_batch(inputs, cycles, is_full)
+    single = [adapter.simulate(*args) for args in zip(inputs, cycles, is_full)]
+
+    # then
+    assert [times(run) for run in lanes] == [times(run) for run in single]
+
+
+def test_lanes_split_into_spaces():
+    # given
+    inputs, cycles, is_full = batch([(0.3, 1, 2, 0.5)] * (MAX_LANES + 1))
+
+    # when
+    runs = PymunkSimulationAdapter().simulate_batch(inputs, cycles, is_full)
+
+    # then
+    assert len(runs) == MAX_LANES + 1
+    assert len({tuple(times(run)[1]) for run in runs}) == 1
+
+
+def test_pool_outlives_pickled_adapters():
+    # given
+    inputs, cycles, is_full = batch([(0.7, 1, 5, 0.1)])
+    pickle.loads(pickle.dumps(PymunkSimulationAdapter())).simulate_batch(inputs, cycles, is_full)
+    hits = POOL.hits
+
+    # when
+    pickle.loads(pickle.dumps(PymunkSimulationAdapter())).simulate_batch(inputs, cycles, is_full)
+
+    # then
+    assert POOL.hits == hits + 1
+
+
+# NEGATIVE
+def test_too_many_lanes():
+    # given
+    inputs, _, _ = batch([(0.3, 1, 2, 0.5)] * (MAX_LANES + 1))
+
+    # when, then
+    with pytest.raises(ValueError):
+        init_lanes(inputs)
@@ -0,0 +1,109 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import numpy as np
+import pytest
+
+from application.input.model.input import Input
+from application.result.result_table import calculate_model_table, COLUMNS
+from application.simulation.batch_simulation import BatchSimulation, time_to_wall
+from infrastructure.config.config import CONFIG
+
+
+@pytest.fixture
+def inputs() -> list[Input]:
+    return [Input.values(0.7, 1, 5, 0.1),
+            Input.values(0.5, 2, 8, 0.2),
+            Input.values(0.3, 1, 2, 0.5),
+            Input.values(1.0, 1, 6, 0.3)]
+
+
+# POSITIVE
+def test_batch_simulation_matches_model(inputs: list[Input]):
+    # given
+    simulation = BatchSimulation.from_inputs(inputs)
+
+    # when
+    simulation.run()
+
+    # then
+    for i, inp in enumerate(inputs):
+        model = calculate_model_table(inp)
+        measured = simulation.table(i)
+        assert len(measured) == len(model)
+        assert list(measured.is_full) == list(model.is_full)
+        for column in COLUMNS:
+            np.testing.assert_allclose(measured.columns[column], model.columns[column], atol=1e-3)
+
+
+def test_batch_simulation_events_layout(inputs: list[Input]):
+    # given
+    simulation = BatchSimulation.from_inputs(inputs)
+
+    # when
+    simulation.run()
+
+    # then
+    assert simulation.collision_offsets[-1] == simulation.collision_time.size
+    assert simulation.stop_offsets[-1] == simulation.stop_time.size
+    assert list(np.diff(simulation.collision_offsets)) == [33, 12, 0, 21]
+    assert (simulation.collision_velocity < 0).all()
+    for i in range(0, len(simulation)):
+        events = slice(simulation.collision_offsets[i], simulation.collision_offsets[i + 1])
+        assert (np.diff(simulation.collision_time[events]) > 0).all()
+    assert simulation.end_time[2] > simulation.stop_time[simulation.stop_offsets[2]]
+
+
+def test_time_to_wall():
+    # given
+    distance = np.array([10, 0, 10])
+    speed = np.array([2, 1, 0])
+    acceleration = np.array([4, 1, 0])
+
+    # when
+    time = time_to_wall(distance, speed, acceleration)
+
+    # then
+    assert time[0] == pytest.approx(-0.5 + np.sqrt(0.25 + 5))
+    assert time[1] == 0
+    assert time[2] == np.inf
+
+
+def test_batch_simulation_rests_at_wall():
+    # given
+    simulation = BatchSimulation([0.7], [0.1], [5], [10 ** 6], precision=0.1)
+
+    # when
+    simulation.run()
+
+    # then
+    assert 0 < simulation.collision_offsets[-1] < 10 ** 6
+    assert -simulation.collision_velocity[-1] < 0.1
+    assert (-simulation.collision_velocity[:-1] >= 0.1).all()
+
+
+# NEGATIVE
+def test_batch_simulation_timeout(monkeypatch):
+    # given
+    monkeypatch.setattr(CONFIG, "timeout", 5)
+    simulation = BatchSimulation([0.7], [0.1], [5], [10 ** 6])
+
+    # when
+    simulation.run()
+
+    # then
+    assert 5 < simulation.end_time[0] <= 5 + simulation.dt
+    assert (simulation.collision_time <= simulation.end_time[0]).all()
+    assert simulation.collision_offsets[-1] < 10 ** 6
@@ -0,0 +1,63 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import pymunk
+import pytest
+
+from application.input.model.input import Input
+from application.result.result_table import calculate_model_table
+from application.simulation.model.clock import SimulationClock
+from application.simulation.simulation import init_space, simulate
+from infrastructure.config.config import CONFIG
+
+
+# POSITIVE
+def test_clock_counts_steps():
+    # given
+    clock = SimulationClock(0.25)
+    space = pymunk.Space()
+    body = pymunk.Body(mass=1, moment=1)
+    body.velocity = (4, 0)
+    space.add(body, pymunk.Circle(body, 1))
+
+    # when
+    for _ in range(0, 8):
+        clock.step(space)
+
+    # then
+    assert clock.steps == 8
+    assert clock.time == 2
+    assert body.position.x == pytest.approx(8)
+
+
+def test_clock_stamps_start_and_end_measurements(monkeypatch):
+    # given
+    monkeypatch.setattr(CONFIG, "interpolation", False)
+    inp = Input.values(0.3, 1, 2, 0.5)
+    model = calculate_model_table(inp)
+    simulation_input = Input.simulation(inp)
+    space, block = init_space(simulation_input)
+
+    # when
+    collisions, stops, duration = simulate(space, block, simulation_input, len(model), False)
+
+    # then
+    dt = 1 / CONFIG.fps
+    assert collisions[0].time.value == 0
+    assert collisions[-1].time.value == duration.value
+    steps = round(duration.value / dt)
+    assert duration.value == pytest.approx(steps * dt)
+    for measurement in collisions + stops:
+        assert measurement.time.value == pytest.approx(round(measurement.time.value / dt) * dt)
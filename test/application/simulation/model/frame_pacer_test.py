@@ -0,0 +1,59 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from application.simulation.model.frame_pacer import FramePacer
+
+
+# POSITIVE
+def test_frame_pacer_draws_every_few_steps():
+    # given
+    pacer = FramePacer(20)
+    dt = 1 / 100
+
+    # when
+    drawn = [step for step in range(0, 20) if pacer.is_due(step * dt, step * dt)]
+
+    # then
+    assert drawn == [0, 5, 10, 15]
+    assert pacer.frames == 4
+    assert pacer.dropped == 0
+
+
+def test_frame_pacer_every_step_at_physics_rate():
+    # given
+    pacer = FramePacer(100)
+    dt = 1 / 100
+
+    # when
+    drawn = [step for step in range(0, 10) if pacer.is_due(step * dt, 0)]
+
+    # then
+    assert drawn == list(range(0, 10))
+
+
+# NEGATIVE
+def test_frame_pacer_drops_frames_behind_real_time():
+    # given
+    pacer = FramePacer(20)
+
+    # when
+    late = pacer.is_due(0.5, 0.7)
+    caught_up = pacer.is_due(0.75, 0.76)
+
+    # then
+    assert not late
+    assert caught_up
+    assert pacer.dropped == 1
+    assert pacer.frames == 1
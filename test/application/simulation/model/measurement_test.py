@@ -0,0 +1,48 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import pymunk
+from pymunk import Vec2d
+
+from application.simulation.model.measurement import Measurement, capture, convert_events, rewind
+
+
+# POSITIVE
+def test_raw_event_converts_to_measurement():
+    # given
+    body = pymunk.Body(mass=1, moment=1)
+    body.position = (120, 300)
+    body.velocity = (3, -4)
+
+    # when
+    event = capture(1.5, body)
+    measurements = convert_events([event])
+
+    # then
+    expected = Measurement(1.5, Vec2d(120, 300), Vec2d(3, -4))
+    assert event == (1.5, 120, 300, 3, -4)
+    assert len(measurements) == 1
+    assert measurements[0].time == expected.time
+    assert measurements[0].position == expected.position
+    assert measurements[0].velocity == expected.velocity
+
+
+def test_raw_event_rewind():
+    # when
+    event = rewind((1.0, 10, 20, 4, -2), 0.5)
+
+    # then
+    assert event == (0.5, 8, 21, 4, -2)
+
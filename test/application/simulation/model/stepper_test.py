@@ -0,0 +1,122 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from math import inf, isclose
+
+import pymunk
+
+from application.input.model.input import Input
+from application.simulation.model.clock import SimulationClock
+from application.simulation.model.stepper import AdaptiveStepper, time_to_reach, REFINEMENT
+from application.simulation.simulation import init_space, find_wall
+
+
+def init_stepper(tolerance: float) -> tuple[AdaptiveStepper, pymunk.Space, pymunk.Body]:
+    inp = Input.simulation(Input.values(0.5, 1, 5, 0.2))
+    space, block = init_space(inp)
+    return AdaptiveStepper(inp, next(iter(block.shapes)), find_wall(space), 1 / 60, tolerance), space, block
+
+
+# POSITIVE
+def test_time_to_reach():
+    # given
+    distance, speed, acceleration = 10, 2, 4
+
+    # when
+    time = time_to_reach(distance, speed, acceleration)
+
+    # then
+    assert isclose(speed * time + acceleration * time ** 2 / 2, distance)
+
+
+def test_time_to_reach_never():
+    # given
+    distance, speed, acceleration = 10, 2, -1
+
+    # when
+    time = time_to_reach(distance, speed, acceleration)
+
+    # then
+    assert time == inf
+
+
+def test_stepper_long_steps_while_sliding():
+    # given
+    stepper, space, block = init_stepper(0.01)
+    block.velocity = stepper.direction * 100
+
+    # when
+    steps = [stepper.next_dt(block) for _ in range(3)]
+
+    # then
+    assert stepper.dt_max > 1 / 60
+    assert steps == sorted(steps)
+    assert steps[-1] == stepper.dt_max
+
+
+def test_stepper_short_steps_at_wall():
+    # given
+    stepper, space, block = init_stepper(0.01)
+    block.velocity = stepper.direction * -100
+
+    # when
+    dt = stepper.next_dt(block)
+
+    # then
+    assert stepper.dt_min == 1 / 60 / REFINEMENT
+    assert dt == time_to_reach(stepper.gap(block), 100, stepper.down) + stepper.dt_min
+    assert dt < 1 / 60
+
+
+def test_stepper_long_steps_at_rest():
+    # given
+    stepper, space, block = init_stepper(0.01)
+    block.velocity = (0, 0)
+
+    # when
+    steps = [stepper.next_dt(block) for _ in range(3)]
+
+    # then
+    assert steps[-1] == stepper.dt_max
+
+
+def test_clock_variable_steps():
+    # given
+    clock = SimulationClock(0.1)
+    space = pymunk.Space()
+
+    # when
+    clock.step(space)
+    clock.step(space, 0.5)
+    clock.step(space)
+
+    # then
+    assert clock.steps == 3
+    assert clock.last_dt == 0.1
+    assert isclose(clock.time, 0.7)
+
+
+# NEGATIVE
+def test_stepper_tolerance_below_minimal_step():
+    # given
+    stepper, space, block = init_stepper(0)
+    block.velocity = stepper.direction * 100
+
+    # when
+    dt = stepper.next_dt(block)
+
+    # then
+    assert stepper.dt_max == 1 / 60
+    assert dt == stepper.dt_max
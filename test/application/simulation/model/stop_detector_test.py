@@ -0,0 +1,100 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import pymunk
+
+from application.simulation.model.stop_detector import StopDetector, turning_point
+
+
+def frame(detector: StopDetector, body: pymunk.Body, time: float, velocity: tuple[float, float], cycle: int):
+    body.velocity = velocity
+    detector.update(time, body, cycle)
+
+
+# POSITIVE
+def test_stop_detector_keeps_slowest_frame_per_cycle():
+    # given
+    detector = StopDetector(1)
+    body = pymunk.Body(mass=1, moment=1)
+
+    # when
+    frame(detector, body, 0, (5, 5), 0)
+    frame(detector, body, 1, (0.5, 0.5), 0)
+    frame(detector, body, 2, (0.1, 0), 0)
+    frame(detector, body, 3, (0.1, 0), 0)
+    frame(detector, body, 4, (0.5, 0), 0)
+    frame(detector, body, 5, (5, 0), 1)
+    frame(detector, body, 6, (0, 0.2), 1)
+    events = detector.finish()
+
+    # then
+    assert detector.frames == 5
+    assert [event[0] for event in events] == [2, 6]
+
+
+def test_stop_detector_no_stops():
+    # given
+    detector = StopDetector(1)
+    body = pymunk.Body(mass=1, moment=1)
+
+    # when
+    frame(detector, body, 0, (5, 5), 0)
+
+    # then
+    assert detector.finish() == []
+    assert not detector.is_stopped
+
+
+def test_stop_detector_localizes_turning_point():
+    # given
+    detector = StopDetector(1, 0)
+    body = pymunk.Body(mass=1, moment=1)
+
+    # when
+    frame(detector, body, 0, (6, 0), 0)
+    frame(detector, body, 1, (2, 0), 0)
+    frame(detector, body, 2, (-2, 0), 0)
+    frame(detector, body, 3, (-0.5, 0), 0)
+    events = detector.finish()
+
+    # then
+    assert detector.frames == 1
+    assert len(events) == 1
+    assert events[0][0] == 1.5
+    assert events[0][3] == 0
+
+
+def test_stop_detector_localizes_turning_point_with_deceleration():
+    # given
+    detector = StopDetector(1, 0, 8)
+    body = pymunk.Body(mass=1, moment=1)
+
+    # when
+    frame(detector, body, 0, (6, 0), 0)
+    frame(detector, body, 1, (2, 0), 0)
+    frame(detector, body, 2, (0, 0), 0)
+    events = detector.finish()
+
+    # then
+    assert len(events) == 1
+    assert events[0][0] == 1.25
+
+
+def test_turning_point():
+    # when
+    event = turning_point((1.0, 0, 0, 4, 0), (2.0, 2, 0, -4, 0), 0.5)
+
+    # then
+    assert event == (1.5, 1, 0, 0, 0)
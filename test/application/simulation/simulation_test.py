@@ -0,0 +1,129 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import pytest
+
+from application.input.model.input import Input
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table, prepare_simulation_table, DURATION1
+from application.simulation import simulation
+from application.simulation.model.clock import SimulationClock
+from application.simulation.simulation import init_space, simulate
+from infrastructure.config.config import CONFIG
+
+
+def run(inp: Input):
+    model = calculate_model_table(inp)
+    simulation_input = Input.simulation(inp)
+    space, block = init_space(simulation_input)
+    return simulate(space, block, simulation_input, len(model), bool(model.is_full[0])), model
+
+
+def turning_error(inp: Input, monkeypatch, **config) -> tuple[float, int]:
+    clocks = []
+
+    class RecordingClock(SimulationClock):
+        def __init__(self, dt: float):
+            super().__init__(dt)
+            clocks.append(self)
+
+    monkeypatch.setattr(simulation, "SimulationClock", RecordingClock)
+    for key, value in config.items():
+        monkeypatch.setattr(CONFIG, key, value)
+    (collisions, stops, duration), model = run(inp)
+    errors = prepare_errors(prepare_simulation_table(stops, collisions, bool(model.is_full[0])), model)
+    return float(errors.rel[DURATION1][0]), clocks[0].steps
+
+
+INPUTS = [Input.values(0.7, 1, 5, 0.1),
+          Input.values(0.5, 2, 3, 0.3),
+          Input.values(0.3, 1, 4, 0.5),
+          Input.values(0.5, 1, 8, 0.2)]
+
+
+# POSITIVE
+def test_simulate_headless_full():
+    # given
+    inp = Input.values(0.5, 1, 8, 0.2)
+
+    # when
+    (collisions, stops, duration), model = run(inp)
+
+    # then
+    times = [measurement.time.value for measurement in collisions]
+    assert times[0] == 0
+    assert times == sorted(times)
+    assert duration.value == times[-1]
+    # start, the model's collisions and the end
+    assert len(collisions) == len(model) + 2
+    assert len(stops) >= len(model)
+
+
+def test_simulate_headless_not_full():
+    # given
+    inp = Input.values(0.3, 1, 2, 0.5)
+
+    # when
+    (collisions, stops, duration), model = run(inp)
+
+    # then
+    assert len(stops) == 1
+    assert 0 < stops[0].time.value < duration.value < CONFIG.timeout
+
+
+@pytest.mark.parametrize("inp", INPUTS)
+def test_simulate_interpolation_beats_higher_fps(inp, monkeypatch):
+    # when
+    interpolated, _ = turning_error(inp, monkeypatch, fps=30, interpolation=True)
+    fixed, _ = turning_error(inp, monkeypatch, fps=60, interpolation=False)
+
+    # then
+    assert interpolated <= fixed
+
+
+@pytest.mark.parametrize("inp", INPUTS)
+def test_simulate_adaptive_beats_fixed_steps(inp, monkeypatch):
+    # when
+    fixed, fixed_steps = turning_error(inp, monkeypatch, fps=60, interpolation=False, tolerance=None)
+    adaptive, adaptive_steps = turning_error(inp, monkeypatch, fps=60, interpolation=False, tolerance=0.01)
+
+    # then
+    assert adaptive_steps < fixed_steps
+    assert adaptive <= fixed
+
+
+@pytest.mark.parametrize("inp", INPUTS)
+def test_simulate_substeps(inp, monkeypatch):
+    # when
+    single, single_steps = turning_error(inp, monkeypatch, fps=60, interpolation=False, substeps=1)
+    split, split_steps = turning_error(inp, monkeypatch, fps=60, interpolation=False, substeps=4)
+
+    # then
+    assert split_steps > 2 * single_steps
+    assert split <= single
+
+
+# NEGATIVE
+def test_simulate_headless_timeout(monkeypatch):
+    # given
+    monkeypatch.setattr(CONFIG, "timeout", 2)
+    inp = Input.values(0.5, 1, 8, 0.2)
+
+    # when
+    (collisions, stops, duration), model = run(inp)
+
+    # then
+    assert 2 < duration.value <= 2 + 2 / CONFIG.fps
+    assert len(collisions) < len(model) + 2
@@ -0,0 +1,75 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import pickle
+
+from application.input.model.input import Input
+from application.result.result_table import calculate_model_table
+from application.simulation.simulation import init_lanes, simulate_lanes
+from application.simulation.space_pool import SpacePool
+
+
+def run(space, blocks, values: tuple) -> list[float]:
+    model = calculate_model_table(Input.values(*values))
+    collisions, stops, duration = simulate_lanes(space, blocks, [Input.simulation(Input.values(*values))],
+                                                 [len(model)], [bool(model.is_full[0])])[0]
+    return [m.time.value for m in collisions + stops]
+
+
+# POSITIVE
+def test_pool_reuses_space_of_same_tilt():
+    # given
+    pool = SpacePool()
+    first = (0.5, 1, 8, 0.2)
+    second = (0.5, 2, 4, 0.3)
+
+    # when
+    space, blocks = pool.acquire([Input.simulation(Input.values(*first))])
+    run(space, blocks, first)
+    reused, reused_blocks = pool.acquire([Input.simulation(Input.values(*second))])
+    reused_times = run(reused, reused_blocks, second)
+    fresh_times = run(*init_lanes([Input.simulation(Input.values(*second))]), second)
+
+    # then
+    assert reused is space
+    assert pool.hits == 1 and pool.misses == 1
+    assert reused_blocks[0].mass == Input.simulation(Input.values(*second)).mass.value
+    assert reused_times == fresh_times
+
+
+def test_pool_drops_least_recently_used():
+    # given
+    pool = SpacePool(2)
+
+    # when
+    for tilt in (0.3, 0.4, 0.3, 0.5):
+        pool.acquire([Input.simulation(Input.values(tilt, 1, 2, 0.5))])
+
+    # then
+    assert pool.misses == 3
+    assert [key[0] for key in pool.spaces] == [(0.3,), (0.5,)]
+
+
+def test_pool_is_not_pickled():
+    # given
+    pool = SpacePool()
+    pool.acquire([Input.simulation(Input.values(0.3, 1, 2, 0.5))])
+
+    # when
+    copy = pickle.loads(pickle.dumps(pool))
+
+    # then
+    assert copy.spaces == {}
+    assert copy.capacity == pool.capacity
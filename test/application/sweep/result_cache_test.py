@@ -0,0 +1,180 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from application.input.model.input import Input
+from application.result.result_table import COLUMNS
+from application.simulation.adapter.analytic_simulation_adapter import AnalyticSimulationAdapter
+from application.sweep import result_cache
+from application.sweep.model.scenario import Scenario
+from application.sweep.result_cache import ResultCache
+from application.sweep.sweep import run_sweep, run_scenario
+from infrastructure.config.config import CONFIG
+
+
+class CountingSimulationAdapter(AnalyticSimulationAdapter):
+    def __init__(self):
+        super().__init__()
+        self.simulated = 0
+
+    def simulate_batch(self, inputs, amounts, is_full):
+        self.simulated += len(inputs)
+        return super().simulate_batch(inputs, amounts, is_full)
+
+
+def scenarios() -> list[Scenario]:
+    return [Scenario(1, Input.values(0.7, 1, 5, 0.1)),
+            Scenario(2, Input.values(0.5, 1, 8, 0.2)),
+            Scenario(3, Input.values(0.3, 1, 2, 0.5))]
+
+
+# POSITIVE
+def test_cache_round_trip(tmp_path: Path):
+    # given
+    cache = ResultCache(tmp_path, 1 << 20)
+    result = run_scenario(scenarios()[0], AnalyticSimulationAdapter())
+    cache.put(result)
+
+    # when
+    cached = cache.get(Scenario(7, scenarios()[0].input))
+
+    # then
+    assert cached.scenario.id == 7
+    assert np.array_equal(cached.model.number, result.model.number)
+    assert np.array_equal(cached.measured.is_full, result.measured.is_full)
+    for key in COLUMNS:
+        assert np.array_equal(cached.measured.columns[key], result.measured.columns[key], equal_nan=True)
+        assert np.array_equal(cached.error.rel[key], result.error.rel[key], equal_nan=True)
+
+
+def test_sweep_reuses_cached_results(tmp_path: Path):
+    # given
+    simulation = CountingSimulationAdapter()
+    list(run_sweep(scenarios()[:2], simulation, 1, ResultCache(tmp_path, 1 << 20)))
+
+    # when
+    results = list(run_sweep(scenarios(), simulation, 1, ResultCache(tmp_path, 1 << 20)))
+
+    # then
+    assert simulation.simulated == 3
+    assert [result.scenario.id for result in results] == [1, 2, 3]
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    # given
+    cache = ResultCache(tmp_path, 1 << 20)
+    for i, scenario in enumerate(scenarios()):
+        cache.put(run_scenario(scenario, AnalyticSimulationAdapter()))
+        os.utime(tmp_path / (cache.key(scenario.input) + ".npz"), (i, i))
+    cache.get(scenarios()[0])
+    cache.max_size = sum(entry.stat().st_size for entry in cache.entries()) - 1
+
+    # when
+    cache.evict()
+
+    # then
+    assert cache.get(scenarios()[0]) is not None
+    assert cache.get(scenarios()[1]) is None
+    assert cache.get(scenarios()[2]) is not None
+
+
+# NEGATIVE
+def test_cache_misses_other_config(tmp_path: Path, monkeypatch):
+    # given
+    cache = ResultCache(tmp_path, 1 << 20)
+    cache.put(run_scenario(scenarios()[0], AnalyticSimulationAdapter()))
+
+    # when
+    monkeypatch.setattr(CONFIG, "fps", CONFIG.fps + 1)
+
+    # then
+    assert cache.get(scenarios()[0]) is None
+
+
+def test_cache_invalidated_by_engine_version(tmp_path: Path, monkeypatch):
+    # given
+    ResultCache(tmp_path, 1 << 20).put(run_scenario(scenarios()[0], AnalyticSimulationAdapter()))
+
+    # when
+    monkeypatch.setattr(result_cache, "ENGINE_VERSION", result_cache.ENGINE_VERSION + 1)
+    cache = ResultCache(tmp_path, 1 << 20)
+
+    # then
+    assert cache.entries() == []
+    assert cache.get(scenarios()[0]) is None
+
+
+def test_cache_removes_stale_temporary_files(tmp_path: Path):
+    # given
+    cache = ResultCache(tmp_path, 1 << 20)
+    stale = tmp_path / "stale.tmp"
+    fresh = tmp_path / "fresh.tmp"
+    stale.write_bytes(b"crashed")
+    fresh.write_bytes(b"writing")
+    os.utime(stale, (0, 0))
+
+    # when
+    cache.evict()
+
+    # then
+    assert cache.temporaries() == [fresh]
+
+
+def test_cache_clear_removes_temporary_files(tmp_path: Path, monkeypatch):
+    # given
+    ResultCache(tmp_path, 1 << 20)
+    (tmp_path / "orphan.tmp").write_bytes(b"crashed")
+
+    # when
+    monkeypatch.setattr(result_cache, "ENGINE_VERSION", result_cache.ENGINE_VERSION + 1)
+    cache = ResultCache(tmp_path, 1 << 20)
+
+    # then
+    assert cache.temporaries() == []
+
+
+def test_cache_put_removes_temporary_file_on_failure(tmp_path: Path, monkeypatch):
+    # given
+    cache = ResultCache(tmp_path, 1 << 20)
+    result = run_scenario(scenarios()[0], AnalyticSimulationAdapter())
+
+    def savez(file, **arrays):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(np, "savez", savez)
+
+    # when, then
+    with pytest.raises(KeyboardInterrupt):
+        cache.put(result)
+    assert cache.temporaries() == []
+    assert cache.entries() == []
+
+
+def test_cache_removes_broken_entry(tmp_path: Path):
+    # given
+    cache = ResultCache(tmp_path, 1 << 20)
+    (tmp_path / (cache.key(scenarios()[0].input) + ".npz")).write_bytes(b"broken")
+
+    # when
+    result = cache.get(scenarios()[0])
+
+    # then
+    assert result is None
+    assert cache.entries() == []
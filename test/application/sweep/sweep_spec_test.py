@@ -0,0 +1,81 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from math import pi
+
+import pytest
+
+from application.math.scalar import Scalar
+from application.sweep.exceptions import SweepSpecError
+from application.sweep.sweep_spec import load_sweep_spec
+from infrastructure.config.config import CONFIG
+
+
+@pytest.fixture
+def spec_path(tmp_path):
+    def write(content: str):
+        path = tmp_path / "sweep.yaml"
+        path.write_text(content)
+        return path
+
+    return write
+
+
+# POSITIVE
+def test_expanding_spec(spec_path):
+    # given
+    path = spec_path("tilt: [0.25p, 0.3]\n"
+                     "friction: {start: 0.1, stop: 0.3, num: 3}\n"
+                     "mass: 2\n"
+                     "velocity: {start: 1, stop: 100, num: 3, scale: log}\n")
+
+    # when
+    scenarios = load_sweep_spec(path)
+
+    # then
+    assert len(scenarios) == 2 * 3 * 1 * 3
+    assert [s.id for s in scenarios] == list(range(1, 19))
+    assert scenarios[0].input.tilt == Scalar(0.25 * pi, CONFIG.unit.tilt)
+    assert scenarios[-1].input.tilt == Scalar(0.3, CONFIG.unit.tilt)
+    assert [s.input.friction for s in scenarios[:9:3]] == [Scalar(0.1), Scalar(0.2), Scalar(0.3)]
+    assert [s.input.velocity.value for s in scenarios[:3]] == [Scalar(1, CONFIG.unit.velocity),
+                                                               Scalar(10, CONFIG.unit.velocity),
+                                                               Scalar(100, CONFIG.unit.velocity)]
+    assert all(s.input.mass == Scalar(2, CONFIG.unit.mass) for s in scenarios)
+
+
+# NEGATIVE
+def test_missing_field(spec_path):
+    # given
+    path = spec_path("tilt: 0.3\nfriction: 0.1\nmass: 1\n")
+
+    # when
+    with pytest.raises(SweepSpecError) as e:
+        load_sweep_spec(path)
+
+    # then
+    assert e.value.field == "velocity"
+
+
+def test_log_range_needs_positive_ends(spec_path):
+    # given
+    path = spec_path("tilt: 0.3\nfriction: {start: 0, stop: 1, num: 2, scale: log}\nmass: 1\nvelocity: 1\n")
+
+    # when
+    with pytest.raises(SweepSpecError) as e:
+        load_sweep_spec(path)
+
+    # then
+    assert e.value.field == "friction"
@@ -0,0 +1,61 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from application.input.model.input import Input
+from application.simulation.adapter.analytic_simulation_adapter import AnalyticSimulationAdapter
+from application.simulation.adapter.pymunk_simulation_adapter import PymunkSimulationAdapter
+from application.sweep.model.scenario import Scenario
+from application.sweep.sweep import run_sweep, run_chunk, get_workers
+
+
+def scenarios() -> list[Scenario]:
+    return [Scenario(1, Input.values(0.7, 1, 5, 0.1)),
+            Scenario(2, Input.values(0.5, 1, 8, 0.2)),
+            Scenario(3, Input.values(0.3, 1, 2, 0.5)),
+            Scenario(4, Input.values(1.0, 1, 6, 0.3))]
+
+
+# POSITIVE
+def test_sweep_sequential():
+    # when
+    results = list(run_sweep(scenarios(), AnalyticSimulationAdapter()))
+
+    # then
+    assert [result.scenario.id for result in results] == [1, 2, 3, 4]
+    assert all(len(result.measured) == len(result.model) for result in results)
+
+
+def test_sweep_process_pool():
+    # when
+    results = list(run_sweep(scenarios(), PymunkSimulationAdapter(), 2))
+
+    # then
+    assert sorted(result.scenario.id for result in results) == [1, 2, 3, 4]
+    assert all(len(result.measured) > 0 for result in results)
+
+
+def test_run_chunk_keeps_order():
+    # when
+    results = run_chunk(scenarios()[::-1], AnalyticSimulationAdapter())
+
+    # then
+    assert [result.scenario.id for result in results] == [4, 3, 2, 1]
+
+
+def test_get_workers():
+    # then
+    assert get_workers(3) == 3
+    assert get_workers(None) >= 1
+    assert get_workers(0) == get_workers(None)
@@ -0,0 +1,68 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+"""Benchmark of writing a large sweep output to a CSV file.
+
+Run from the test directory: PYTHONPATH=../src python benchmark/csv_benchmark.py
+"""
+import logging
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from infrastructure.config.config import CONFIG
+
+CONFIG.update(Path("test-config.yaml"))
+logging.disable(logging.CRITICAL)
+
+from application.input.model.input import Input
+from application.output.adapter.csv.csv_output_adapter import CsvOutputAdapter, SCHEMA
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table
+from application.sweep.model.scenario import Scenario, ScenarioResult
+
+ROWS = 1_000_000
+INPUT = Input.values(0.7, 1, 5, 0.001)
+MODEL = calculate_model_table(INPUT)
+ERRORS = prepare_errors(MODEL, MODEL)
+
+
+def results(scenarios: int):
+    for i in range(scenarios):
+        yield ScenarioResult(Scenario(i + 1, INPUT), MODEL, MODEL, ERRORS)
+
+
+def main():
+    scenarios = ROWS // len(MODEL)
+    rows = scenarios * len(MODEL)
+    print(f"scenarios n={scenarios} rows n={rows} columns n={5 + len(SCHEMA.header)}")
+
+    start = perf_counter()
+    for result in results(scenarios):
+        for _ in SCHEMA.rows(result.measured, result.model, result.error, [result.scenario.id, 0, 0, 0, 0]):
+            pass
+    built = perf_counter() - start
+    print(f"building rows: {built:.2f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = perf_counter()
+        CsvOutputAdapter(Path(directory) / "output.csv").send_sweep_output(results(scenarios))
+        written = perf_counter() - start
+    print(f"writing the file: {written:.2f} s ({rows / written:,.0f} rows/s, "
+          f"{(written - built) / written:.0%} spent formatting and writing)")
+
+
+if __name__ == "__main__":
+    main()
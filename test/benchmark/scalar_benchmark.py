@@ -0,0 +1,78 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+"""Micro-benchmark of Scalar arithmetic and the result pipelines built on it.
+
+Run from the test directory: PYTHONPATH=../src python benchmark/scalar_benchmark.py
+"""
+import logging
+from pathlib import Path
+from timeit import repeat
+
+from pymunk import Vec2d
+
+from infrastructure.config.config import CONFIG
+
+CONFIG.update(Path("test-config.yaml"))
+logging.disable(logging.CRITICAL)
+
+from application.input.model.input import Input
+from application.math.scalar import Scalar
+from application.output.adapter.csv.csv_output_adapter import get_rows
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table, prepare_simulation_table
+from application.simulation.model.measurement import Measurement
+
+REPEAT = 5
+INPUT = Input.values(0.7, 1, 5, 0.01)
+
+
+def scalar_arithmetic():
+    a = Scalar(1.5, "m")
+    b = Scalar(0.25, "m")
+    for _ in range(10000):
+        a = (a + b - 0.25) * 1.0001 / b * 0.25
+        a < b
+
+
+def events(n: int) -> tuple[list[Measurement], list[Measurement]]:
+    collisions = [Measurement(0, Vec2d(100, 50), Vec2d(30, 20))]
+    stops = []
+    for i in range(n):
+        stops.append(Measurement(i + 0.5, Vec2d(140, 80), Vec2d(0.1, 0.1)))
+        collisions.append(Measurement(i + 1, Vec2d(100, 50), Vec2d(-25, -16)))
+    collisions.append(collisions[-1])
+    return collisions, stops
+
+
+MODEL = calculate_model_table(INPUT)
+COLLISIONS, STOPS = events(len(MODEL))
+MEASURED = prepare_simulation_table(STOPS, COLLISIONS, True)
+ERRORS = prepare_errors(MEASURED, MODEL)
+
+
+def main():
+    print(f"cycles n={len(MODEL)}")
+    for name, function in (("scalar arithmetic (10k ops)", scalar_arithmetic),
+                           ("calculate_model_table", lambda: calculate_model_table(INPUT)),
+                           ("prepare_simulation_table", lambda: prepare_simulation_table(STOPS, COLLISIONS, True)),
+                           ("prepare_errors", lambda: prepare_errors(MEASURED, MODEL)),
+                           ("CSV rows (rounding)", lambda: list(get_rows(MEASURED, MODEL, ERRORS)))):
+        best = min(repeat(function, number=10, repeat=REPEAT)) / 10
+        print(f"{name}: {best * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
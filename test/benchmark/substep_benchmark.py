@@ -0,0 +1,56 @@
+"""Benchmark of physics sub-stepping: the accuracy against the model versus the CPU cost.
+
+Run from the test directory: PYTHONPATH=../src python benchmark/substep_benchmark.py
+"""
+import logging
+from pathlib import Path
+from time import perf_counter
+
+import numpy as np
+
+from infrastructure.config.config import CONFIG
+
+CONFIG.update(Path("test-config.yaml"))
+logging.disable(logging.CRITICAL)
+
+from application.input.model.input import Input
+from application.result.error import prepare_errors
+from application.result.result_table import calculate_model_table, prepare_simulation_table, DURATION1, DURATION2
+from application.simulation.adapter.pymunk_simulation_adapter import PymunkSimulationAdapter
+
+SUBSTEPS = (1, 2, 4, 8, 16)
+INPUTS = [Input.values(0.7, 1, 5, 0.1),
+          Input.values(0.5, 2, 3, 0.3),
+          Input.values(0.3, 1, 4, 0.5),
+          Input.values(1.0, 1, 10, 0.05),
+          Input.values(0.5, 1, 8, 0.2)]
+
+
+def run(interpolation: bool, substeps: int) -> tuple[float, float, float]:
+    CONFIG.interpolation = interpolation
+    CONFIG.substeps = substeps
+    simulation = PymunkSimulationAdapter()
+    errors = {DURATION1: [], DURATION2: []}
+    start = perf_counter()
+    for inp in INPUTS:
+        model = calculate_model_table(inp)
+        is_full = bool(model.is_full[0])
+        collisions, stops, _ = simulation.simulate(Input.simulation(inp), len(model), is_full)
+        error = prepare_errors(prepare_simulation_table(stops, collisions, is_full), model)
+        for key in errors:
+            errors[key].append(error.rel[key][0])
+    cost = (perf_counter() - start) / len(INPUTS)
+    return cost, float(np.nanmean(errors[DURATION1])), float(np.nanmean(errors[DURATION2]))
+
+
+def main():
+    print(f"fps={CONFIG.fps} scenarios n={len(INPUTS)}; first cycle's mean relative errors")
+    for interpolation in (False, True):
+        for substeps in SUBSTEPS:
+            cost, duration1, duration2 = run(interpolation, substeps)
+            print(f"interpolation={interpolation} substeps={substeps}: {cost * 1000:.1f} ms/scenario "
+                  f"duration1={duration1:.4f} duration2={duration2:.4f}")
+
+
+if __name__ == "__main__":
+    main()
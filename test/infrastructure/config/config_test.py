@@ -0,0 +1,96 @@
+"""
+Copyright 2025 Jan Oleński
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+or implied. See the License for the specific language governing
+permissions and limitations under the License.
+"""
+from pathlib import Path
+
+import yaml
+
+from infrastructure.config.config import Config
+from infrastructure.config.config_name import ConfigName
+
+
+def old_config_file(path: Path) -> Path:
+    Config.default().generate_file(path)
+    with open(path) as conf:
+        struct = yaml.safe_load(conf)
+    for name in (ConfigName.headless, ConfigName.timeout, ConfigName.interpolation, ConfigName.tolerance,
+                 ConfigName.port, ConfigName.render_fps, ConfigName.substeps):
+        del struct[ConfigName.sim.value][name.value]
+    del struct[ConfigName.output.value][ConfigName.compress.value]
+    del struct[ConfigName.output.value][ConfigName.queue_size.value]
+    del struct[ConfigName.sweep.value]
+    del struct[ConfigName.cache.value]
+    with open(path, "w") as conf:
+        yaml.dump(struct, conf)
+    return path
+
+
+# POSITIVE
+def test_config_update_round_trip(tmp_path: Path):
+    # given
+    config = Config.default()
+    config.headless = True
+    config.timeout = 30
+    config.generate_file(tmp_path / "config.yaml")
+
+    # when
+    loaded = Config.default()
+    loaded.update(tmp_path / "config.yaml")
+
+    # then
+    assert loaded.headless
+    assert loaded.timeout == 30
+
+
+def test_config_fingerprint():
+    # given
+    config = Config.default()
+    fingerprint = config.fingerprint()
+
+    # when
+    config.headless = not config.headless
+    unchanged = config.fingerprint()
+    config.fps += 1
+    changed = config.fingerprint()
+
+    # then
+    assert unchanged == fingerprint
+    assert changed != fingerprint
+
+
+def test_config_update_missing_keys_take_defaults(tmp_path: Path):
+    # given
+    path = old_config_file(tmp_path / "config.yaml")
+    default = Config.default()
+
+    # when
+    config = Config.default()
+    config.headless = True
+    config.update(path)
+
+    # then
+    assert config.headless == default.headless
+    assert config.timeout == default.timeout
+    assert config.interpolation == default.interpolation
+    assert config.tolerance == default.tolerance
+    assert config.simulation_port == default.simulation_port
+    assert config.render_fps == default.render_fps
+    assert config.substeps == default.substeps
+    assert config.output_compress == default.output_compress
+    assert config.output_queue_size == default.output_queue_size
+    assert config.sweep.path is None
+    assert config.sweep.workers == default.sweep.workers
+    assert config.cache.path is None
+    assert config.cache.max_size == default.cache.max_size